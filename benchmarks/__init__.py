@@ -0,0 +1,6 @@
+"""
+Benchmarks for the HyperImage site generator.
+
+Run a benchmark as a module from the repository root, e.g.:
+    python -m benchmarks.crosslink_scaling
+"""
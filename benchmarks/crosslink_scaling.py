@@ -0,0 +1,100 @@
+"""
+Benchmark: cross-linking cost as the technique catalog grows.
+
+Builds synthetic catalogs of increasing size and times the single-scan
+CrossLinker against the previous approach of one compiled regex per technique.
+With a fixed amount of text per page, the per-page cost of CrossLinker should
+stay roughly flat, so a full build grows near-linearly with catalog size.
+
+Usage:
+    python -m benchmarks.crosslink_scaling [--sizes 250 500 1000 2000]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from framework import CrossLinker  # noqa: E402
+
+WORDS = [
+    "raman", "infrared", "x-ray", "fluorescence", "spectroscopy", "microscopy", "imaging",
+    "tomography", "photoacoustic", "terahertz", "holography", "diffraction", "electron",
+    "scanning", "hyperspectral", "reflectance", "ultraviolet", "macro", "micro", "confocal",
+    "coherence", "interferometry", "laser", "ablation", "mass", "chromatography", "neutron",
+]
+
+
+def make_catalog(size: int, seed: int = 0) -> Dict[str, str]:
+    """Create `size` unique technique names mapped to page URLs."""
+    rng = random.Random(seed)
+    names: Dict[str, str] = {}
+    while len(names) < size:
+        name = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 4))).title()
+        names[name] = f"{name.lower().replace(' ', '_')}.html"
+    return names
+
+
+def make_paragraphs(names: List[str], count: int, seed: int = 1) -> List[str]:
+    """Create paragraphs of filler text with occasional technique mentions."""
+    rng = random.Random(seed)
+    paragraphs = []
+    for _ in range(count):
+        words = [rng.choice(WORDS) for _ in range(120)]
+        for _ in range(3):
+            words.insert(rng.randrange(len(words)), rng.choice(names))
+        paragraphs.append("<p>" + " ".join(words) + "</p>")
+    return paragraphs
+
+
+def link_per_technique(text: str, technique_urls: Dict[str, str], current: str) -> str:
+    """The previous approach: one compiled pattern and one pass per technique."""
+    for tech_name, tech_url in technique_urls.items():
+        if tech_name != current:
+            pattern = re.compile(r'\b' + re.escape(tech_name) + r'\b', re.IGNORECASE)
+            text = pattern.sub(lambda m: f'<a href="{tech_url}" class="technique-link">{m.group(0)}</a>', text)
+    return text
+
+
+def run(sizes: List[int], pages: int, paragraphs_per_page: int, include_old: bool) -> None:
+    print(f"{'techniques':>10} {'build (s)':>10} {'link/page (ms)':>15} {'old/page (ms)':>14}")
+    for size in sizes:
+        catalog = make_catalog(size)
+        names = list(catalog)
+        text = "\n".join(make_paragraphs(names, paragraphs_per_page))
+
+        start = time.perf_counter()
+        linker = CrossLinker(catalog)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for page in range(pages):
+            linker.link(text, names[page % size])
+        link_ms = (time.perf_counter() - start) / pages * 1000
+
+        old_ms = float("nan")
+        if include_old:
+            start = time.perf_counter()
+            link_per_technique(text, catalog, names[0])
+            old_ms = (time.perf_counter() - start) * 1000
+
+        print(f"{size:>10} {build_time:>10.3f} {link_ms:>15.2f} {old_ms:>14.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 500, 1000, 2000, 4000])
+    parser.add_argument("--pages", type=int, default=20, help="pages linked per catalog size")
+    parser.add_argument("--paragraphs", type=int, default=30, help="paragraphs per page")
+    parser.add_argument("--skip-old", action="store_true", help="do not time the per-technique approach")
+    args = parser.parse_args()
+    run(args.sizes, args.pages, args.paragraphs, not args.skip_old)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark: cold `import techniques` time and memory against catalog size.
+
+For each catalog size (see benchmarks.synthetic), writes a techniques package
+with one data module per technique twice: with the lazy registry
+convert_json_to_python generates (an index of technique name -> module) and
+with the eager layout it used to generate (every module imported by
+__init__.py). Each package is imported in a fresh interpreter that writes no
+bytecode, so every import compiles its modules as a first import after an
+edit would; --cached compiles them first. Reports the import time, the
+memory allocated by the import (tracemalloc peak) and, for the lazy package,
+the time of the first lookup of one technique.
+
+Usage:
+    python -m benchmarks.import_time [--sizes 25 250 1000] [--cached]
+"""
+
+import argparse
+import compileall
+import json
+import pprint
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.synthetic import make_catalog  # noqa: E402
+from convert_json_to_python import init_file_content  # noqa: E402
+
+# Runs in the child interpreter: argv[1] is the directory holding the package, argv[2] a technique name
+PROBE = """
+import json, sys, time, tracemalloc
+sys.path.insert(0, sys.argv[1])
+tracemalloc.start()
+start = time.perf_counter()
+import techniques
+seconds = time.perf_counter() - start
+peak = tracemalloc.get_traced_memory()[1]
+start = time.perf_counter()
+techniques.get_technique_data(sys.argv[2])
+lookup = time.perf_counter() - start
+print(json.dumps({"import_s": seconds, "peak_kib": peak / 1024, "lookup_s": lookup}))
+"""
+
+
+def eager_init_content(converted: List[Tuple[str, str]]) -> str:
+    """Return the eager __init__.py convert_json_to_python generated before the lazy registry."""
+    imports = "\n".join(f"from .{filename} import {filename}_data" for _, filename in converted)
+    entries = "\n".join(f"    {json.dumps(name)}: {filename}_data," for name, filename in converted)
+    return f"""{imports}
+
+TECHNIQUES = {{
+{entries}
+}}
+
+def get_technique_data(technique_name: str):
+    return TECHNIQUES.get(technique_name)
+
+def list_techniques():
+    return list(TECHNIQUES.keys())
+"""
+
+
+def write_package(root: Path, catalog: Dict[str, Dict], lazy: bool) -> List[Tuple[str, str]]:
+    """Write a techniques package with one module per technique under root."""
+    package = root / "techniques"
+    package.mkdir(parents=True)
+    converted = []
+    for number, (name, data) in enumerate(catalog.items()):
+        filename = f"technique_{number:05d}"
+        (package / f"{filename}.py").write_text(f"{filename}_data = {pprint.pformat(data, width=120)}\n",
+                                               encoding="utf-8")
+        converted.append((name, filename))
+    content = init_file_content(converted) if lazy else eager_init_content(converted)
+    (package / "__init__.py").write_text(content, encoding="utf-8")
+    return converted
+
+
+def measure(root: Path, technique_name: str, cached: bool) -> Dict[str, float]:
+    """Import the package under root in a fresh interpreter; returns its PROBE results."""
+    if cached:
+        compileall.compile_dir(str(root), quiet=1)
+    command = [sys.executable] + ([] if cached else ["-B"]) + ["-c", PROBE, str(root), technique_name]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 250, 1000])
+    parser.add_argument("--cached", action="store_true", help="import from compiled bytecode")
+    args = parser.parse_args()
+
+    print(f"{'techniques':>10} {'layout':>6} {'import (ms)':>11} {'memory (KiB)':>12} {'first lookup (ms)':>17}")
+    for size in args.sizes:
+        catalog = make_catalog(size)
+        first = next(iter(catalog))
+        for lazy in (False, True):
+            with tempfile.TemporaryDirectory() as tmp:
+                write_package(Path(tmp), catalog, lazy)
+                result = measure(Path(tmp), first, args.cached)
+            lookup = f"{result['lookup_s'] * 1000:>17.2f}" if lazy else f"{'-':>17}"
+            print(f"{size:>10} {'lazy' if lazy else 'eager':>6} {result['import_s'] * 1000:>11.1f} "
+                  f"{result['peak_kib']:>12.0f} {lookup}")
+
+
+if __name__ == "__main__":
+    main()
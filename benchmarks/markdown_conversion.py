@@ -0,0 +1,137 @@
+"""
+Benchmark: markdown conversion of every technique module's text.
+
+Compares the single-pass parser in markdown_parser against the previous
+regex cascade (kept here as legacy_convert_markdown) on all string data in
+techniques/*.py, and reports how many sections render differently.
+
+Usage:
+    python -m benchmarks.markdown_conversion [--repeat 20]
+"""
+
+import argparse
+import html
+import importlib
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from markdown_parser import markdown_to_html, parse_markdown  # noqa: E402
+
+
+def legacy_convert_markdown(text: str) -> str:
+    """The regex cascade previously used by TechniqueReference.to_html, without cross-linking."""
+    if not text:
+        return ""
+    
+    text = html.escape(text)
+    text = re.sub(r'```(\w+)?\n(.*?)```',
+                  lambda m: f'<pre><code class="language-{m.group(1) or ""}">{m.group(2)}</code></pre>',
+                  text, flags=re.DOTALL)
+    text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
+    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
+    text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
+    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', text)
+    
+    html_paras = []
+    for para in text.split('\n\n'):
+        para = para.strip()
+        if not para:
+            continue
+        lines = para.split('\n')
+        first_line = lines[0].strip()
+        if first_line.startswith('- ') or first_line.startswith('* '):
+            list_html = '<ul>\n'
+            for line in lines:
+                line = line.strip()
+                if line.startswith('- ') or line.startswith('* '):
+                    item = re.sub(r'^[-*]\s+', '', line)
+                    list_html += f'  <li>{item}</li>\n'
+            html_paras.append(list_html + '</ul>')
+        elif re.match(r'^\d+\.\s', first_line):
+            list_html = '<ol>\n'
+            for line in lines:
+                line = line.strip()
+                if re.match(r'^\d+\.\s', line):
+                    item = re.sub(r'^\d+\.\s+', '', line)
+                    list_html += f'  <li>{item}</li>\n'
+            html_paras.append(list_html + '</ol>')
+        elif '\n- ' in para or '\n* ' in para:
+            for part in re.split(r'\n(?=[-*]\s)', para):
+                part = part.strip()
+                if part.startswith('- ') or part.startswith('* '):
+                    list_html = '<ul>\n'
+                    for item in re.split(r'\n(?=[-*]\s)', part):
+                        item = re.sub(r'^[-*]\s+', '', item.strip())
+                        list_html += f'  <li>{item}</li>\n'
+                    html_paras.append(list_html + '</ul>')
+                elif part:
+                    html_paras.append(f'<p>{part}</p>')
+        else:
+            html_paras.append(f'<p>{para}</p>')
+    return '\n'.join(html_paras)
+
+
+def collect_texts() -> List[str]:
+    """Return every string found in the data dictionaries of techniques/*.py."""
+    texts: List[str] = []
+    
+    def walk(value):
+        if isinstance(value, str):
+            texts.append(value)
+        elif isinstance(value, dict):
+            for item in value.values():
+                walk(item)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                walk(item)
+    
+    for path in sorted((ROOT / "techniques").glob("*.py")):
+        if path.stem == "__init__":
+            continue
+        module = importlib.import_module(f"techniques.{path.stem}")
+        for name, value in vars(module).items():
+            if name.endswith("_data") and isinstance(value, dict):
+                walk(value)
+    return texts
+
+
+def time_it(func: Callable[[str], object], texts: List[str], repeat: int) -> float:
+    """Return the best wall time of converting all texts, over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="runs per timing; the best is reported")
+    args = parser.parse_args()
+    
+    texts = collect_texts()
+    size = sum(len(text) for text in texts)
+    print(f"{len(texts)} sections, {size / 1024:.0f} KiB of text")
+    
+    legacy = time_it(legacy_convert_markdown, texts, args.repeat)
+    parsed = time_it(markdown_to_html, texts, args.repeat)
+    parse_only = time_it(parse_markdown, texts, args.repeat)
+    
+    for label, seconds in (("legacy regex cascade", legacy), ("parser -> HTML", parsed),
+                           ("parse only", parse_only)):
+        print(f"{label:>22}: {seconds * 1000:8.1f} ms  {size / seconds / 1e6:6.1f} MB/s")
+    
+    changed = sum(1 for text in texts if legacy_convert_markdown(text) != markdown_to_html(text))
+    print(f"sections rendering differently from the legacy cascade: {changed}/{len(texts)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: publishing one catalog under several base URLs.
+
+For each catalog size (see benchmarks.synthetic), times one serial
+generate_all_pages per base URL against a single generate_targets call that
+renders once and emits every target by substitution, and checks that both
+produce the same files. Precompression is off unless --precompress is given,
+since it costs the same per target either way.
+
+Usage:
+    python -m benchmarks.multi_target [--sizes 100 1000] [--targets 3] [--precompress]
+"""
+
+import argparse
+import filecmp
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.synthetic import make_catalog  # noqa: E402
+from framework import BuildTarget, SiteGenerator  # noqa: E402
+
+
+def load_site(catalog: Dict[str, Dict], output_dir: Path, precompress: bool, base_url: str = "") -> SiteGenerator:
+    """Create a SiteGenerator with every technique in catalog added."""
+    site = SiteGenerator(output_dir, base_url=base_url, precompress=precompress)
+    for name, data in catalog.items():
+        site.add_technique(name, data)
+    return site
+
+
+def same_files(first: Path, second: Path) -> bool:
+    """Return whether two sites hold the same public files with the same bytes."""
+    def public_files(root: Path) -> List[str]:
+        return sorted(path.relative_to(root).as_posix() for path in root.rglob("*")
+                      if path.is_file() and not path.name.startswith("."))
+
+    files = public_files(first)
+    if files != public_files(second):
+        return False
+    _, mismatch, errors = filecmp.cmpfiles(first, second, files, shallow=False)
+    return not mismatch and not errors
+
+
+def measure(size: int, base_urls: List[str], precompress: bool) -> Dict[str, float]:
+    """Time separate builds and one multi-target build of a catalog; returns seconds for each."""
+    catalog = make_catalog(size)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        start = time.perf_counter()
+        for number, base_url in enumerate(base_urls):
+            load_site(catalog, tmp / f"separate-{number}", precompress, base_url).generate_all_pages()
+        separate = time.perf_counter() - start
+
+        site = load_site(catalog, tmp / "render", precompress)
+        targets = [BuildTarget(tmp / f"target-{number}", base_url) for number, base_url in enumerate(base_urls)]
+        start = time.perf_counter()
+        site.generate_targets(targets)
+        multi = time.perf_counter() - start
+
+        identical = all(same_files(tmp / f"separate-{number}", tmp / f"target-{number}")
+                        for number in range(len(base_urls)))
+    return {"separate_s": separate, "multi_s": multi, "identical": identical}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--targets", type=int, default=3, help="number of base URLs")
+    parser.add_argument("--precompress", action="store_true", help="write .gz/.br siblings for every target")
+    args = parser.parse_args()
+
+    base_urls = [f"/mirror-{number}/" for number in range(args.targets)]
+    print(f"{'techniques':>10} {'separate (s)':>12} {'multi (s)':>9} {'speedup':>7} {'identical':>9}")
+    for size in args.sizes:
+        result = measure(size, base_urls, args.precompress)
+        print(f"{size:>10} {result['separate_s']:>12.2f} {result['multi_s']:>9.2f} "
+              f"{result['separate_s'] / result['multi_s']:>7.1f} {str(result['identical']):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark: memory held per technique by a loaded site.
+
+Builds synthetic catalogs (see benchmarks.synthetic), passes each technique's
+data through JSON as loading it from a file would, adds it to a SiteGenerator
+and drops the source data, then measures with tracemalloc what
+SiteGenerator.techniques keeps alive. Memory is split into text (the string
+payload, which any representation has to keep) and overhead (instances,
+containers and duplicate strings), each per technique. With --documents the
+parsed document trees that rendering caches on each reference are built and
+measured too. With --lazy each technique is written to a JSON file and added
+by path with its summary and keywords, so the site holds only those.
+
+Usage:
+    python -m benchmarks.reference_memory [--sizes 1000 10000] [--documents | --lazy]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.synthetic import make_catalog  # noqa: E402
+from framework import SiteGenerator  # noqa: E402
+
+
+def text_bytes(site: SiteGenerator) -> int:
+    """Return the size of the distinct strings held in the references' fields."""
+    seen: Dict[int, int] = {}
+
+    def walk(value):
+        if isinstance(value, str):
+            seen[id(value)] = sys.getsizeof(value)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                walk(key)
+                walk(item)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                walk(item)
+
+    for ref in site.techniques.values():
+        for name in getattr(ref, "__dataclass_fields__", ("technique_name", "one_line_summary", "keywords")):
+            walk(getattr(ref, name))
+    return sum(seen.values())
+
+
+def measure(size: int, documents: bool, lazy_dir: Optional[Path] = None) -> Dict[str, float]:
+    """
+    Load a catalog of `size` techniques and return the bytes held per technique.
+
+    With lazy_dir, techniques are written there as JSON files and added by path.
+    """
+    encoded = {name: json.dumps(data) for name, data in make_catalog(size).items()}
+    paths = {}
+    if lazy_dir is not None:
+        for number, name in enumerate(list(encoded)):
+            paths[name] = lazy_dir / f"{number}.json"
+            paths[name].write_text(encoded.pop(name), encoding="utf-8")
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    site = SiteGenerator(Path("unused"))
+    for name, path in paths.items():
+        data = json.loads(path.read_text(encoding="utf-8"))
+        site.add_technique(name, path, data["one_line_summary"], data["keywords"])
+    for name in list(encoded):
+        site.add_technique(name, json.loads(encoded.pop(name)))
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    result = {"total": held / size, "text": text_bytes(site) / size}
+    result["overhead"] = result["total"] - result["text"]
+    if documents:
+        for ref in site.techniques.values():
+            ref.document()
+        gc.collect()
+        result["documents"] = (tracemalloc.get_traced_memory()[0] - before - held) / size
+    tracemalloc.stop()
+    return result
+
+
+def run(sizes: List[int], documents: bool, lazy: bool):
+    header = f"{'techniques':>10}  {'total B':>9}  {'text B':>9}  {'overhead B':>10}"
+    print(header + (f"  {'document B':>10}" if documents else ""))
+    for size in sizes:
+        if lazy:
+            with tempfile.TemporaryDirectory() as tmp:
+                result = measure(size, documents, Path(tmp))
+        else:
+            result = measure(size, documents)
+        line = f"{size:>10}  {result['total']:>9.0f}  {result['text']:>9.0f}  {result['overhead']:>10.0f}"
+        print(line + (f"  {result['documents']:>10.0f}" if documents else ""))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--documents", action="store_true", help="also measure the parsed document trees")
+    group.add_argument("--lazy", action="store_true", help="add techniques as JSON files loaded on demand")
+    args = parser.parse_args()
+    run(args.sizes, args.documents, args.lazy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Benchmark: site build throughput on synthetic catalogs.
+
+For each catalog size (see benchmarks.synthetic), times to_markdown and
+to_html over every technique, generate_index, and a full serial
+generate_all_pages into a temporary directory, and reports pages per second,
+HTML throughput and peak RSS. Each size runs in a fresh interpreter, so peak
+RSS is per size and caches never carry over between sizes.
+
+Results can be saved as JSON and checked against a previous run: the
+benchmark exits with status 1 when any timing or peak RSS is worse than the
+baseline by more than --threshold.
+
+Usage:
+    python -m benchmarks.site_build [--sizes 100 1000 5000] [--save results.json]
+    python -m benchmarks.site_build --baseline results.json [--threshold 0.25]
+"""
+
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.synthetic import make_catalog  # noqa: E402
+from framework import CrossLinker, RenderCache, SiteGenerator  # noqa: E402
+
+# Metrics where a larger value is a regression
+CHECKED_METRICS = ("to_markdown_s", "to_html_s", "generate_index_s", "generate_all_pages_s", "peak_rss_mb")
+# Timing differences below this are scheduler noise, whatever the ratio
+MIN_SECONDS_DELTA = 0.01
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Return this process's peak resident set size in MiB, or None where it cannot be read."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def load_site(catalog: Dict[str, Dict], output_dir: Path) -> SiteGenerator:
+    """Create a SiteGenerator with every technique in catalog added."""
+    site = SiteGenerator(output_dir)
+    for name, data in catalog.items():
+        site.add_technique(name, data)
+    return site
+
+
+def render_markdown(site: SiteGenerator) -> List[str]:
+    """Render every technique of site as markdown."""
+    return [ref.to_markdown() for ref in site.techniques.values()]
+
+
+def render_html(site: SiteGenerator, linker: CrossLinker, cache: RenderCache) -> List[str]:
+    """Render every technique page of site as HTML with one linker and render cache."""
+    return [ref.to_html(site.technique_urls, site.base_url, linker, cache) for ref in site.techniques.values()]
+
+
+def measure(size: int, repeat: int) -> Dict[str, float]:
+    """Run every timing for one catalog size in this process; timings are the best of repeat runs."""
+    catalog = make_catalog(size)
+    timings: Dict[str, List[float]] = {}
+    html_bytes = 0
+
+    def timed(metric: str, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.setdefault(metric, []).append(time.perf_counter() - start)
+        return result
+
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as tmp:
+            # Fresh generators each run, so parsed documents and render caches start cold
+            site = timed("load_s", load_site, catalog, Path(tmp) / "parts")
+            timed("to_markdown_s", render_markdown, site)
+            linker = CrossLinker(site.technique_urls, site.base_url, track_links=True)
+            pages = timed("to_html_s", render_html, site, linker, RenderCache())
+            html_bytes = sum(len(page.encode("utf-8")) for page in pages)
+            del pages
+            (site.output_dir / "assets").mkdir(parents=True)
+            timed("generate_index_s", site.generate_index)
+            del site, linker
+            gc.collect()
+
+            site = load_site(catalog, Path(tmp) / "site")
+            timed("generate_all_pages_s", site.generate_all_pages)
+            del site
+            gc.collect()
+
+    result = {metric: min(values) for metric, values in timings.items()}
+    result["pages_per_s"] = size / result["generate_all_pages_s"]
+    result["html_mb_per_s"] = html_bytes / result["to_html_s"] / 1e6
+    result["html_mb"] = html_bytes / 1e6
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def measure_isolated(size: int, repeat: int) -> Dict[str, float]:
+    """Run measure() for one size in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.site_build", "--measure", str(size), "--repeat", str(repeat)],
+        cwd=ROOT, check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return json.loads(output)
+
+
+def find_regressions(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+                     threshold: float) -> List[str]:
+    """Describe every checked metric that is worse than baseline by more than threshold (a fraction)."""
+    regressions = []
+    for size, metrics in results.items():
+        previous = baseline.get(size)
+        if previous is None:
+            continue
+        for metric in CHECKED_METRICS:
+            old, new = previous.get(metric), metrics.get(metric)
+            if not old or new is None or new <= old * (1 + threshold):
+                continue
+            if metric.endswith("_s") and new - old < MIN_SECONDS_DELTA:
+                continue
+            regressions.append(f"size {size}: {metric} {old:.3f} -> {new:.3f} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def git_commit() -> str:
+    """Return the current commit hash, or "" outside a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, universal_newlines=True).stdout.strip()
+    except OSError:
+        return ""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000],
+                        help="catalog sizes to benchmark (up to 50000)")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per size; the best timing is reported")
+    parser.add_argument("--save", type=Path, help="write results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="JSON results of an earlier run to check against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown or RSS growth over the baseline, as a fraction")
+    parser.add_argument("--measure", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure is not None:
+        # Worker mode used by measure_isolated
+        print(json.dumps(measure(args.measure, args.repeat)))
+        return
+
+    print(f"{'techniques':>10} {'markdown (s)':>12} {'html (s)':>9} {'index (s)':>9} {'build (s)':>9} "
+          f"{'pages/s':>8} {'html MB/s':>9} {'peak RSS (MiB)':>14}")
+    results: Dict[str, Dict[str, float]] = {}
+    for size in args.sizes:
+        metrics = measure_isolated(size, args.repeat)
+        results[str(size)] = metrics
+        rss = metrics["peak_rss_mb"]
+        print(f"{size:>10} {metrics['to_markdown_s']:>12.3f} {metrics['to_html_s']:>9.3f} "
+              f"{metrics['generate_index_s']:>9.3f} {metrics['generate_all_pages_s']:>9.3f} "
+              f"{metrics['pages_per_s']:>8.0f} {metrics['html_mb_per_s']:>9.1f} "
+              f"{rss if rss is not None else float('nan'):>14.0f}")
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps({
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "results": results,
+        }, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = find_regressions(results, baseline["results"], args.threshold)
+        label = baseline.get("commit", "")[:12] or str(args.baseline)
+        if regressions:
+            print(f"regressions against {label} (threshold {args.threshold:.0%}):")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"no regressions against {label} (threshold {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
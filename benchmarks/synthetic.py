@@ -0,0 +1,106 @@
+"""
+Synthetic technique catalogs for benchmarks.
+
+Real technique modules supply the section text, so synthetic pages have the
+same section lengths and markdown mix as the site itself. Every synthetic
+technique gets a unique name and unique section text that mentions a few
+other techniques, so cross-linking does real work and render caches are not
+flattered by pages sharing identical sections.
+
+Usage (prints catalog statistics):
+    python -m benchmarks.synthetic [--size 1000]
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.crosslink_scaling import WORDS  # noqa: E402
+from techniques import TECHNIQUES  # noqa: E402
+
+MAX_SIZE = 50000
+
+
+def make_names(size: int, seed: int = 0) -> List[str]:
+    """Create `size` unique technique names."""
+    rng = random.Random(seed)
+    names: Dict[str, None] = {}
+    while len(names) < size:
+        name = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 4))).title()
+        names[name] = None
+    return list(names)
+
+
+def make_technique(name: str, template: Dict, others: List[str], variant: int) -> Dict:
+    """
+    Derive a technique data dictionary from a real one.
+
+    Text sections keep the template's text and gain a sentence mentioning
+    `others`; list items are tagged with the variant number.
+    """
+    see_also = f"\n\nCompare with {others[0]} and {others[1]}; see also {others[2]}."
+    tag = f" (variant {variant})"
+    data = {}
+    for key, value in template.items():
+        if isinstance(value, str):
+            data[key] = value + see_also if key != "one_line_summary" else f"{name}: {value}"
+        elif key == "keywords":
+            data[key] = list(value) + [name.lower()]
+        elif isinstance(value, list):
+            data[key] = [item + tag for item in value]
+        elif key == "data_analysis_pipeline":
+            data[key] = {step: text + see_also for step, text in value.items()}
+        else:
+            data[key] = {group: [item + tag for item in items] for group, items in value.items()}
+    data["references"] = [
+        {"citation": f"{name} working group ({2000 + variant % 25}). Reference {n} for {name}.",
+         "doi": f"10.5555/synthetic.{variant}.{n}" if n % 2 else ""}
+        for n in range(1, 4)
+    ]
+    return data
+
+
+def make_catalog(size: int, seed: int = 0) -> Dict[str, Dict]:
+    """
+    Create a synthetic catalog of `size` technique data dictionaries, keyed by name.
+
+    Templates cycle through the real technique modules, so section lengths
+    follow the real distribution at any catalog size.
+    """
+    if not 1 <= size <= MAX_SIZE:
+        raise ValueError(f"size must be between 1 and {MAX_SIZE}")
+    names = make_names(size, seed)
+    templates = list(TECHNIQUES.values())
+    rng = random.Random(seed + 1)
+    catalog = {}
+    for index, name in enumerate(names):
+        others = [rng.choice(names) for _ in range(3)]
+        catalog[name] = make_technique(name, templates[index % len(templates)], others, index)
+    return catalog
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1000, help=f"number of techniques (1 to {MAX_SIZE})")
+    args = parser.parse_args()
+
+    catalog = make_catalog(args.size)
+    chars = 0
+    for data in catalog.values():
+        for key, value in data.items():
+            if isinstance(value, str):
+                chars += len(value)
+            elif isinstance(value, dict):
+                chars += sum(len(item) if isinstance(item, str) else sum(map(len, item)) for item in value.values())
+            elif key != "references":
+                chars += sum(map(len, value))
+    print(f"{len(catalog)} techniques from {len(TECHNIQUES)} templates, "
+          f"{chars / len(catalog) / 1024:.1f} KiB of text per technique")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Optional timing instrumentation for site builds.
+
+A BuildProfile collects per-phase wall time for a SiteGenerator build and a
+PageProfile for every technique page rendered: per-section time, time spent
+cross-linking, time spent writing, bytes written, regex work and render
+cache hits. The result is a JSON report with the slowest pages summarized
+first.
+
+Nothing here is touched unless profiling is requested, so unprofiled builds
+run the same code paths as before.
+"""
+
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class PageProfile:
+    """Measurements for rendering and writing one technique page."""
+    
+    name: str
+    file: str = ""
+    seconds: float = 0.0
+    write_seconds: float = 0.0
+    crosslink_seconds: float = 0.0
+    bytes: int = 0
+    sections: Dict[str, float] = field(default_factory=dict)
+    regex_scans: int = 0
+    regex_substitutions: int = 0
+    links: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    
+    def add_section(self, section_id: str, seconds: float):
+        """Add rendering time for a section of the page."""
+        self.sections[section_id] = self.sections.get(section_id, 0.0) + seconds
+
+
+class TimedLinker:
+    """
+    Stand-in for a CrossLinker that adds the time spent linking to a PageProfile.
+    
+    Everything except linking is delegated to the wrapped linker, so link
+    tracking, versions and counters are shared with it.
+    """
+    
+    def __init__(self, linker, profile: PageProfile):
+        self._linker = linker
+        self._profile = profile
+    
+    def __getattr__(self, name):
+        return getattr(self._linker, name)
+    
+    def link(self, text: str, current: Optional[str] = None) -> str:
+        linked, targets = self.link_targets(text, current)
+        self._linker.record(current, targets)
+        return linked
+    
+    def link_targets(self, text: str, current: Optional[str] = None):
+        start = perf_counter()
+        try:
+            return self._linker.link_targets(text, current)
+        finally:
+            self._profile.crosslink_seconds += perf_counter() - start
+
+
+class BuildProfile:
+    """Collects phase timings and page profiles for one site build."""
+    
+    def __init__(self, top_n: int = 10):
+        """
+        Args:
+            top_n: Number of slowest pages listed in the report summary
+        """
+        self.top_n = top_n
+        self.phases: Dict[str, float] = {}
+        self.pages: List[PageProfile] = []
+        self.cache: Dict[str, int] = {}
+        self._started = perf_counter()
+    
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block of the build under name; repeated phases accumulate."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + perf_counter() - start
+    
+    def add_page(self, page: PageProfile):
+        """Record a rendered page."""
+        self.pages.append(page)
+    
+    def slowest_pages(self) -> List[Tuple[str, float]]:
+        """Return (name, seconds) for the top_n slowest pages, slowest first."""
+        ranked = sorted(self.pages, key=lambda page: page.seconds, reverse=True)
+        return [(page.name, page.seconds) for page in ranked[:self.top_n]]
+    
+    def report(self) -> Dict:
+        """Return the build report as JSON-serializable data."""
+        sections: Dict[str, float] = {}
+        for page in self.pages:
+            for section_id, seconds in page.sections.items():
+                sections[section_id] = sections.get(section_id, 0.0) + seconds
+        return {
+            "total_seconds": perf_counter() - self._started,
+            "phases": self.phases,
+            "pages_rendered": len(self.pages),
+            "bytes_written": sum(page.bytes for page in self.pages),
+            "page_seconds": sum(page.seconds for page in self.pages),
+            "crosslink_seconds": sum(page.crosslink_seconds for page in self.pages),
+            "write_seconds": sum(page.write_seconds for page in self.pages),
+            "sections": sections,
+            "regex": {
+                "scans": sum(page.regex_scans for page in self.pages),
+                "substitutions": sum(page.regex_substitutions for page in self.pages),
+                "links": sum(page.links for page in self.pages),
+            },
+            "cache": self.cache,
+            "slowest_pages": [{"name": name, "seconds": seconds} for name, seconds in self.slowest_pages()],
+            "pages": [asdict(page) for page in self.pages],
+        }
+    
+    def write(self, path: Path):
+        """Write the build report to path as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2, ensure_ascii=False), encoding='utf-8')
@@ -407,42 +407,20 @@ def convert_all_techniques():
     for name, filename in converted:
         print(f"  - {name} -> {filename}.py")
 
+# techniques/__init__.py is its own template: regenerating it replaces only its TECHNIQUE_MODULES index
+INIT_FILE = Path(__file__).resolve().parent / "techniques" / "__init__.py"
+MODULE_INDEX = re.compile(r"^TECHNIQUE_MODULES = \{\n.*?^\}$", re.MULTILINE | re.DOTALL)
+
+def init_file_content(converted):
+    """Return techniques/__init__.py indexing the converted (technique name, module) pairs."""
+    entries = "".join(f'    {json.dumps(technique_name)}: "{filename}",\n' for technique_name, filename in converted)
+    source = INIT_FILE.read_text(encoding='utf-8')
+    return MODULE_INDEX.sub(lambda match: "TECHNIQUE_MODULES = {\n" + entries + "}", source, count=1)
+
 def update_init_file(converted):
     """Update the __init__.py file with all converted techniques."""
     init_file = Path("techniques/__init__.py")
-    
-    # Generate imports and TECHNIQUES dict
-    imports = []
-    techniques_dict_items = []
-    
-    for technique_name, filename in converted:
-        var_name = f"{filename}_data"
-        imports.append(f"from .{filename} import {var_name}")
-        techniques_dict_items.append(f'    "{technique_name}": {var_name},')
-    
-    # Generate __init__.py content
-    init_content = f'''"""
-Techniques module - contains individual technique data definitions.
-"""
-
-# Import all technique data modules
-{chr(10).join(imports)}
-
-# Dictionary mapping technique names to their data
-TECHNIQUES = {{
-{chr(10).join(techniques_dict_items)}
-}}
-
-def get_technique_data(technique_name: str):
-    """Get technique data by name."""
-    return TECHNIQUES.get(technique_name)
-
-def list_techniques():
-    """List all available techniques."""
-    return list(TECHNIQUES.keys())
-'''
-    
-    init_file.write_text(init_content, encoding='utf-8')
+    init_file.write_text(init_file_content(converted), encoding='utf-8')
     print(f"\nUpdated: {init_file}")
 
 if __name__ == "__main__":
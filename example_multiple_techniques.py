@@ -3,7 +3,7 @@ Example: Generate a site with multiple techniques using the HyperImage framework
 This demonstrates how to use the modular technique file structure.
 """
 
-from framework import SiteGenerator
+from framework import STYLE_URL, SiteGenerator
 from pathlib import Path
 from techniques import get_technique_data, list_techniques
 
@@ -30,7 +30,7 @@ if __name__ == "__main__":
     
     print("\nGenerated HTML site:")
     print(f"  - Index page: site/index.html")
-    print(f"  - CSS stylesheet: site/assets/style.css")
+    print(f"  - CSS stylesheet: site/{STYLE_URL}")
     print(f"  - Technique pages: {len(list_techniques())} pages")
     print("\nOpen site/index.html in a web browser to view the site!")
 
@@ -3,8 +3,11 @@ Main script: Generate reference pages for all techniques using the HyperImage fr
 This is the main entry point for generating the complete technique documentation site.
 """
 
-from framework import SiteGenerator
+import sys
+
+from framework import STYLE_URL, SiteGenerator
 from pathlib import Path
+from schema import TechniqueValidationError
 from techniques import get_technique_data, list_techniques
 
 if __name__ == "__main__":
@@ -16,17 +19,24 @@ if __name__ == "__main__":
     all_techniques = list_techniques()
     print(f"Found {len(all_techniques)} techniques:")
     
-    # Add all available techniques to the site
-    added_count = 0
+    # Load all available techniques
+    catalog = {}
     for technique_name in all_techniques:
         technique_data = get_technique_data(technique_name)
         if technique_data:
-            site.add_technique(technique_name, technique_data)
-            added_count += 1
-            print(f"  [+] Added: {technique_name}")
+            catalog[technique_name] = technique_data
+            print(f"  [+] Loaded: {technique_name}")
         else:
             print(f"  [-] Failed to load: {technique_name}")
     
+    # Validate every technique before adding any, reporting all problems at once
+    try:
+        site.add_techniques(catalog)
+    except TechniqueValidationError as error:
+        print(f"\n{error}")
+        sys.exit(1)
+    added_count = len(catalog)
+    
     print(f"\nSuccessfully loaded {added_count} techniques")
     
     # Generate all pages (HTML site with index, CSS, etc.)
@@ -36,7 +46,7 @@ if __name__ == "__main__":
     print("\n" + "="*60)
     print("Generated HTML site:")
     print(f"  - Index page: site/index.html")
-    print(f"  - CSS stylesheet: site/assets/style.css")
+    print(f"  - CSS stylesheet: site/{STYLE_URL}")
     print(f"  - Technique pages: {added_count} pages")
     print("="*60)
     print("\nOpen site/index.html in a web browser to view the site!")
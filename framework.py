@@ -5,223 +5,521 @@ This framework creates structured HTML documentation pages for conservation scie
 with interlinking and navigation.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Set
+from dataclasses import dataclass, field, asdict
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Dict, Set, Tuple, Union
 from pathlib import Path
+import hashlib
+import importlib.util
 import json
 import re
 import html
+import sys
+from collections import OrderedDict
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from time import perf_counter
+from urllib.parse import quote
 
+from build_profile import BuildProfile, PageProfile, TimedLinker
+from highlight import HIGHLIGHT_VERSION, HighlightCache, highlight_code
+from keyword_index import KeywordIndex, normalize_keyword
+from markdown_parser import Block, parse_markdown, render_html
+from related import DEFAULT_TOP_K, RELATED_VERSION, RelatedTechniques
+from related import available as related_available
+from schema import Schema, SchemaError, TechniqueValidationError, ValidationCache, validate_catalog
+from search_index import SEARCH_INDEX_VERSION, SEARCH_SCRIPT, SearchIndexBuilder, field_weights
+from site_output import (discard_staging, open_if_changed, publish_directory, rebase_directory, relative_root,
+                         replace_if_changed, stage_directory, write_if_changed)
+from site_map import (SITE_MANIFEST_FILENAME, SITEMAP_FILENAME, LinkProblem, PageRecord, PageTargets, check_links,
+                      load_site_manifest, page_targets, sitemap_xml, write_site_manifest, write_sitemap)
+from static_assets import fingerprint, minify_css, precompress_directory, write_asset
 
-@dataclass
-class TechniqueReference:
-    """Data structure for a scientific analysis technique reference page."""
+# Bump when the page templates, markdown rendering or stylesheet change so
+# incremental builds and cached sections are re-rendered
+TEMPLATE_VERSION = "9"
+
+
+def _trie_pattern(words: List[str]) -> str:
+    """
+    Build a regex alternation for a set of literal words, factored as a trie.
     
-    technique_name: str
-    one_line_summary: str
-    abstract: str
-    physics_principle: str
-    instruments_components: str
-    resolution_detection: str
-    sample_requirements: str
-    measurement_protocol: Dict[str, List[str]]  # e.g., {"preparation": [...], "calibration": [...]}
-    data_outputs: str
-    data_analysis_pipeline: Dict[str, str]  # e.g., {"preprocessing": "...", "feature_extraction": "..."}
-    artifacts_troubleshooting: str
-    multimodal_pairings: str
-    strengths_limitations: Dict[str, List[str]]  # {"strengths": [...], "limitations": [...]}
-    references: List[Dict[str, str]]  # [{"citation": "...", "doi": "..."}]
-    lab_checklist: List[str]
-    keywords: List[str]
+    A flat alternation makes the regex engine retry every word at every text
+    position. Factoring shared prefixes means each position only follows the
+    branches that match, so a scan stays close to linear in the text length
+    regardless of how many words there are. Optional tails are greedy, so the
+    longest word wins and shorter ones are tried on backtracking.
+    """
+    trie: Dict[str, Dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
     
-    def to_markdown(self) -> str:
-        """Convert the technique reference to markdown format."""
+    def walk(node: Dict[str, Dict]) -> str:
+        branches = [re.escape(char) + walk(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            body = f"(?:{body})?"
+        return body
+    
+    return walk(trie)
+
+
+class CrossLinker:
+    """
+    Link technique names in rendered HTML with one combined pattern.
+    
+    The pattern is compiled once for the whole technique set, so linking a
+    page is a single left-to-right scan instead of one regex pass per
+    technique. Matching is case-insensitive and bounded by non-word
+    characters; HTML tags and existing links are skipped, and a page never
+    links to itself.
+    
+    With track_links enabled, every link inserted is also recorded in
+    `outbound` as current technique -> set of linked technique names.
+    """
+    
+    def __init__(self, technique_urls: Dict[str, str], base_url: str = "", track_links: bool = False):
+        self.base_url = base_url
+        self.track_links = track_links
+        self.outbound: Dict[str, Set[str]] = {}
+        # Pattern passes over text and matches replaced, reported by build profiles
+        self.scans = 0
+        self.substitutions = 0
+        # Identifies the link set, so cached link output can be invalidated when it changes
+        link_set = json.dumps(sorted(technique_urls.items()), ensure_ascii=False)
+        self.version = hashlib.sha256(link_set.encode('utf-8')).hexdigest()[:16]
+        # Page text is HTML-escaped before linking, so match escaped names
+        self._targets: Dict[str, tuple] = {}
+        for tech_name, tech_url in technique_urls.items():
+            self._targets.setdefault(html.escape(tech_name).lower(), (tech_name, tech_url))
+        self._pattern = None
+        if self._targets:
+            self._pattern = re.compile(
+                r'(<a\b[^>]*>.*?</a>|<[^>]*>)|(?<!\w)(' + _trie_pattern(list(self._targets)) + r')(?!\w)',
+                re.IGNORECASE | re.DOTALL)
+    
+    def link(self, text: str, current: Optional[str] = None) -> str:
+        """
+        Wrap technique name mentions in text with links to their pages.
         
-        md = f"# {self.technique_name}\n\n"
-        
-        # Section 2: One-line summary
-        md += f"## One-line Summary\n\n{self.one_line_summary}\n\n"
-        
-        # Section 3: Abstract
-        md += f"## Abstract\n\n{self.abstract}\n\n"
-        
-        # Section 4: Physics & Principle
-        md += f"## Physics & Principle\n\n{self.physics_principle}\n\n"
-        
-        # Section 5: Typical Instruments & Components
-        md += f"## Typical Instruments & Components\n\n{self.instruments_components}\n\n"
-        
-        # Section 6: Spatial / Spectral / Temporal Resolution
-        md += f"## Spatial / Spectral / Temporal Resolution\n\n{self.resolution_detection}\n\n"
-        
-        # Section 7: Sample Requirements & Invasiveness
-        md += f"## Sample Requirements & Invasiveness\n\n{self.sample_requirements}\n\n"
-        
-        # Section 8: Step-by-step Measurement Protocol
-        md += "## Step-by-step Measurement Protocol\n\n"
-        for section_name, steps in self.measurement_protocol.items():
-            md += f"### {section_name.title()}\n\n"
-            for i, step in enumerate(steps, 1):
-                md += f"{i}. {step}\n"
-            md += "\n"
-        
-        # Section 9: Data Outputs & File Formats
-        md += f"## Data Outputs & File Formats\n\n{self.data_outputs}\n\n"
-        
-        # Section 10: Data Analysis Pipeline
-        md += "## Data Analysis Pipeline\n\n"
-        for section_name, content in self.data_analysis_pipeline.items():
-            md += f"### {section_name.replace('_', ' ').title()}\n\n{content}\n\n"
-        
-        # Section 11: Common Instrument Artifacts & Troubleshooting
-        md += f"## Common Instrument Artifacts & Troubleshooting\n\n{self.artifacts_troubleshooting}\n\n"
-        
-        # Section 12: Typical Multimodal Pairings
-        md += f"## Typical Multimodal Pairings\n\n{self.multimodal_pairings}\n\n"
-        
-        # Section 13: Strengths & Limitations
-        md += "## Strengths & Limitations\n\n"
-        md += "### Strengths\n\n"
-        for strength in self.strengths_limitations.get("strengths", []):
-            md += f"- {strength}\n"
-        md += "\n### Limitations\n\n"
-        for limitation in self.strengths_limitations.get("limitations", []):
-            md += f"- {limitation}\n"
-        md += "\n"
-        
-        # Section 14: Representative References
-        md += "## Representative References\n\n"
-        for ref in self.references:
-            citation = ref.get("citation", "")
-            doi = ref.get("doi", "")
-            if doi:
-                md += f"- {citation} DOI: [{doi}](https://doi.org/{doi})\n"
-            else:
-                md += f"- {citation}\n"
-        md += "\n"
+        Args:
+            text: HTML fragment to scan
+            current: Name of the technique being rendered; its own mentions stay plain
         
-        # Section 15: Lab Checklist
-        md += "## Lab Checklist\n\n"
-        for i, item in enumerate(self.lab_checklist, 1):
-            md += f"{i}. [ ] {item}\n"
-        md += "\n"
+        Returns:
+            The fragment with technique-link anchors inserted
+        """
+        linked, targets = self.link_targets(text, current)
+        self.record(current, targets)
+        return linked
+    
+    def link_targets(self, text: str, current: Optional[str] = None) -> Tuple[str, Set[str]]:
+        """Like link(), but return the linked technique names instead of recording them."""
+        targets: Set[str] = set()
+        if self._pattern is None or not text:
+            return text, targets
         
-        # Section 16: Keywords & Tags
-        md += "## Keywords & Tags\n\n"
-        md += ", ".join(self.keywords) + "\n"
+        def replace(match: re.Match) -> str:
+            if match.group(1):
+                return match.group(1)
+            tech_name, tech_url = self._targets[match.group(2).lower()]
+            if tech_name == current:
+                return match.group(2)
+            targets.add(tech_name)
+            return f'<a href="{self.base_url}{tech_url}" class="technique-link">{match.group(2)}</a>'
         
-        return md
+        linked, count = self._pattern.subn(replace, text)
+        self.scans += 1
+        self.substitutions += count
+        return linked, targets
     
-    def to_html(self, all_techniques: Optional[Dict[str, str]] = None, base_url: str = "") -> str:
-        """Convert the technique reference to HTML format with cross-linking."""
-        if all_techniques is None:
-            all_techniques = {}
+    def record(self, current: Optional[str], targets: Iterable[str]):
+        """Record links from current to targets in `outbound` when tracking is enabled."""
+        if self.track_links and targets:
+            self.outbound.setdefault(current, set()).update(targets)
+    
+    def mentions(self, text: str, current: Optional[str] = None) -> Set[str]:
+        """Return the names of techniques that link() would link in text."""
+        found: Set[str] = set()
+        if self._pattern is None or not text:
+            return found
+        for match in self._pattern.finditer(text):
+            if match.group(2):
+                tech_name = self._targets[match.group(2).lower()][0]
+                if tech_name != current:
+                    found.add(tech_name)
+        return found
+
+
+@lru_cache(maxsize=8)
+def _cached_cross_linker(technique_items: tuple, base_url: str) -> CrossLinker:
+    return CrossLinker(dict(technique_items), base_url)
+
+
+def get_cross_linker(technique_urls: Dict[str, str], base_url: str = "") -> CrossLinker:
+    """Return a CrossLinker for the given technique URLs, reusing a recent one when possible."""
+    return _cached_cross_linker(tuple(technique_urls.items()), base_url)
+
+
+def backlinks(outbound: Dict[str, Iterable[str]]) -> Dict[str, List[str]]:
+    """
+    Invert outbound links into inbound ones.
+    
+    Args:
+        outbound: Technique name -> names of the techniques it links to
+    
+    Returns:
+        Technique name -> sorted names of the techniques linking to it, for
+        every technique with at least one inbound link from a key of outbound
+    """
+    inbound: Dict[str, List[str]] = {}
+    for source in sorted(outbound):
+        for target in outbound[source]:
+            if target != source and target in outbound:
+                inbound.setdefault(target, []).append(source)
+    return inbound
+
+
+def convert_markdown(text: str) -> str:
+    """Convert markdown-like text to HTML. Cross-linking is applied separately by CrossLinker."""
+    if not text:
+        return ""
+    return render_html(parse_markdown(text), highlight_code)
+
+
+class MarkdownText:
+    """
+    A markdown fragment from technique data.
+    
+    The fragment keeps its source text and is parsed on first use; the parsed
+    blocks are then shared by every output format rendered from the same
+    document.
+    """
+    
+    __slots__ = ("source", "_blocks")
+    
+    def __init__(self, source: str):
+        self.source = source
+        self._blocks: Optional[List[Block]] = None
+    
+    def __repr__(self) -> str:
+        return f"MarkdownText({self.source!r})"
+    
+    def __getstate__(self):
+        return (self.source, self._blocks)
+    
+    def __setstate__(self, state):
+        self.source, self._blocks = state
+    
+    @property
+    def blocks(self) -> List[Block]:
+        """The parsed markdown blocks."""
+        if self._blocks is None:
+            self._blocks = parse_markdown(self.source) if self.source else []
+        return self._blocks
+    
+    def to_html(self, highlight: Callable[[str, str], Optional[str]] = highlight_code) -> str:
+        """Render the fragment to HTML without cross-linking, highlighting code blocks with highlight."""
+        return render_html(self.blocks, highlight)
+
+
+class RenderCache:
+    """
+    Content-addressed cache of rendered section HTML with LRU eviction.
+    
+    Entries are keyed by the section text, the template version, the
+    cross-link set version and the base URL, so sections shared between techniques (references, checklist
+    items, boilerplate) are converted once per link set. A page's own name is
+    never linked, so text that mentions the current technique is additionally
+    keyed by that technique.
+    
+    When `path` is given, load() and save() persist the cache as JSON so
+    unchanged sections stay cached across builds. Code blocks of sections
+    that are rendered are highlighted through `highlight_cache`, which
+    save() persists too when it has a path.
+    """
+    
+    def __init__(self, max_entries: int = 10000, path: Optional[Path] = None,
+                 highlight_cache: Optional[HighlightCache] = None):
+        self.max_entries = max_entries
+        self.path = Path(path) if path is not None else None
+        self.highlight_cache = highlight_cache if highlight_cache is not None else HighlightCache()
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[str, List[str]]]" = OrderedDict()
+        # Entries stored since the last take_added(); None until it is first called
+        self._added: Optional[Dict[str, Tuple[str, List[str]]]] = None
+        if self.path is not None:
+            self.load()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @staticmethod
+    def key(text: str, linker: CrossLinker, current: Optional[str] = None) -> str:
+        """Return the cache key for rendering text on the page of current."""
+        owner = current if current and current.lower() in text.lower() else ""
+        payload = "\0".join((TEMPLATE_VERSION, HIGHLIGHT_VERSION, linker.version, linker.base_url, owner, text))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[Tuple[str, List[str]]]:
+        """Return (html, linked technique names) for key, or None, updating hit/miss counts."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+    
+    def put(self, key: str, rendered: str, targets: Iterable[str]):
+        """Store rendered HTML and its linked technique names, evicting the least recently used entry."""
+        entry = (rendered, sorted(targets))
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if self._added is not None:
+            self._added[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def update(self, entries: Dict[str, Tuple[str, List[str]]]):
+        """Merge entries rendered elsewhere, e.g. by worker processes."""
+        for key, (rendered, targets) in entries.items():
+            self.put(key, rendered, targets)
+    
+    def take_added(self) -> Dict[str, Tuple[str, List[str]]]:
+        """
+        Return and forget the entries stored since the last call.
         
-        def markdown_to_html(text: str) -> str:
-            """Convert markdown-like text to HTML with cross-linking."""
-            if not text:
-                return ""
-            
-            # Escape HTML first
-            text = html.escape(text)
-            
-            # Convert code blocks
-            text = re.sub(r'```(\w+)?\n(.*?)```', 
-                         lambda m: f'<pre><code class="language-{m.group(1) or ""}">{m.group(2)}</code></pre>', 
-                         text, flags=re.DOTALL)
-            
-            # Convert inline code
-            text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
-            
-            # Convert bold
-            text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-            
-            # Convert italic
-            text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
-            
-            # Convert links
-            text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', text)
-            
-            # Convert line breaks to paragraphs, handling lists
-            # First, split by double newlines
-            paragraphs = text.split('\n\n')
-            html_paras = []
-            for para in paragraphs:
-                para = para.strip()
-                if not para:
-                    continue
-                
-                # Check if paragraph contains list items
-                lines = para.split('\n')
-                first_line = lines[0].strip()
-                
-                # Check if it's a list
-                if first_line.startswith('- ') or first_line.startswith('* '):
-                    # Convert to unordered list
-                    list_html = '<ul>\n'
-                    for line in lines:
-                        line = line.strip()
-                        if line.startswith('- ') or line.startswith('* '):
-                            item = re.sub(r'^[-*]\s+', '', line)
-                            list_html += f'  <li>{item}</li>\n'
-                    list_html += '</ul>'
-                    html_paras.append(list_html)
-                elif re.match(r'^\d+\.\s', first_line):
-                    # Convert to ordered list
-                    list_html = '<ol>\n'
-                    for line in lines:
-                        line = line.strip()
-                        if re.match(r'^\d+\.\s', line):
-                            item = re.sub(r'^\d+\.\s+', '', line)
-                            list_html += f'  <li>{item}</li>\n'
-                    list_html += '</ol>'
-                    html_paras.append(list_html)
-                else:
-                    # Regular paragraph - check for inline lists
-                    if '\n- ' in para or '\n* ' in para:
-                        # Has list items within, split them
-                        parts = re.split(r'\n(?=[-*]\s)', para)
-                        for part in parts:
-                            part = part.strip()
-                            if part.startswith('- ') or part.startswith('* '):
-                                # List item
-                                items = re.split(r'\n(?=[-*]\s)', part)
-                                list_html = '<ul>\n'
-                                for item in items:
-                                    item = re.sub(r'^[-*]\s+', '', item.strip())
-                                    list_html += f'  <li>{item}</li>\n'
-                                list_html += '</ul>'
-                                html_paras.append(list_html)
-                            else:
-                                # Regular text
-                                if part:
-                                    html_paras.append(f'<p>{part}</p>')
+        Entries are only tracked once this has been called, so a cache whose
+        additions are never collected does not keep evicted entries alive.
+        """
+        added, self._added = self._added or {}, {}
+        return added
+    
+    def render(self, fragment: MarkdownText, linker: CrossLinker, current: Optional[str] = None) -> str:
+        """Convert and cross-link a fragment, reusing a cached rendering when available."""
+        key = self.key(fragment.source, linker, current)
+        entry = self.get(key)
+        if entry is None:
+            rendered, targets = linker.link_targets(fragment.to_html(self.highlight_cache.highlight), current)
+            self.put(key, rendered, targets)
+        else:
+            rendered, targets = entry
+        linker.record(current, targets)
+        return rendered
+    
+    def load(self):
+        """Load persisted entries from `path`, ignoring a missing or unreadable file."""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            stored = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        for key, (rendered, targets) in stored.items():
+            self._entries[key] = (rendered, targets)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def save(self):
+        """Persist the cache to `path`, most recently used entries last, and the highlight cache to its path."""
+        self.highlight_cache.save()
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_if_changed(self.path, json.dumps(self._entries, ensure_ascii=False))
+
+
+# ---------------- Document model ----------------
+
+class Heading(NamedTuple):
+    """A subsection heading within a section."""
+    title: str
+
+
+class ItemList(NamedTuple):
+    """A list whose items are markdown fragments (protocol steps, strengths, ...)."""
+    ordered: bool
+    items: Tuple[MarkdownText, ...]
+
+
+class ReferenceList(NamedTuple):
+    """Citations with optional DOIs."""
+    references: Tuple[Dict[str, str], ...]
+
+
+class Checklist(NamedTuple):
+    """Plain-text lab checklist items."""
+    items: Tuple[str, ...]
+
+
+class KeywordList(NamedTuple):
+    """Keyword tags."""
+    keywords: Tuple[str, ...]
+
+
+SectionNode = Union[MarkdownText, Heading, ItemList, ReferenceList, Checklist, KeywordList]
+
+
+class Section(NamedTuple):
+    """A top-level section of a technique page; id is its HTML anchor."""
+    id: str
+    title: str
+    children: Tuple[SectionNode, ...]
+
+
+class TechniqueDocument(NamedTuple):
+    """
+    Format-independent tree of a technique reference.
+    
+    Built once per technique by TechniqueReference.document(); markdown, HTML
+    and any other output format render from it, so markdown fragments are
+    parsed at most once however many formats are produced.
+    """
+    title: str
+    summary: str
+    sections: Tuple[Section, ...]
+
+
+def render_document_markdown(document: TechniqueDocument, level: int = 1, anchor: Optional[str] = None,
+                             render_text: Optional[Callable[[str], str]] = None) -> str:
+    """
+    Render a technique document as markdown.
+    
+    Args:
+        document: The technique document
+        level: Heading level of the title; sections are one level below it
+        anchor: When given, every section is preceded by <a id="<anchor>--<section id>">,
+            the ids sections get in the HTML book
+        render_text: Applied to the markdown source of text and list items, e.g. to insert links
+    """
+    title, heading, subheading = "#" * level, "#" * (level + 1), "#" * (level + 2)
+    text = render_text or (lambda source: source)
+    parts = [f"{title} {document.title}\n\n", f"{heading} One-line Summary\n\n{document.summary}\n\n"]
+    for section in document.sections:
+        if anchor is not None:
+            parts.append(f'<a id="{anchor}--{section.id}"></a>\n\n')
+        parts.append(f"{heading} {section.title}\n\n")
+        for node in section.children:
+            if isinstance(node, MarkdownText):
+                parts.append(f"{text(node.source)}\n\n")
+            elif isinstance(node, Heading):
+                parts.append(f"{subheading} {node.title}\n\n")
+            elif isinstance(node, ItemList):
+                for i, item in enumerate(node.items, 1):
+                    marker = f"{i}." if node.ordered else "-"
+                    parts.append(f"{marker} {text(item.source)}\n")
+                parts.append("\n")
+            elif isinstance(node, ReferenceList):
+                for ref in node.references:
+                    citation = ref.get("citation", "")
+                    doi = ref.get("doi", "")
+                    if doi:
+                        parts.append(f"- {citation} DOI: [{doi}](https://doi.org/{doi})\n")
                     else:
-                        # Regular paragraph
-                        html_paras.append(f'<p>{para}</p>')
-            
-            # Cross-link technique names
-            for tech_name, tech_url in all_techniques.items():
-                if tech_name != self.technique_name:
-                    pattern = re.compile(r'\b' + re.escape(tech_name) + r'\b', re.IGNORECASE)
-                    html_paras = [pattern.sub(
-                        lambda m: f'<a href="{base_url}{tech_url}" class="technique-link">{m.group(0)}</a>',
-                        para) for para in html_paras]
+                        parts.append(f"- {citation}\n")
+                parts.append("\n")
+            elif isinstance(node, Checklist):
+                for i, item in enumerate(node.items, 1):
+                    parts.append(f"{i}. [ ] {item}\n")
+                parts.append("\n")
+            elif isinstance(node, KeywordList):
+                parts.append(", ".join(node.keywords) + "\n")
+    return "".join(parts)
+
+
+def _iter_section_html(section: Section, render_text: Callable[[MarkdownText], str]) -> Iterator[str]:
+    """Render one section of a technique page, yielding it in chunks."""
+    yield f"""
             
-            return '\n'.join(html_paras)
-        
-        def format_code_block(code: str, language: str = "python") -> str:
-            """Format code block with syntax highlighting class."""
-            code = html.escape(code)
-            return f'<pre><code class="language-{language}">{code}</code></pre>'
-        
-        html_content = f"""<!DOCTYPE html>
+            <section id="{section.id}" class="section">
+                <h2>{section.title}</h2>"""
+    for node in section.children:
+        if isinstance(node, MarkdownText):
+            yield """
+                """
+            yield render_text(node)
+        elif isinstance(node, Heading):
+            yield f"""
+                <h3>{html.escape(node.title)}</h3>"""
+        elif isinstance(node, ItemList):
+            tag = "ol" if node.ordered else "ul"
+            yield f"""
+                <{tag}>"""
+            for item in node.items:
+                yield f"""
+                    <li>{render_text(item)}</li>"""
+            yield f"""
+                </{tag}>"""
+        elif isinstance(node, ReferenceList):
+            yield """
+                <ul class="references">"""
+            for ref in node.references:
+                citation = ref.get("citation", "")
+                doi = ref.get("doi", "")
+                if doi:
+                    yield f"""
+                    <li>{html.escape(citation)} <a href="https://doi.org/{doi}" target="_blank" rel="noopener">DOI: {doi}</a></li>"""
+                else:
+                    yield f"""
+                    <li>{html.escape(citation)}</li>"""
+            yield """
+                </ul>"""
+        elif isinstance(node, Checklist):
+            yield """
+                <div class="checklist">"""
+            for item in node.items:
+                yield f"""
+                    <label class="checklist-item">
+                        <input type="checkbox">
+                        <span>{html.escape(item)}</span>
+                    </label>"""
+            yield """
+                </div>"""
+        elif isinstance(node, KeywordList):
+            yield """
+                <div class="keywords">"""
+            for keyword in node.keywords:
+                yield f"""
+                    <span class="keyword-tag">{html.escape(keyword)}</span>"""
+            yield """
+                </div>"""
+    yield """
+            </section>"""
+
+
+def iter_document_html(document: TechniqueDocument, base_url: str,
+                       render_text: Callable[[MarkdownText], str],
+                       profile: Optional[PageProfile] = None,
+                       related: Optional[List[Tuple[str, str]]] = None,
+                       referenced_by: Optional[List[Tuple[str, str]]] = None,
+                       tail: bool = True) -> Iterator[str]:
+    """
+    Render a technique document as an HTML page, yielding it in chunks.
+    
+    Args:
+        document: The technique document
+        base_url: Prefix prepended to every generated URL
+        render_text: Converts a markdown fragment to (cross-linked) HTML
+        profile: When given, receives the time spent rendering each section
+        related: (name, URL) of related techniques, listed after the last section
+        referenced_by: (name, URL) of techniques whose pages link to this one
+        tail: End with page_tail_html(); without it the page stops after its
+            last section so the tail can be appended once backlinks are known
+    """
+    yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{html.escape(self.technique_name)} - HyperImage</title>
-    <link rel="stylesheet" href="{base_url}assets/style.css">
+    <title>{html.escape(document.title)} - HyperImage</title>
+    <link rel="stylesheet" href="{base_url}{STYLE_URL}">
 </head>
 <body>
     <nav class="navbar">
@@ -237,247 +535,1448 @@ class TechniqueReference:
     <main class="container">
         <article class="technique-page">
             <header class="page-header">
-                <h1>{html.escape(self.technique_name)}</h1>
-                <p class="summary">{html.escape(self.one_line_summary)}</p>
-            </header>
-            
-            <section id="abstract" class="section">
-                <h2>Abstract</h2>
-                {markdown_to_html(self.abstract)}
-            </section>
-            
-            <section id="physics" class="section">
-                <h2>Physics & Principle</h2>
-                {markdown_to_html(self.physics_principle)}
-            </section>
-            
-            <section id="instruments" class="section">
-                <h2>Typical Instruments & Components</h2>
-                {markdown_to_html(self.instruments_components)}
-            </section>
+                <h1>{html.escape(document.title)}</h1>
+                <p class="summary">{html.escape(document.summary)}</p>
+            </header>"""
+    
+    for section in document.sections:
+        if profile is None:
+            yield from _iter_section_html(section, render_text)
+        else:
+            start = perf_counter()
+            chunks = list(_iter_section_html(section, render_text))
+            profile.add_section(section.id, perf_counter() - start)
+            yield from chunks
+    
+    if related:
+        yield """
             
-            <section id="resolution" class="section">
-                <h2>Spatial / Spectral / Temporal Resolution</h2>
-                {markdown_to_html(self.resolution_detection)}
-            </section>
+            <section id="related" class="section">
+                <h2>Related Techniques</h2>
+                <ul class="related-techniques">"""
+        for tech_name, tech_url in related:
+            yield f"""
+                    <li><a href="{base_url}{tech_url}" class="technique-link">{html.escape(tech_name)}</a></li>"""
+        yield """
+                </ul>
+            </section>"""
+    
+    if tail:
+        yield page_tail_html(base_url, referenced_by)
+
+
+def page_tail_html(base_url: str, referenced_by: Optional[List[Tuple[str, str]]] = None) -> str:
+    """
+    Return the end of a technique page: its "Referenced by" section, if any, and the closing markup.
+    
+    Args:
+        base_url: Prefix prepended to every generated URL
+        referenced_by: (name, URL) of techniques whose pages link to this one
+    """
+    parts = []
+    if referenced_by:
+        parts.append("""
             
-            <section id="sample-requirements" class="section">
-                <h2>Sample Requirements & Invasiveness</h2>
-                {markdown_to_html(self.sample_requirements)}
-            </section>
+            <section id="referenced-by" class="section">
+                <h2>Referenced by</h2>
+                <ul class="related-techniques">""")
+        for tech_name, tech_url in referenced_by:
+            parts.append(f"""
+                    <li><a href="{base_url}{tech_url}" class="technique-link">{html.escape(tech_name)}</a></li>""")
+        parts.append("""
+                </ul>
+            </section>""")
+    parts.append("""
+        </article>
+    </main>
+    
+    <footer class="footer">
+        <p>&copy; 2024 HyperImage Framework. Scientific analysis techniques for conservation science.</p>
+    </footer>
+</body>
+</html>""")
+    return "".join(parts)
+
+
+def _interned(strings: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(sys.intern(string) for string in strings)
+
+
+def _step_groups(groups: Dict[str, Iterable[str]]) -> Dict[str, Tuple[str, ...]]:
+    return {sys.intern(name): tuple(items) for name, items in groups.items()}
+
+
+def _pipeline(pipeline: Dict[str, str]) -> Dict[str, str]:
+    return {sys.intern(name): text for name, text in pipeline.items()}
+
+
+def _references(references: Iterable[Dict[str, Optional[str]]]) -> Tuple[Dict[str, Optional[str]], ...]:
+    return tuple({sys.intern(key): value for key, value in reference.items()} for reference in references)
+
+
+# How TechniqueReference stores each field that is not a plain string
+_COMPACT_FIELDS: Dict[str, Callable] = {
+    "measurement_protocol": _step_groups,
+    "data_analysis_pipeline": _pipeline,
+    "strengths_limitations": _step_groups,
+    "references": _references,
+    "lab_checklist": tuple,
+    "keywords": _interned,
+}
+
+
+@dataclass
+class TechniqueReference:
+    """
+    Data structure for a scientific analysis technique reference page.
+    
+    A site keeps every reference alive for the whole build, so references are
+    kept compact: instances have slots instead of a __dict__, list fields are
+    stored as tuples, and keywords and section names are interned so techniques
+    sharing them share one string. Fields accept lists and are converted on
+    construction and assignment.
+    """
+    
+    __slots__ = ("technique_name", "one_line_summary", "abstract", "physics_principle", "instruments_components",
+                 "resolution_detection", "sample_requirements", "measurement_protocol", "data_outputs",
+                 "data_analysis_pipeline", "artifacts_troubleshooting", "multimodal_pairings",
+                 "strengths_limitations", "references", "lab_checklist", "keywords", "_document", "_content_hash")
+    
+    technique_name: str
+    one_line_summary: str
+    abstract: str
+    physics_principle: str
+    instruments_components: str
+    resolution_detection: str
+    sample_requirements: str
+    measurement_protocol: Dict[str, Tuple[str, ...]]  # e.g., {"preparation": (...), "calibration": (...)}
+    data_outputs: str
+    data_analysis_pipeline: Dict[str, str]  # e.g., {"preprocessing": "...", "feature_extraction": "..."}
+    artifacts_troubleshooting: str
+    multimodal_pairings: str
+    strengths_limitations: Dict[str, Tuple[str, ...]]  # {"strengths": (...), "limitations": (...)}
+    references: Tuple[Dict[str, Optional[str]], ...]  # ({"citation": "...", "doi": "..." or None}, ...)
+    lab_checklist: Tuple[str, ...]
+    keywords: Tuple[str, ...]
+    
+    def document(self) -> TechniqueDocument:
+        """
+        Return the format-independent document tree for this technique.
+        
+        The tree is built on first use and reused by every renderer until a
+        field is reassigned.
+        """
+        if self._document is None:
+            object.__setattr__(self, "_document", self._build_document())
+        return self._document
+    
+    def __setattr__(self, name, value):
+        if name in _COMPACT_FIELDS:
+            value = _COMPACT_FIELDS[name](value)
+        object.__setattr__(self, name, value)
+        if name not in ("_document", "_content_hash"):
+            object.__setattr__(self, "_document", None)
+            object.__setattr__(self, "_content_hash", None)
+    
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+    
+    def _build_document(self) -> TechniqueDocument:
+        """Arrange the 16 sections into a TechniqueDocument."""
+        def steps(groups: List[Tuple[str, Tuple[str, ...]]], ordered: bool) -> Tuple[SectionNode, ...]:
+            nodes: List[SectionNode] = []
+            for title, items in groups:
+                nodes.append(Heading(title))
+                nodes.append(ItemList(ordered, tuple(MarkdownText(item) for item in items)))
+            return tuple(nodes)
+        
+        protocol = [(sys.intern(name.title()), items) for name, items in self.measurement_protocol.items()]
+        pipeline: List[SectionNode] = []
+        for name, content in self.data_analysis_pipeline.items():
+            pipeline.append(Heading(sys.intern(name.replace('_', ' ').title())))
+            pipeline.append(MarkdownText(content))
+        strengths_limitations = [("Strengths", self.strengths_limitations.get("strengths", ())),
+                                 ("Limitations", self.strengths_limitations.get("limitations", ()))]
+        
+        sections = (
+            Section("abstract", "Abstract", (MarkdownText(self.abstract),)),
+            Section("physics", "Physics & Principle", (MarkdownText(self.physics_principle),)),
+            Section("instruments", "Typical Instruments & Components", (MarkdownText(self.instruments_components),)),
+            Section("resolution", "Spatial / Spectral / Temporal Resolution", (MarkdownText(self.resolution_detection),)),
+            Section("sample-requirements", "Sample Requirements & Invasiveness", (MarkdownText(self.sample_requirements),)),
+            Section("protocol", "Step-by-step Measurement Protocol", steps(protocol, ordered=True)),
+            Section("data-outputs", "Data Outputs & File Formats", (MarkdownText(self.data_outputs),)),
+            Section("analysis", "Data Analysis Pipeline", tuple(pipeline)),
+            Section("troubleshooting", "Common Instrument Artifacts & Troubleshooting",
+                    (MarkdownText(self.artifacts_troubleshooting),)),
+            Section("multimodal", "Typical Multimodal Pairings", (MarkdownText(self.multimodal_pairings),)),
+            Section("strengths-limitations", "Strengths & Limitations", steps(strengths_limitations, ordered=False)),
+            Section("references", "Representative References", (ReferenceList(self.references),)),
+            Section("checklist", "Lab Checklist", (Checklist(self.lab_checklist),)),
+            Section("keywords", "Keywords & Tags", (KeywordList(self.keywords),)),
+        )
+        return TechniqueDocument(self.technique_name, self.one_line_summary, sections)
+    
+    def load(self) -> 'TechniqueReference':
+        """Return this reference; see LazyTechniqueReference.load()."""
+        return self
+    
+    def to_markdown(self) -> str:
+        """Convert the technique reference to markdown format."""
+        return render_document_markdown(self.document())
+    
+    def to_html(self, all_techniques: Optional[Dict[str, str]] = None, base_url: str = "",
+                linker: Optional[CrossLinker] = None, cache: Optional[RenderCache] = None,
+                profile: Optional[PageProfile] = None, related: Optional[List[Tuple[str, str]]] = None,
+                referenced_by: Optional[List[Tuple[str, str]]] = None) -> str:
+        """Convert the technique reference to HTML format with cross-linking."""
+        if profile is None:
+            return "".join(self.iter_html(all_techniques, base_url, linker, cache, related=related,
+                                          referenced_by=referenced_by))
+        start = perf_counter()
+        page = "".join(self.iter_html(all_techniques, base_url, linker, cache, profile, related, referenced_by))
+        profile.seconds += perf_counter() - start
+        return page
+    
+    def iter_html(self, all_techniques: Optional[Dict[str, str]] = None, base_url: str = "",
+                  linker: Optional[CrossLinker] = None, cache: Optional[RenderCache] = None,
+                  profile: Optional[PageProfile] = None,
+                  related: Optional[List[Tuple[str, str]]] = None,
+                  referenced_by: Optional[List[Tuple[str, str]]] = None, tail: bool = True) -> Iterator[str]:
+        """
+        Render the technique reference as HTML, yielding the page in chunks.
+        
+        Each chunk holds at most one section's body, so a page can be written
+        out without ever holding the whole document in memory.
+        
+        Args:
+            all_techniques: Mapping of technique names to page URLs used for cross-links
+            base_url: Prefix prepended to every generated URL
+            linker: Prebuilt CrossLinker; built from all_techniques when omitted
+            cache: RenderCache reused for section bodies across pages and builds
+            profile: When given, receives per-section and cross-linking times,
+                regex counts and cache hits for this page
+            related: (name, URL) of related techniques to list at the end of the page
+            referenced_by: (name, URL) of techniques whose pages link to this one
+            tail: End the page with page_tail_html(); see iter_document_html()
+        """
+        if linker is None:
+            linker = get_cross_linker(all_techniques or {}, base_url)
+        if profile is not None:
+            scans, substitutions = linker.scans, linker.substitutions
+            if cache is not None:
+                hits, misses = cache.hits, cache.misses
+            linker = TimedLinker(linker, profile)
+        
+        def render_text(fragment: MarkdownText) -> str:
+            """Convert a markdown fragment to HTML with cross-linking."""
+            if not fragment.source:
+                return ""
+            if cache is not None:
+                return cache.render(fragment, linker, self.technique_name)
+            return linker.link(fragment.to_html(), self.technique_name)
+        
+        yield from iter_document_html(self.document(), base_url, render_text, profile, related, referenced_by, tail)
+        
+        if profile is not None:
+            profile.regex_scans += linker.scans - scans
+            profile.regex_substitutions += linker.substitutions - substitutions
+            if cache is not None:
+                profile.cache_hits += cache.hits - hits
+                profile.cache_misses += cache.misses - misses
+    
+    def save(self, output_path: Path):
+        """Save the reference page to a markdown file."""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(self.to_markdown(), encoding='utf-8')
+    
+    def save_html(self, output_path: Path, all_techniques: Optional[Dict[str, str]] = None, base_url: str = "",
+                  linker: Optional[CrossLinker] = None, cache: Optional[RenderCache] = None,
+                  profile: Optional[PageProfile] = None, related: Optional[List[Tuple[str, str]]] = None,
+                  referenced_by: Optional[List[Tuple[str, str]]] = None, tail: bool = True,
+                  targets: Optional[PageTargets] = None):
+        """
+        Save the reference page as an HTML file, recording render and write times in profile if given.
+        
+        An existing file holding the same page is left untouched. When targets
+        is given, it is fed every chunk before the chunk is written.
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if profile is None:
+            with open_if_changed(output_path) as f:
+                for chunk in self.iter_html(all_techniques, base_url, linker, cache, related=related,
+                                            referenced_by=referenced_by, tail=tail):
+                    f.write(chunk if targets is None else targets.feed(chunk))
+            return
+        
+        start = perf_counter()
+        with open_if_changed(output_path) as f:
+            for chunk in self.iter_html(all_techniques, base_url, linker, cache, profile, related, referenced_by,
+                                        tail):
+                if targets is not None:
+                    targets.feed(chunk)
+                write_start = perf_counter()
+                f.write(chunk)
+                profile.write_seconds += perf_counter() - write_start
+        profile.seconds += perf_counter() - start
+        profile.bytes += output_path.stat().st_size
+
+    def content_hash(self) -> str:
+        """
+        Return a stable hash of all section data, used to detect changed techniques.
+        
+        The hash is computed once and reused until a field is reassigned, so a
+        long-running process (watch.py) rebuilding the same references does
+        not re-serialize the unchanged ones.
+        """
+        if self._content_hash is None:
+            payload = json.dumps(asdict(self), sort_keys=True, ensure_ascii=False)
+            object.__setattr__(self, "_content_hash", hashlib.sha256(payload.encode('utf-8')).hexdigest())
+        return self._content_hash
+    
+    def iter_text(self) -> Iterator[str]:
+        """Yield every text value in the reference, in section order."""
+        def walk(value):
+            if isinstance(value, str):
+                yield value
+            elif isinstance(value, dict):
+                for item in value.values():
+                    yield from walk(item)
+            elif isinstance(value, (list, tuple)):
+                for item in value:
+                    yield from walk(item)
+        
+        yield from walk(asdict(self))
+    
+    def search_fields(self) -> Dict[str, List[str]]:
+        """Return the technique's text grouped by search field (see search_index.FIELD_BOOSTS)."""
+        body: List[str] = []
+        for section in self.document().sections:
+            for node in section.children:
+                if isinstance(node, MarkdownText):
+                    body.append(node.source)
+                elif isinstance(node, Heading):
+                    body.append(node.title)
+                elif isinstance(node, ItemList):
+                    body.extend(item.source for item in node.items)
+                elif isinstance(node, ReferenceList):
+                    body.extend(ref.get("citation", "") for ref in node.references)
+                elif isinstance(node, Checklist):
+                    body.extend(node.items)
+        return {
+            "name": [self.technique_name],
+            "keywords": self.keywords,
+            "summary": [self.one_line_summary],
+            "body": body,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'TechniqueReference':
+        """
+        Create a TechniqueReference from a dictionary holding technique_name and every section.
+        
+        Raises:
+            TechniqueValidationError: listing every problem in data (see TECHNIQUE_SCHEMA)
+        """
+        fields = dict(data)
+        technique_name = fields.pop("technique_name", None)
+        errors = TECHNIQUE_SCHEMA.errors(str(technique_name or ""), fields)
+        if not isinstance(technique_name, str):
+            errors.insert(0, SchemaError("", "technique_name", "missing" if technique_name is None
+                                         else "expected a string"))
+        if errors:
+            raise TechniqueValidationError(errors)
+        return cls(technique_name=technique_name, **fields)
+
+
+# Validator for technique data dictionaries, compiled once from TechniqueReference's field types
+TECHNIQUE_SCHEMA = Schema(TechniqueReference, exclude=("technique_name",))
+
+
+def create_reference_page(technique_name: str, data: Dict, validate: bool = True) -> TechniqueReference:
+    """
+    Create a reference page from technique name and data dictionary.
+    
+    Args:
+        technique_name: Name of the technique
+        data: Dictionary containing all section data
+        validate: Check data against TECHNIQUE_SCHEMA first; pass False for data
+            that was already validated
+    
+    Returns:
+        TechniqueReference object
+    
+    Raises:
+        TechniqueValidationError: a ValueError and TypeError listing every missing,
+            unexpected or misshaped field. Reference values may be None, as in
+            {"citation": "...", "doi": None}.
+    """
+    if validate:
+        errors = TECHNIQUE_SCHEMA.errors(technique_name, data)
+        if errors:
+            raise TechniqueValidationError(errors)
+    return TechniqueReference(technique_name=technique_name, **data)
+
+
+def technique_filename(technique_name: str) -> str:
+    """Return the file name stem of a technique's pages; "/" is dropped so every page sits in the site root."""
+    return technique_name.lower().replace(' ', '_').replace('/', '')
+
+
+def generate_page(technique_name: str, data: Dict, output_dir: Path = Path("output")) -> Path:
+    """
+    Generate and save a reference page.
+    
+    Args:
+        technique_name: Name of the technique
+        data: Dictionary containing all section data
+        output_dir: Directory to save the output file
+    
+    Returns:
+        Path to the generated file
+    """
+    ref = create_reference_page(technique_name, data)
+    output_path = output_dir / f"{technique_filename(technique_name)}.md"
+    ref.save(output_path)
+    return output_path
+
+
+# ---------------- Lazily loaded techniques ----------------
+
+TechniqueSource = Union[str, Path, Callable[[], Dict]]
+
+
+def load_technique_module(module_name: str, attribute: Optional[str] = None) -> Dict:
+    """
+    Return a technique data dictionary defined in a module, by default its "<module>_data" attribute.
+    
+    A module that is not imported yet is executed without being added to
+    sys.modules, so its data is released once the caller drops it.
+    """
+    attribute = attribute or module_name.rpartition(".")[2] + "_data"
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec = importlib.util.find_spec(module_name)
+        if spec is None:
+            raise ImportError(f"No module named {module_name!r}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return getattr(module, attribute)
+
+
+def load_technique_file(path: Path, attribute: Optional[str] = None) -> Dict:
+    """Return the technique data dictionary in a JSON file, or in a Python file's "<stem>_data" attribute."""
+    path = Path(path)
+    if path.suffix == ".json":
+        return json.loads(path.read_text(encoding='utf-8'))
+    spec = importlib.util.spec_from_file_location(f"_technique_{path.stem}", path)
+    if spec is None:
+        raise ImportError(f"Cannot load technique data from {path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, attribute or f"{path.stem}_data")
+
+
+def technique_loader(source: TechniqueSource) -> Callable[[], Dict]:
+    """
+    Return a function that loads a technique's data dictionary from source.
+    
+    Args:
+        source: One of
+            - a callable returning the data dictionary
+            - a path to a .json file, or to a .py file optionally followed by
+              ":attribute" (see load_technique_file)
+            - a module name optionally followed by ":attribute", e.g.
+              "techniques.raman_microscopy:raman_data" (see load_technique_module)
+    """
+    if callable(source):
+        return source
+    if isinstance(source, Path):
+        return partial(load_technique_file, source)
+    location, separator, attribute = source.rpartition(":")
+    if not separator or not attribute.isidentifier():
+        location, attribute = source, ""
+    if location.endswith((".py", ".json")):
+        return partial(load_technique_file, Path(location), attribute or None)
+    return partial(load_technique_module, location, attribute or None)
+
+
+def _source_stamp(loader: Callable[[], Dict]) -> Optional[Tuple[int, int]]:
+    """
+    Return the modification time and size of the file a technique_loader() loader reads.
+    
+    Returns:
+        (mtime in ns, size), or None when the loader's file is not known (any
+        other callable) or cannot be read
+    """
+    if not isinstance(loader, partial) or not loader.args:
+        return None
+    if loader.func is load_technique_file:
+        path = loader.args[0]
+    elif loader.func is load_technique_module:
+        try:
+            spec = importlib.util.find_spec(loader.args[0])
+        except (ImportError, ValueError):
+            return None
+        if spec is None or not spec.has_location:
+            return None
+        path = spec.origin
+    else:
+        return None
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class LazyTechniqueReference:
+    """
+    A technique whose section data is loaded only while it is needed.
+    
+    Only the fields the index and tag pages show are kept. Everything else
+    (rendering, search text) loads a fresh TechniqueReference and releases it
+    afterwards, so a site built from lazy references holds one technique's
+    data at a time. The loader must be picklable (a module-level function or
+    a loader from technique_loader()) for parallel builds.
+    """
+    
+    __slots__ = ("technique_name", "one_line_summary", "keywords", "loader", "_content_hash", "_stamp", "_derived")
+    
+    def __init__(self, technique_name: str, loader: Callable[[], Dict], one_line_summary: Optional[str] = None,
+                 keywords: Optional[Iterable[str]] = None):
+        """
+        Args:
+            technique_name: Name of the technique
+            loader: Function returning the technique's data dictionary
+            one_line_summary: Summary shown on index and tag pages
+            keywords: Keywords shown on index cards and used for tag pages
+        
+        The data is loaded once here when the summary or keywords are omitted.
+        """
+        self.technique_name = technique_name
+        self.loader = loader
+        self._content_hash: Optional[str] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+        # Which of the summary and keywords were read from the data, and are refreshed when it changes
+        self._derived = (one_line_summary is None, keywords is None)
+        self.one_line_summary = one_line_summary
+        self.keywords = _interned(keywords or ())
+        if one_line_summary is None or keywords is None:
+            self._refresh(_source_stamp(loader))
+    
+    def load(self) -> TechniqueReference:
+        """Load the technique's data into a new TechniqueReference."""
+        return create_reference_page(self.technique_name, self.loader())
+    
+    def _refresh(self, stamp: Optional[Tuple[int, int]]):
+        """Load the data to hash it, updating the summary and keywords that were read from it."""
+        ref = self.load()
+        self._content_hash = ref.content_hash()
+        self._stamp = stamp
+        if self._derived[0]:
+            self.one_line_summary = ref.one_line_summary
+        if self._derived[1]:
+            self.keywords = ref.keywords
+    
+    def content_hash(self) -> str:
+        """
+        Return the hash of the technique's data (see TechniqueReference.content_hash).
+        
+        The hash is kept while the loader's source file keeps its modification
+        time and size, so a long-running generator (watch.py) picks up edits.
+        Data from loaders without a known file is loaded and hashed on every call.
+        """
+        stamp = _source_stamp(self.loader)
+        if self._content_hash is None or stamp is None or stamp != self._stamp:
+            self._refresh(stamp)
+        return self._content_hash
+    
+    # TechniqueReference's API, each call on freshly loaded data
+    def document(self) -> TechniqueDocument:
+        return self.load().document()
+    
+    def iter_text(self) -> Iterator[str]:
+        return self.load().iter_text()
+    
+    def search_fields(self) -> Dict[str, List[str]]:
+        return self.load().search_fields()
+    
+    def to_markdown(self) -> str:
+        return self.load().to_markdown()
+    
+    def to_html(self, *args, **kwargs) -> str:
+        return self.load().to_html(*args, **kwargs)
+    
+    def iter_html(self, *args, **kwargs) -> Iterator[str]:
+        return self.load().iter_html(*args, **kwargs)
+    
+    def save(self, output_path: Path):
+        self.load().save(output_path)
+    
+    def save_html(self, *args, **kwargs):
+        self.load().save_html(*args, **kwargs)
+
+
+# Per-process render state for parallel builds, set once by _init_render_worker
+_worker_state: Dict = {}
+
+
+def _init_render_worker(technique_urls: Dict[str, str], base_url: str, cache_size: int,
+                        cache_entries: Dict[str, Tuple[str, List[str]]], profile: bool = False,
+                        highlight_entries: Optional[Dict[str, Optional[str]]] = None):
+    """Process pool initializer: receive the technique URL map and render and highlight caches once per worker."""
+    cache = RenderCache(cache_size)
+    cache.update(cache_entries)
+    cache.take_added()
+    cache.highlight_cache.update(highlight_entries or {})
+    cache.highlight_cache.take_added()
+    _worker_state["technique_urls"] = technique_urls
+    _worker_state["base_url"] = base_url
+    _worker_state["linker"] = CrossLinker(technique_urls, base_url, track_links=True)
+    _worker_state["cache"] = cache
+    _worker_state["profile"] = profile
+
+
+def _partial_path(output_path: Path) -> Path:
+    """Where a page's body is rendered before its tail is appended and it replaces output_path."""
+    return output_path.with_name(output_path.name + PARTIAL_SUFFIX)
+
+
+def _render_page_task(task: tuple) -> tuple:
+    """
+    Render one technique page, without its tail, to its partial file in a worker process.
+    
+    Returns:
+        (outbound links, anchors, link targets, cache hits, cache misses, cache entries added,
+        highlight cache entries added, PageProfile or None) for the page
+    """
+    ref, output_path, url, related, markdown_path = task
+    linker = _worker_state["linker"]
+    cache = _worker_state["cache"]
+    profile = PageProfile(ref.technique_name, output_path.name) if _worker_state["profile"] else None
+    hits, misses = cache.hits, cache.misses
+    page = ref.load()
+    targets = PageTargets(url, _worker_state["base_url"])
+    page.save_html(_partial_path(output_path), _worker_state["technique_urls"], _worker_state["base_url"], linker,
+                   cache, profile, related, tail=False, targets=targets)
+    links = sorted(linker.outbound.pop(ref.technique_name, ()))
+    if markdown_path is not None:
+        write_if_changed(markdown_path, page.to_markdown())
+    return (links, targets.anchors, targets.links, cache.hits - hits, cache.misses - misses, cache.take_added(),
+            cache.highlight_cache.take_added(), profile)
+
+
+MANIFEST_FILENAME = ".build-manifest.json"
+PARTIAL_SUFFIX = ".partial"
+SEARCH_DIRNAME = "search"
+RELATED_CACHE_FILENAME = ".related-cache.json"
+HIGHLIGHT_CACHE_FILENAME = ".highlight-cache.json"
+VALIDATION_CACHE_FILENAME = ".validation-cache.json"
+LINK_GRAPH_FILENAME = "link-graph.json"
+TAG_DIRNAME = "tags"
+TECHNIQUES_PER_TAG_PAGE = 50
+KEYWORDS_PER_FACET_PAGE = 200
+INDEX_DIRNAME = "index"
+TECHNIQUES_PER_INDEX_PAGE = 100
+# Stands in for the base URL while SiteGenerator.generate_targets() renders (a private use character)
+BASE_URL_PLACEHOLDER = "\ue000base\ue000"
+
+# Heading of the single-file book export (SiteGenerator.write_book)
+BOOK_TITLE = "HyperImage Technique Reference"
+# Linked technique pages in book text: page URL and optional fragment
+BOOK_HREF_PATTERN = re.compile(r'href="([^"#]+)(?:#([^"]*))?"')
+
+
+def initial_letter(ref: 'TechniqueReference') -> str:
+    """Index shard key for alphabetical shards: the technique name's first letter, or "#"."""
+    for char in ref.technique_name:
+        if char.isalpha():
+            return char.upper()
+        if char.isalnum():
+            break
+    return "#"
+
+
+class BuildTarget(NamedTuple):
+    """A published copy of the site for SiteGenerator.generate_targets()."""
+    output_dir: Path
+    # Prefix of every generated URL in this copy; "" for links relative to each page
+    base_url: str = ""
+    # Absolute site root for sitemap.xml; defaults to base_url
+    site_url: Optional[str] = None
+
+
+@dataclass
+class BuildReport:
+    """Files touched by a site build, relative to the output directory, and the build profile if one was taken."""
+    
+    written: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    profile: Optional[Dict] = None
+    # Published files "added", "changed" and "removed" (see site_output); set by staged builds
+    delta: Optional[Dict[str, List[str]]] = None
+    # Broken internal links, anchors and duplicate URLs found in the site manifest (see site_map)
+    link_problems: List[LinkProblem] = field(default_factory=list)
+
+
+class SiteGenerator:
+    """Generate a complete HTML site with interlinked technique pages."""
+    
+    def __init__(self, output_dir: Path = Path("site"), base_url: str = "",
+                 render_cache: Optional[RenderCache] = None, related_count: int = DEFAULT_TOP_K,
+                 index_page_size: int = TECHNIQUES_PER_INDEX_PAGE,
+                 index_shard: Optional[Callable[[TechniqueReference], str]] = None, precompress: bool = False,
+                 staging: bool = True, site_url: Optional[str] = None, markdown_dir: Optional[Path] = None):
+        """
+        Args:
+            output_dir: Directory the site is written to
+            base_url: Prefix prepended to every generated URL
+            render_cache: Cache of rendered sections shared across builds; pass a
+                RenderCache with a path to persist it. Defaults to an in-memory cache.
+                Its highlight cache (see highlight.py) is persisted in output_dir
+                unless it has a path.
+            related_count: Number of related techniques listed on each page; 0 disables
+                the list. Requires numpy and scipy.
+            index_page_size: Technique cards per index listing page
+            index_shard: Splits the index into shards: maps a technique to its shard label,
+                e.g. initial_letter for alphabetical shards or a function returning a
+                category. The index is one paginated listing when omitted.
+            precompress: Write .gz (and, with brotli installed, .br) siblings of every
+                HTML, CSS, JS and JSON output for static hosting. Off by default since
+                compression dominates a full build; enable it for builds that are deployed.
+            staging: Build into a staging copy of output_dir and swap it in when the
+                build completes (see generate_all_pages)
+            site_url: Absolute URL of the published site root used in sitemap.xml;
+                defaults to base_url
+            markdown_dir: Directory to also write each technique's markdown page to
+                (see to_markdown), from the same pass that renders its HTML page
+        """
+        self.output_dir = Path(output_dir)
+        self.base_url = base_url
+        self.techniques: Dict[str, Union[TechniqueReference, LazyTechniqueReference]] = {}
+        self.technique_urls: Dict[str, str] = {}
+        self.render_cache = render_cache if render_cache is not None else RenderCache()
+        self.related_count = related_count
+        self.index_page_size = index_page_size
+        self.index_shard = index_shard
+        self.precompress = precompress
+        self.staging = staging
+        self.site_url = site_url
+        self.markdown_dir = Path(markdown_dir) if markdown_dir is not None else None
+        self.validation_cache = ValidationCache()
+        # Validation cache key of each technique added by add_techniques()
+        self._validation_keys: Dict[str, str] = {}
+    
+    def add_technique(self, technique_name: str, data: Union[Dict, TechniqueSource],
+                      one_line_summary: Optional[str] = None, keywords: Optional[Iterable[str]] = None):
+        """
+        Add a technique to the site.
+        
+        Args:
+            technique_name: Name of the technique
+            data: The technique's data dictionary, or where to load it from: a module
+                name, file path or callable (see technique_loader). Loaded techniques
+                are kept as LazyTechniqueReference and their data is read only while
+                a build needs it, so memory does not grow with the catalog.
+            one_line_summary: For loaded techniques, the summary shown on index and tag pages
+            keywords: For loaded techniques, their keywords. When the summary or
+                keywords are omitted, the data is loaded once to read them.
+        """
+        if isinstance(data, dict):
+            ref = create_reference_page(technique_name, data)
+        else:
+            ref = LazyTechniqueReference(technique_name, technique_loader(data), one_line_summary, keywords)
+        self._add_reference(ref)
+    
+    def add_techniques(self, techniques: Dict[str, Union[Dict, TechniqueSource]], workers: int = 1):
+        """
+        Add several techniques, validating all their data before any is added.
+        
+        Data dictionaries are checked against TECHNIQUE_SCHEMA in one batch
+        (see schema.validate_catalog), over `workers` processes. Results are
+        cached by a hash of their data and kept in output_dir between builds,
+        so unchanged techniques are not revalidated. Sources (see
+        add_technique) are validated when they are loaded.
+        
+        Raises:
+            TechniqueValidationError: listing every problem in the catalog with its
+                technique and field path; no technique is added
+        """
+        if not len(self.validation_cache):
+            self.validation_cache.load(self.output_dir / VALIDATION_CACHE_FILENAME)
+        catalog = {name: data for name, data in techniques.items() if isinstance(data, dict)}
+        errors, keys = validate_catalog(catalog, TECHNIQUE_SCHEMA, workers, self.validation_cache)
+        if errors:
+            raise TechniqueValidationError(errors)
+        self._validation_keys.update(keys)
+        for technique_name, data in techniques.items():
+            if isinstance(data, dict):
+                self._add_reference(create_reference_page(technique_name, data, validate=False))
+            else:
+                self.add_technique(technique_name, data)
+    
+    def _add_reference(self, ref: Union[TechniqueReference, LazyTechniqueReference]):
+        self.techniques[ref.technique_name] = ref
+        filename = f"{technique_filename(ref.technique_name)}.html"
+        self.technique_urls[ref.technique_name] = filename
+    
+    def generate_all_pages(self, incremental: bool = False, workers: int = 1,
+                           profile: Optional[Path] = None) -> BuildReport:
+        """
+        Generate all HTML pages for the site.
+        
+        Args:
+            incremental: Skip pages whose inputs are unchanged since the last build,
+                as recorded in the build manifest in the output directory
+            workers: Number of processes used to render technique pages; 1 renders serially.
+                Output is identical either way.
+            profile: Path to write a JSON build profile to: phase and per-page timings,
+                bytes written, regex and cache counters, and the slowest pages.
+                Builds without a profile path are not instrumented.
+        
+        Files whose bytes do not change are never rewritten, so they keep their
+        mtimes. With staging enabled, the build runs in a hard-linked copy of
+        the output directory that replaces it atomically once complete (output_dir
+        becomes a symbolic link to the current release; see site_output) and is
+        discarded if the build fails, and the files added, changed and removed
+        are written to DELTA_FILENAME for deploy jobs.
+        
+        Every page is recorded in SITE_MANIFEST_FILENAME with its title,
+        anchors and internal links (see site_map), pages are listed in
+        SITEMAP_FILENAME, and the links are checked from those records.
+        
+        Returns:
+            BuildReport listing the files written, skipped and removed, render cache hits and
+            misses, link problems and (when staging) the deploy delta
+        """
+        build_profile = BuildProfile() if profile is not None else None
+        phase = build_profile.phase if build_profile is not None else (lambda name: nullcontext())
+        report = BuildReport()
+        
+        # Build into a hard-linked copy of the site, so the published site never shows a partial build
+        output_dir = self.output_dir
+        if self.staging:
+            with phase("staging"):
+                self.output_dir = stage_directory(output_dir)
+        try:
+            self._build(report, incremental, workers, build_profile, phase)
+        except BaseException:
+            if self.staging:
+                discard_staging(self.output_dir)
+            raise
+        finally:
+            staging_dir, self.output_dir = self.output_dir, output_dir
+        if self.staging:
+            with phase("publish"):
+                report.delta = publish_directory(staging_dir, output_dir)
+        
+        if build_profile is not None:
+            cache = self.render_cache
+            build_profile.cache = {"hits": report.cache_hits, "misses": report.cache_misses, "entries": len(cache)}
+            report.profile = build_profile.report()
+            build_profile.write(profile)
+        return report
+    
+    def generate_targets(self, targets: Iterable[BuildTarget], incremental: bool = False, workers: int = 1,
+                         profile: Optional[Path] = None) -> Dict[Path, BuildReport]:
+        """
+        Render the site once and publish it under several base URLs.
+        
+        Pages are rendered into output_dir with BASE_URL_PLACEHOLDER as their
+        base URL, as by generate_all_pages() but without staging or
+        precompression, so markdown conversion, cross-linking and the indexes
+        run once whatever the number of targets. Each target is then emitted
+        from that render by substituting its base URL (see
+        site_output.rebase_directory), writing only the files whose bytes
+        change, and is precompressed and published like a generate_all_pages()
+        build with that base_url, whose output it matches. (An empty base URL
+        becomes the path to the site root from each file's own directory, as
+        in pages rendered with it; see site_output.relative_root.)
+        
+        Args:
+            targets: Where to publish the site and the base URL of each copy
+            incremental, workers, profile: As for generate_all_pages(), applied to the render
+        
+        Returns:
+            The render's BuildReport under output_dir, with cache counters, link
+            problems and profile, and one per target output directory listing the
+            files it had written, skipped and removed and its deploy delta
+        """
+        settings = self.base_url, self.site_url, self.staging, self.precompress
+        self.base_url, self.site_url, self.staging, self.precompress = BASE_URL_PLACEHOLDER, None, False, False
+        try:
+            render = self.generate_all_pages(incremental, workers, profile)
+        finally:
+            self.base_url, self.site_url, self.staging, self.precompress = settings
+        
+        reports = {self.output_dir: render}
+        pages = load_site_manifest(self.output_dir)
+        for target in targets:
+            output_dir = Path(target.output_dir)
+            target_dir = stage_directory(output_dir) if self.staging else output_dir
+            overrides = {SITEMAP_FILENAME: sitemap_xml(pages, target.site_url)} if target.site_url is not None else {}
+            try:
+                files = rebase_directory(self.output_dir, target_dir, BASE_URL_PLACEHOLDER, target.base_url,
+                                         overrides)
+                if self.precompress:
+                    precompress_directory(target_dir, None if workers <= 1 else workers)
+            except BaseException:
+                if self.staging:
+                    discard_staging(target_dir)
+                raise
+            report = BuildReport(files["written"], files["skipped"], files["removed"],
+                                 link_problems=render.link_problems)
+            if self.staging:
+                report.delta = publish_directory(target_dir, output_dir)
+            reports[output_dir] = report
+        return reports
+    
+    def _root(self, url: str) -> str:
+        """
+        Return the prefix of links on the page at url: base_url, or the path back to the site root.
+        
+        Technique pages and index.html sit in the root, so their prefix is base_url itself.
+        """
+        return self.base_url or relative_root(url)
+    
+    def _markdown_path(self, technique_name: str) -> Path:
+        """Where a technique's markdown page is written, next to the other pages in markdown_dir."""
+        return self.markdown_dir / Path(self.technique_urls[technique_name]).with_suffix(".md")
+
+    def _build(self, report: BuildReport, incremental: bool, workers: int,
+               build_profile: Optional[BuildProfile], phase: Callable):
+        """Run every build phase of generate_all_pages() against self.output_dir, filling in report."""
+        # Create output directory structure
+        (self.output_dir / "assets").mkdir(parents=True, exist_ok=True)
+        
+        with phase("stale_check"):
+            previous = self.load_manifest() if incremental else {}
+            # Highlighted markup changes with Pygments, so a new version re-renders every page like a template change
+            if (previous.get("template_version") != TEMPLATE_VERSION
+                    or previous.get("highlight_version") != HIGHLIGHT_VERSION
+                    or previous.get("base_url") != self.base_url):
+                previous = {}
+            previous_pages = previous.get("pages", {})
             
-            <section id="protocol" class="section">
-                <h2>Step-by-step Measurement Protocol</h2>"""
-        
-        for section_name, steps in self.measurement_protocol.items():
-            html_content += f"""
-                <h3>{html.escape(section_name.title())}</h3>
-                <ol>"""
-            for step in steps:
-                html_content += f"""
-                    <li>{markdown_to_html(step)}</li>"""
-            html_content += """
-                </ol>"""
-        
-        html_content += f"""
-            </section>
+            # Loading a lazy technique validates it; report every invalid one before rendering
+            input_hashes = {}
+            errors: List[SchemaError] = []
+            for technique_name, ref in self.techniques.items():
+                try:
+                    input_hashes[technique_name] = ref.content_hash()
+                except TechniqueValidationError as error:
+                    errors.extend(error.errors)
+            if errors:
+                raise TechniqueValidationError(errors)
+            stale = self._stale_pages(previous, input_hashes)
+            search_hash = self._search_hash(input_hashes)
+            search_current = (previous.get("search") == search_hash
+                              and (self.output_dir / SEARCH_DIRNAME / "meta.json").exists()
+                              and (self.output_dir / SEARCH_SCRIPT_URL).exists())
             
-            <section id="data-outputs" class="section">
-                <h2>Data Outputs & File Formats</h2>
-                {markdown_to_html(self.data_outputs)}
-            </section>
+            keyword_index = self.build_keyword_index()
+            tags_hash = self._tags_hash()
+            tags_current = (previous.get("tags") == tags_hash
+                            and (self.output_dir / TAG_DIRNAME / "index.html").exists())
+        
+        # Tokenize each technique once for the search index and related techniques. This cannot share the
+        # render loop: every page lists its related techniques, which TF-IDF can only rank once every
+        # technique's weights are known, and the search index covers skipped pages too. Eager references
+        # keep the document tree built here for rendering; lazy ones are loaded again by the render loop.
+        with phase("analysis"):
+            search = None if search_current else SearchIndexBuilder()
+            related_hash = self._related_hash(input_hashes)
+            related = self._load_related(related_hash)
+            similarity = None
+            if related is None and self.related_count > 0 and related_available():
+                similarity = RelatedTechniques()
+            if search is not None or similarity is not None:
+                for technique_name, ref in self.techniques.items():
+                    weights = field_weights(ref.search_fields())
+                    if search is not None:
+                        search.add_weights(technique_name, self.technique_urls[technique_name],
+                                           ref.one_line_summary, weights)
+                    if similarity is not None:
+                        similarity.add(technique_name, weights)
+            if related is None:
+                related = similarity.compute(self.related_count) if similarity is not None else {}
+                self._save_related(related_hash, related)
             
-            <section id="analysis" class="section">
-                <h2>Data Analysis Pipeline</h2>"""
+            page_related = {name: [[other, self.technique_urls[other]] for other in related.get(name, [])]
+                            for name in self.techniques}
+            for technique_name, entry in previous_pages.items():
+                if technique_name in page_related and entry.get("related", []) != page_related[technique_name]:
+                    stale.add(technique_name)
         
-        for section_name, content in self.data_analysis_pipeline.items():
-            html_content += f"""
-                <h3>{html.escape(section_name.replace('_', ' ').title())}</h3>
-                {markdown_to_html(content)}"""
+        # Generate individual technique pages
+        cache = self.render_cache
+        hits, misses = cache.hits, cache.misses
+        # Highlighted code blocks are kept in the output directory unless their cache has a path of its own
+        highlights = cache.highlight_cache
+        if highlights.path is None and not len(highlights):
+            highlights.load(self.output_dir / HIGHLIGHT_CACHE_FILENAME)
+        to_render = [name for name in self.techniques if name in stale]
+        with phase("pages"):
+            if workers > 1 and len(to_render) > 1:
+                rendered_links, rendered_targets = self._render_pages_parallel(to_render, workers, build_profile,
+                                                                               page_related)
+            else:
+                # Build the cross-link pattern once for every page in this build
+                linker = CrossLinker(self.technique_urls, self.base_url, track_links=True)
+                rendered_links = {}
+                rendered_targets = {}
+                for technique_name in to_render:
+                    filename = self.technique_urls[technique_name]
+                    page_profile = PageProfile(technique_name, filename) if build_profile is not None else None
+                    page = self.techniques[technique_name].load()
+                    targets = PageTargets(filename, self.base_url)
+                    page.save_html(_partial_path(self.output_dir / filename), self.technique_urls, self.base_url,
+                                   linker, cache, page_profile, page_related[technique_name], tail=False,
+                                   targets=targets)
+                    rendered_links[technique_name] = sorted(linker.outbound.get(technique_name, ()))
+                    if self.markdown_dir is not None:
+                        write_if_changed(self._markdown_path(technique_name), page.to_markdown())
+                    rendered_targets[technique_name] = (targets.anchors, targets.links)
+                    if page_profile is not None:
+                        page_profile.links = len(rendered_links[technique_name])
+                        build_profile.add_page(page_profile)
+        report.cache_hits = cache.hits - hits
+        report.cache_misses = cache.misses - misses
+        with phase("cache_save"):
+            cache.save()
+            if highlights.path is None:
+                highlights.save(self.output_dir / HIGHLIGHT_CACHE_FILENAME)
+            if self._validation_keys:
+                keys = [self._validation_keys[name] for name in self.techniques if name in self._validation_keys]
+                self.validation_cache.save(self.output_dir / VALIDATION_CACHE_FILENAME, keys)
         
-        html_content += f"""
-            </section>
-            
-            <section id="troubleshooting" class="section">
-                <h2>Common Instrument Artifacts & Troubleshooting</h2>
-                {markdown_to_html(self.artifacts_troubleshooting)}
-            </section>
-            
-            <section id="multimodal" class="section">
-                <h2>Typical Multimodal Pairings</h2>
-                {markdown_to_html(self.multimodal_pairings)}
-            </section>
+        # Backlinks come from the links recorded while pages rendered, or from the
+        # manifest for skipped pages. Rendered bodies get their tail appended now;
+        # a skipped page gets a new tail if its backlinks changed.
+        with phase("links"):
+            outbound = {name: rendered_links[name] if name in rendered_links else previous_pages[name]["links"]
+                        for name in self.techniques}
+            inbound = backlinks(outbound)
+            pages = {}
+            records = []
+            for technique_name in self.techniques:
+                filename = self.technique_urls[technique_name]
+                output_path = self.output_dir / filename
+                referenced_by = inbound.get(technique_name, [])
+                rendered = technique_name in rendered_links
+                if rendered:
+                    body_bytes = _partial_path(output_path).stat().st_size
+                else:
+                    body_bytes = previous_pages[technique_name]["body"]
+                if rendered or previous_pages[technique_name]["referenced_by"] != referenced_by:
+                    self._finish_page(output_path, body_bytes, referenced_by, rendered)
+                    report.written.append(filename)
+                else:
+                    report.skipped.append(filename)
+                if rendered:
+                    anchors, hrefs = rendered_targets[technique_name]
+                else:
+                    anchors, hrefs = previous_pages[technique_name]["anchors"], previous_pages[technique_name]["hrefs"]
+                pages[technique_name] = {"file": filename, "input": input_hashes[technique_name],
+                                         "links": outbound[technique_name], "related": page_related[technique_name],
+                                         "body": body_bytes, "referenced_by": referenced_by,
+                                         "anchors": anchors, "hrefs": hrefs}
+                records.append(self._page_record(pages[technique_name], technique_name))
             
-            <section id="strengths-limitations" class="section">
-                <h2>Strengths & Limitations</h2>
-                <h3>Strengths</h3>
-                <ul>"""
+            link_graph_hash = self._link_graph_hash(outbound)
+            if previous.get("link_graph") == link_graph_hash and (self.output_dir / LINK_GRAPH_FILENAME).exists():
+                report.skipped.append(LINK_GRAPH_FILENAME)
+            else:
+                self.write_link_graph(outbound)
+                report.written.append(LINK_GRAPH_FILENAME)
         
-        for strength in self.strengths_limitations.get("strengths", []):
-            html_content += f"""
-                    <li>{markdown_to_html(strength)}</li>"""
+        # Remove pages of techniques that are no longer part of the site
+        current_files = set(self.technique_urls.values())
+        for technique_name, entry in previous_pages.items():
+            if technique_name not in self.techniques and entry["file"] not in current_files:
+                stale_path = self.output_dir / entry["file"]
+                if stale_path.exists():
+                    stale_path.unlink()
+                    report.removed.append(entry["file"])
+                if self.markdown_dir is not None:
+                    markdown_path = self.markdown_dir / Path(entry["file"]).with_suffix(".md")
+                    if markdown_path.exists():
+                        markdown_path.unlink()
         
-        html_content += """
-                </ul>
-                <h3>Limitations</h3>
-                <ul>"""
+        # Skipped listings keep the page records of the build that wrote them
+        previous_records = {}
+        if previous:
+            for record in load_site_manifest(self.output_dir):
+                previous_records.setdefault(record.kind, []).append(record)
         
-        for limitation in self.strengths_limitations.get("limitations", []):
-            html_content += f"""
-                    <li>{markdown_to_html(limitation)}</li>"""
+        # Generate index page
+        with phase("index"):
+            index_hash = self._index_hash()
+            if (previous.get("index") == index_hash and (self.output_dir / "index.html").exists()
+                    and (self.output_dir / INDEX_DIRNAME / "manifest.json").exists() and "index" in previous_records):
+                records.extend(previous_records["index"])
+                report.skipped.append("index.html")
+            else:
+                self.generate_index(keyword_index, records)
+                report.written.append("index.html")
         
-        html_content += """
-                </ul>
-            </section>
-            
-            <section id="references" class="section">
-                <h2>Representative References</h2>
-                <ul class="references">"""
+        # Generate keyword facet and tag pages
+        with phase("tags"):
+            if tags_current and "tags" in previous_records:
+                records.extend(previous_records["tags"])
+                report.skipped.append(f"{TAG_DIRNAME}/")
+            else:
+                self.generate_tag_pages(keyword_index, records)
+                report.written.append(f"{TAG_DIRNAME}/")
         
-        for ref in self.references:
-            citation = ref.get("citation", "")
-            doi = ref.get("doi", "")
-            if doi:
-                html_content += f"""
-                    <li>{html.escape(citation)} <a href="https://doi.org/{doi}" target="_blank" rel="noopener">DOI: {doi}</a></li>"""
+        # Write the search index and its script
+        with phase("search"):
+            if search is None:
+                report.skipped.append(f"{SEARCH_DIRNAME}/")
             else:
-                html_content += f"""
-                    <li>{html.escape(citation)}</li>"""
+                files = search.write(self.output_dir / SEARCH_DIRNAME)
+                for kind in ("written", "skipped", "removed"):
+                    getattr(report, kind).extend(f"{SEARCH_DIRNAME}/{name}" for name in files[kind])
+                # The script's file name changes with its content
+                if (self.output_dir / SEARCH_SCRIPT_URL).exists():
+                    report.skipped.append(SEARCH_SCRIPT_URL)
+                else:
+                    write_asset(self.output_dir, "assets/search.js", SEARCH_SCRIPT)
+                    report.written.append(SEARCH_SCRIPT_URL)
         
-        html_content += """
-                </ul>
-            </section>
-            
-            <section id="checklist" class="section">
-                <h2>Lab Checklist</h2>
-                <div class="checklist">"""
+        # Generate CSS (its file name changes with its content)
+        with phase("css"):
+            if (self.output_dir / STYLE_URL).exists():
+                report.skipped.append(STYLE_URL)
+            else:
+                self.generate_css()
+                report.written.append(STYLE_URL)
         
-        for i, item in enumerate(self.lab_checklist, 1):
-            html_content += f"""
-                    <label class="checklist-item">
-                        <input type="checkbox">
-                        <span>{html.escape(item)}</span>
-                    </label>"""
+        # Record every page with its anchors and links, list the pages for search engines and check the links
+        with phase("sitemap"):
+            records.extend(PageRecord(url, "", "asset", [], []) for url in (STYLE_URL, SEARCH_SCRIPT_URL))
+            for filename, changed in ((SITE_MANIFEST_FILENAME, write_site_manifest(self.output_dir, records)),
+                                      (SITEMAP_FILENAME, write_sitemap(self.output_dir, records,
+                                                                       self.site_url or self.base_url))):
+                (report.written if changed else report.skipped).append(filename)
+            report.link_problems = check_links(records)
         
-        html_content += """
-                </div>
-            </section>
-            
-            <section id="keywords" class="section">
-                <h2>Keywords & Tags</h2>
-                <div class="keywords">"""
+        # Write .gz/.br siblings of the outputs written since they were last compressed
+        if self.precompress:
+            with phase("compress"):
+                precompress_directory(self.output_dir, None if workers <= 1 else workers)
         
-        for keyword in self.keywords:
-            html_content += f"""
-                    <span class="keyword-tag">{html.escape(keyword)}</span>"""
+        with phase("manifest"):
+            self.save_manifest({
+                "template_version": TEMPLATE_VERSION,
+                "highlight_version": HIGHLIGHT_VERSION,
+                "base_url": self.base_url,
+                "urls": self.technique_urls,
+                "pages": pages,
+                "index": index_hash,
+                "search": search_hash,
+                "tags": tags_hash,
+                "link_graph": link_graph_hash,
+            })
+
+    def _render_pages_parallel(self, technique_names: List[str], workers: int,
+                               build_profile: Optional[BuildProfile] = None,
+                               page_related: Optional[Dict[str, List[List[str]]]] = None) -> tuple:
+        """
+        Render technique pages across a process pool.
         
-        html_content += """
-                </div>
-            </section>
-        </article>
-    </main>
+        Returns:
+            (outbound links, (anchors, link targets)) of each page, by technique name
+        
+        Workers start from a copy of the render cache and send back the
+        entries they add, which are merged into this generator's cache.
+        """
+        cache = self.render_cache
+        page_related = page_related or {}
+        tasks = [(self.techniques[name], self.output_dir / self.technique_urls[name], self.technique_urls[name],
+                  page_related.get(name), self._markdown_path(name) if self.markdown_dir is not None else None)
+                 for name in technique_names]
+        chunksize = max(1, len(tasks) // (workers * 4))
+        rendered_links = {}
+        rendered_targets = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                                 initargs=(self.technique_urls, self.base_url, cache.max_entries,
+                                           dict(cache._entries), build_profile is not None,
+                                           dict(cache.highlight_cache._entries))) as executor:
+            results = executor.map(_render_page_task, tasks, chunksize=chunksize)
+            for technique_name, (links, anchors, hrefs, hits, misses, added, highlighted,
+                                 page_profile) in zip(technique_names, results):
+                rendered_links[technique_name] = links
+                rendered_targets[technique_name] = (anchors, hrefs)
+                if page_profile is not None:
+                    page_profile.links = len(links)
+                    build_profile.add_page(page_profile)
+                cache.hits += hits
+                cache.misses += misses
+                cache.update(added)
+                cache.highlight_cache.update(highlighted)
+        return rendered_links, rendered_targets
     
-    <footer class="footer">
-        <p>&copy; 2024 HyperImage Framework. Scientific analysis techniques for conservation science.</p>
-    </footer>
-</body>
-</html>"""
+    def _finish_page(self, output_path: Path, body_bytes: int, referenced_by: List[str], rendered: bool):
+        """
+        Complete a page with its tail, replacing the page only if its bytes change.
         
-        return html_content
+        The body is the freshly rendered partial file when rendered is true,
+        otherwise the first body_bytes bytes of the existing page.
+        """
+        partial_path = _partial_path(output_path)
+        if not rendered:
+            with output_path.open('rb') as source:
+                partial_path.write_bytes(source.read(body_bytes))
+        tail = self._page_tail(referenced_by)
+        with partial_path.open('ab') as f:
+            f.write(tail.encode('utf-8'))
+        replace_if_changed(partial_path, output_path)
     
-    def save(self, output_path: Path):
-        """Save the reference page to a markdown file."""
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(self.to_markdown(), encoding='utf-8')
+    def _page_tail(self, referenced_by: List[str]) -> str:
+        return page_tail_html(self.base_url, [(name, self.technique_urls[name]) for name in referenced_by])
     
-    def save_html(self, output_path: Path, all_techniques: Optional[Dict[str, str]] = None, base_url: str = ""):
-        """Save the reference page as an HTML file."""
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        html_content = self.to_html(all_techniques, base_url)
-        output_path.write_text(html_content, encoding='utf-8')
+    def _page_record(self, entry: Dict, technique_name: str) -> PageRecord:
+        """
+        Describe a technique page for the site manifest.
+        
+        The body's ids and link targets were collected while it rendered and
+        are kept in its build manifest entry; the tail's are collected here,
+        since it is rewritten whenever the page's backlinks change.
+        """
+        anchors, links = page_targets(entry["file"], self._page_tail(entry["referenced_by"]), self.base_url)
+        return PageRecord(entry["file"], technique_name, "technique", entry["anchors"] + anchors,
+                          entry["hrefs"] + links)
     
-    @classmethod
-    def from_dict(cls, data: Dict) -> 'TechniqueReference':
-        """Create a TechniqueReference from a dictionary."""
-        return cls(**data)
-
-
-def create_reference_page(technique_name: str, data: Dict) -> TechniqueReference:
-    """
-    Create a reference page from technique name and data dictionary.
+    def write_link_graph(self, outbound: Dict[str, List[str]]) -> Path:
+        """
+        Write the site's cross-link graph as JSON.
+        
+        The graph is stored as sparse adjacency lists: "techniques" holds
+        [name, url] pairs in name order and "links" holds, for each of them,
+        the indices of the techniques its page links to.
+        
+        Args:
+            outbound: Technique name -> names of the techniques its page links to
+        
+        Returns:
+            Path of the written file
+        """
+        names = sorted(self.techniques)
+        index = {name: number for number, name in enumerate(names)}
+        graph = {
+            "techniques": [[name, self.technique_urls[name]] for name in names],
+            "links": [sorted(index[target] for target in outbound.get(name, ()) if target in index)
+                      for name in names],
+        }
+        graph_path = self.output_dir / LINK_GRAPH_FILENAME
+        write_if_changed(graph_path, json.dumps(graph, ensure_ascii=False, separators=(',', ':')))
+        return graph_path
     
-    Args:
-        technique_name: Name of the technique
-        data: Dictionary containing all section data
+    def _link_graph_hash(self, outbound: Dict[str, List[str]]) -> str:
+        """Hash everything the link graph file is written from."""
+        entries = [(name, self.technique_urls[name], outbound.get(name, [])) for name in sorted(self.techniques)]
+        payload = json.dumps(entries, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
     
-    Returns:
-        TechniqueReference object
-    """
-    return TechniqueReference(technique_name=technique_name, **data)
-
-
-def generate_page(technique_name: str, data: Dict, output_dir: Path = Path("output")) -> Path:
-    """
-    Generate and save a reference page.
+    def _stale_pages(self, previous: Dict, input_hashes: Dict[str, str]) -> Set[str]:
+        """
+        Decide which technique pages must be re-rendered.
+        
+        A page is stale when its own data, file name or output files changed,
+        when it linked to a technique that was removed or moved, or when a
+        technique added since the last build is mentioned in its text.
+        """
+        previous_pages = previous.get("pages", {})
+        previous_urls = previous.get("urls", {})
+        if not previous_pages:
+            return set(self.techniques)
+        
+        added = {name: url for name, url in self.technique_urls.items() if previous_urls.get(name) != url}
+        dropped = {name for name, url in previous_urls.items() if self.technique_urls.get(name) != url}
+        added_linker = CrossLinker(added) if added else None
+        
+        stale = set()
+        for technique_name, ref in self.techniques.items():
+            old = previous_pages.get(technique_name)
+            filename = self.technique_urls[technique_name]
+            if (old is None or old["input"] != input_hashes[technique_name] or old["file"] != filename
+                    or "anchors" not in old or not (self.output_dir / filename).exists()
+                    or (self.markdown_dir is not None and not self._markdown_path(technique_name).exists())):
+                stale.add(technique_name)
+            elif dropped.intersection(old["links"]):
+                stale.add(technique_name)
+            elif added_linker and added_linker.mentions(html.escape("\n".join(ref.iter_text())), technique_name):
+                stale.add(technique_name)
+        return stale
     
-    Args:
-        technique_name: Name of the technique
-        data: Dictionary containing all section data
-        output_dir: Directory to save the output file
+    def _related_hash(self, input_hashes: Dict[str, str]) -> str:
+        """Hash everything the related-techniques lists are computed from."""
+        payload = json.dumps([RELATED_VERSION, self.related_count, related_available(), sorted(input_hashes.items())],
+                             ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
     
-    Returns:
-        Path to the generated file
-    """
-    ref = create_reference_page(technique_name, data)
-    output_path = output_dir / f"{technique_name.lower().replace(' ', '_')}.md"
-    ref.save(output_path)
-    return output_path
-
-
-class SiteGenerator:
-    """Generate a complete HTML site with interlinked technique pages."""
+    def _load_related(self, related_hash: str) -> Optional[Dict[str, List[str]]]:
+        """Return related techniques cached for related_hash in the output directory, or None."""
+        cache_path = self.output_dir / RELATED_CACHE_FILENAME
+        try:
+            cached = json.loads(cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        return cached["related"] if cached.get("corpus") == related_hash else None
     
-    def __init__(self, output_dir: Path = Path("site"), base_url: str = ""):
-        self.output_dir = Path(output_dir)
-        self.base_url = base_url
-        self.techniques: Dict[str, TechniqueReference] = {}
-        self.technique_urls: Dict[str, str] = {}
+    def _save_related(self, related_hash: str, related: Dict[str, List[str]]):
+        """Cache related techniques for related_hash in the output directory."""
+        cache_path = self.output_dir / RELATED_CACHE_FILENAME
+        write_if_changed(cache_path, json.dumps({"corpus": related_hash, "related": related}, ensure_ascii=False))
     
-    def add_technique(self, technique_name: str, data: Dict):
-        """Add a technique to the site."""
-        ref = create_reference_page(technique_name, data)
-        self.techniques[technique_name] = ref
-        filename = f"{technique_name.lower().replace(' ', '_')}.html"
-        self.technique_urls[technique_name] = filename
+    def _search_hash(self, input_hashes: Dict[str, str]) -> str:
+        """Hash everything the search index is built from."""
+        entries = [(name, self.technique_urls[name], input_hashes[name]) for name in self.techniques]
+        payload = json.dumps([SEARCH_INDEX_VERSION, entries], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
     
-    def generate_all_pages(self):
-        """Generate all HTML pages for the site."""
-        # Create output directory structure
-        (self.output_dir / "assets").mkdir(parents=True, exist_ok=True)
+    def _tags_hash(self) -> str:
+        """Hash everything the keyword pages render."""
+        entries = [(name, self.technique_urls[name], ref.one_line_summary, ref.keywords)
+                   for name, ref in sorted(self.techniques.items())]
+        payload = json.dumps(entries, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def _index_hash(self) -> str:
+        """Hash everything the index pages render."""
+        cards = [(name, self.technique_urls[name], ref.one_line_summary, ref.keywords[:5])
+                 for name, ref in sorted(self.techniques.items())]
+        payload = json.dumps([self.index_page_size, self._index_shards(), cards], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def load_manifest(self) -> Dict:
+        """Load the build manifest from the output directory, or {} if there is none."""
+        manifest_path = self.output_dir / MANIFEST_FILENAME
+        if not manifest_path.exists():
+            return {}
+        try:
+            return json.loads(manifest_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+    
+    def save_manifest(self, manifest: Dict):
+        """Write the build manifest to the output directory."""
+        manifest_path = self.output_dir / MANIFEST_FILENAME
+        write_if_changed(manifest_path, json.dumps(manifest, indent=2, sort_keys=True, ensure_ascii=False))
+    
+    def generate_index(self, keyword_index: Optional[KeywordIndex] = None,
+                       records: Optional[List[PageRecord]] = None) -> List[str]:
+        """
+        Generate the index page, its technique listing pages and the index manifest.
         
-        # Generate individual technique pages
-        for technique_name, ref in self.techniques.items():
-            filename = self.technique_urls[technique_name]
-            output_path = self.output_dir / filename
-            ref.save_html(output_path, self.technique_urls, self.base_url)
+        Techniques are listed by name, index_page_size cards per page. Without
+        index_shard, index.html shows the first page and the rest are
+        index/page-N.html; with it, index.html links to each shard, whose
+        pages are index/<shard>/index.html and index/<shard>/page-N.html.
+        index/manifest.json lists every listing page with its first and last
+        technique for client-side paging. Cards are streamed to disk one at a
+        time, and listing pages left over from earlier builds are removed.
         
-        # Generate index page
-        self.generate_index()
+        Args:
+            keyword_index: Keyword facets used to link card keywords to their tag pages;
+                built from the techniques when omitted
+            records: List the site manifest records of the pages written are appended to
+        
+        Returns:
+            Paths of the files written, relative to the output directory
+        """
+        if keyword_index is None:
+            keyword_index = self.build_keyword_index()
+        page_size = max(1, self.index_page_size)
+        shards = self._index_shards()
+        written: List[str] = []
+        
+        def write(url: str, chunks: Iterable[str], title: str):
+            targets = PageTargets(url, self.base_url)
+            with open_if_changed(self.output_dir / Path(*url.split("/"))) as f:
+                for chunk in chunks:
+                    f.write(targets.feed(chunk))
+            written.append(url)
+            if records is not None:
+                records.append(PageRecord(url, title, "index", targets.anchors, targets.links))
         
-        # Generate CSS
-        self.generate_css()
+        def cards(names: List[str], root: str) -> Iterator[str]:
+            for technique_name in names:
+                yield self._index_card(technique_name, keyword_index, root)
+        
+        manifest_shards = []
+        for slug, label, names in shards:
+            pages = [names[start:start + page_size] for start in range(0, len(names), page_size)] or [[]]
+            manifest_shards.append({
+                "slug": slug,
+                "label": label,
+                "count": len(names),
+                "pages": [{"url": self._index_page_url(slug, number), "first": page[0] if page else "",
+                           "last": page[-1] if page else ""} for number, page in enumerate(pages, 1)],
+            })
+            for number, page in enumerate(pages, 1):
+                if not slug and number == 1:
+                    # The first page of an unsharded listing is index.html itself
+                    continue
+                root = self._root(self._index_page_url(slug, number))
+                url_for = lambda n, slug=slug: self._index_page_url(slug, n)
+                title = f"Techniques: {label}" if slug else "Techniques"
+                heading = label if slug else "Available Techniques"
+                count = len(names)
+                write(self._index_page_url(slug, number), self._iter_listing_page(
+                    title, root, heading,
+                    f"{count} technique{'s' if count != 1 else ''}" + (f", page {number}" if len(pages) > 1 else ""),
+                    [self._index_shard_nav(shards, slug, root) if slug else "", """
+        <section class="section">
+            <div class="technique-grid">""", cards(page, root), """
+            </div>
+        </section>""", self._pagination_html(number, len(pages), lambda n: root + url_for(n))]),
+                      f"{title} - HyperImage")
+        
+        write("index.html", self._iter_index_page(shards, keyword_index, page_size),
+              "HyperImage - Scientific Analysis Techniques")
+        
+        manifest_url = f"{INDEX_DIRNAME}/manifest.json"
+        write_if_changed(self.output_dir / INDEX_DIRNAME / "manifest.json", json.dumps({
+            "page_size": page_size,
+            "techniques": len(self.techniques),
+            "sharded": self.index_shard is not None,
+            "shards": manifest_shards,
+        }, ensure_ascii=False, separators=(',', ':')))
+        written.append(manifest_url)
+        
+        # Remove listing pages of shards that are gone or have fewer pages now
+        index_dir = self.output_dir / INDEX_DIRNAME
+        current = {self.output_dir / Path(*url.split("/")) for url in written}
+        for path in sorted(index_dir.rglob("*.html")):
+            if path not in current:
+                path.unlink()
+        for path in sorted(index_dir.rglob("*"), reverse=True):
+            if path.is_dir() and not any(path.iterdir()):
+                path.rmdir()
+        return written
     
-    def generate_index(self):
-        """Generate the index/navigation page."""
-        html_content = f"""<!DOCTYPE html>
+    def _iter_index_page(self, shards: List[Tuple[str, str, List[str]]], keyword_index: KeywordIndex,
+                         page_size: int) -> Iterator[str]:
+        """Yield index.html in chunks: the first listing page, or links to every shard when sharded."""
+        yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>HyperImage - Scientific Analysis Techniques</title>
-    <link rel="stylesheet" href="{self.base_url}assets/style.css">
+    <link rel="stylesheet" href="{self.base_url}{STYLE_URL}">
 </head>
 <body>
     <nav class="navbar">
@@ -486,6 +1985,7 @@ class SiteGenerator:
             <ul class="nav-menu">
                 <li><a href="{self.base_url}index.html">Home</a></li>
                 <li><a href="#techniques">Techniques</a></li>
+                <li><a href="{self.base_url}{TAG_DIRNAME}/index.html">Keywords</a></li>
             </ul>
         </div>
     </nav>
@@ -496,32 +1996,384 @@ class SiteGenerator:
             <p class="subtitle">Reference Documentation for Scientific Analysis Techniques in Conservation Science</p>
         </header>
         
+        <section id="search" class="section">
+            <h2>Search</h2>
+            <input type="search" id="search-input" class="search-input" placeholder="Search techniques, keywords, instruments..." autocomplete="off" aria-label="Search techniques">
+            <div id="search-results" class="technique-grid" aria-live="polite"></div>
+        </section>
+        
         <section id="about" class="section">
             <h2>About</h2>
             <p>HyperImage provides comprehensive, practical reference documentation for scientific analysis techniques used in artwork analysis and conservation science. Each technique page includes detailed information on physics principles, instrumentation, protocols, data analysis, and troubleshooting.</p>
         </section>
         
         <section id="techniques" class="section">
-            <h2>Available Techniques</h2>
+            <h2>Available Techniques</h2>"""
+        if self.index_shard is None:
+            names = shards[0][2]
+            yield """
             <div class="technique-grid">"""
+            for technique_name in names[:page_size]:
+                yield self._index_card(technique_name, keyword_index, self.base_url)
+            yield """
+            </div>"""
+            page_count = max(1, -(-len(names) // page_size))
+            yield self._pagination_html(1, page_count, lambda n: self.base_url + self._index_page_url("", n))
+        else:
+            yield self._index_shard_nav(shards, "", self.base_url)
         
-        # Sort techniques alphabetically
-        sorted_techniques = sorted(self.techniques.items())
-        
-        for technique_name, ref in sorted_techniques:
-            filename = self.technique_urls[technique_name]
-            html_content += f"""
+        yield f"""
+        </section>
+    </main>
+    
+    <footer class="footer">
+        <p>&copy; 2024 HyperImage Framework. Scientific analysis techniques for conservation science.</p>
+    </footer>
+    <script src="{self.base_url}{SEARCH_SCRIPT_URL}" data-base="{self.base_url}"></script>
+</body>
+</html>"""
+    
+    def _index_card(self, technique_name: str, keyword_index: KeywordIndex, root: str) -> str:
+        """Render one technique card of the index listing."""
+        ref = self.techniques[technique_name]
+        return f"""
                 <div class="technique-card">
-                    <h3><a href="{self.base_url}{filename}">{html.escape(technique_name)}</a></h3>
+                    <h3><a href="{root}{self.technique_urls[technique_name]}">{html.escape(technique_name)}</a></h3>
                     <p class="technique-summary">{html.escape(ref.one_line_summary)}</p>
                     <div class="technique-tags">
-                        {''.join([f'<span class="keyword-tag">{html.escape(kw)}</span>' for kw in ref.keywords[:5]])}
+                        {''.join([self._keyword_link(kw, keyword_index, root) for kw in ref.keywords[:5]])}
                     </div>
                 </div>"""
+    
+    def _index_shards(self) -> List[Tuple[str, str, List[str]]]:
+        """
+        Group techniques into index shards as (slug, label, sorted technique names), ordered by label.
+        
+        Without index_shard there is a single shard with an empty slug.
+        Labels that differ only in case or punctuation share a shard.
+        """
+        names = sorted(self.techniques)
+        if self.index_shard is None:
+            return [("", "All techniques", names)]
+        shards: Dict[str, Tuple[str, List[str]]] = {}
+        for technique_name in names:
+            label = self.index_shard(self.techniques[technique_name])
+            slug = KeywordIndex.slug(normalize_keyword(label)) or "other"
+            shards.setdefault(slug, (label, []))[1].append(technique_name)
+        return [(slug, label, members)
+                for slug, (label, members) in sorted(shards.items(), key=lambda item: (item[1][0].casefold(), item[0]))]
+    
+    @staticmethod
+    def _index_page_url(slug: str, page: int = 1) -> str:
+        """URL of a page of the index listing (of one shard, when sharded), relative to the site root."""
+        if not slug:
+            return "index.html" if page == 1 else f"{INDEX_DIRNAME}/page-{page}.html"
+        return f"{INDEX_DIRNAME}/{slug}/" + ("index.html" if page == 1 else f"page-{page}.html")
+    
+    def _index_shard_nav(self, shards: List[Tuple[str, str, List[str]]], current: str, root: str) -> str:
+        """Render links to every index shard with its technique count, marking the current one."""
+        links = []
+        for slug, label, names in shards:
+            attributes = ' aria-current="page"' if slug == current else ""
+            links.append(f"""
+                <a href="{root}{self._index_page_url(slug)}" class="keyword-tag"{attributes}>{html.escape(label)} <span class="keyword-count">{len(names)}</span></a>""")
+        return f"""
+            <div class="keywords">{''.join(links)}
+            </div>"""
+    
+    def build_keyword_index(self) -> KeywordIndex:
+        """Index every technique under its normalized keywords, in one pass over the catalog."""
+        keyword_index = KeywordIndex()
+        for technique_name, ref in self.techniques.items():
+            keyword_index.add(technique_name, ref.keywords)
+        return keyword_index
+    
+    @staticmethod
+    def _tag_page_url(slug: str, page: int = 1) -> str:
+        """URL of a page of a keyword's technique list, relative to the site root."""
+        name = "index.html" if page == 1 else f"page-{page}.html"
+        return f"{TAG_DIRNAME}/{quote(slug)}/{name}"
+    
+    @staticmethod
+    def _facet_page_url(page: int = 1) -> str:
+        """URL of a page of the keyword facet list, relative to the site root."""
+        return f"{TAG_DIRNAME}/index.html" if page == 1 else f"{TAG_DIRNAME}/page-{page}.html"
+    
+    def _keyword_link(self, keyword: str, keyword_index: KeywordIndex, root: str) -> str:
+        """Render a keyword tag linking to its tag page."""
+        key = keyword_index.key(keyword)
+        if key is None:
+            return f'<span class="keyword-tag">{html.escape(keyword)}</span>'
+        url = self._tag_page_url(keyword_index.slug(key))
+        return f'<a href="{root}{url}" class="keyword-tag">{html.escape(keyword)}</a>'
+    
+    def generate_tag_pages(self, keyword_index: Optional[KeywordIndex] = None,
+                           records: Optional[List[PageRecord]] = None) -> List[str]:
+        """
+        Generate one page per keyword and the keyword facet page, both paginated.
+        
+        Keywords are listed in sorted order, KEYWORDS_PER_FACET_PAGE per facet
+        page; each keyword's techniques are listed by name,
+        TECHNIQUES_PER_TAG_PAGE per page. Pages left over from earlier builds
+        are removed. The site manifest records of the pages written are
+        appended to records when it is given.
+        
+        Returns:
+            Paths of the pages written, relative to the output directory
+        """
+        if keyword_index is None:
+            keyword_index = self.build_keyword_index()
+        entries = keyword_index.entries()
+        tag_dir = self.output_dir / TAG_DIRNAME
+        written: List[str] = []
+        
+        def write(url: str, content: str, title: str):
+            write_if_changed(self.output_dir / Path(*url.split("/")), content)
+            written.append(url)
+            if records is not None:
+                anchors, links = page_targets(url, content, self.base_url)
+                records.append(PageRecord(url, f"{title} - HyperImage", "tags", anchors, links))
         
-        html_content += """
+        for entry in entries:
+            root = self._root(self._tag_page_url(entry.slug))
+            page_count = max(1, -(-len(entry.techniques) // TECHNIQUES_PER_TAG_PAGE))
+            for page in range(1, page_count + 1):
+                start = (page - 1) * TECHNIQUES_PER_TAG_PAGE
+                cards = []
+                for technique_name in entry.techniques[start:start + TECHNIQUES_PER_TAG_PAGE]:
+                    ref = self.techniques[technique_name]
+                    cards.append(f"""
+                <div class="technique-card">
+                    <h3><a href="{root}{self.technique_urls[technique_name]}">{html.escape(technique_name)}</a></h3>
+                    <p class="technique-summary">{html.escape(ref.one_line_summary)}</p>
+                </div>""")
+                count = len(entry.techniques)
+                url_for = lambda n: self._tag_page_url(entry.slug, n)
+                body = f"""
+        <section class="section">
+            <div class="technique-grid">{''.join(cards)}
             </div>
-        </section>
+        </section>{self._pagination_html(page, page_count, lambda n: root + url_for(n))}"""
+                title = f"Keyword: {entry.label}"
+                write(f"{TAG_DIRNAME}/{entry.slug}/" + ("index.html" if page == 1 else f"page-{page}.html"),
+                      self._listing_page(title, root, entry.label,
+                                         f"{count} technique{'s' if count != 1 else ''} tagged with this keyword",
+                                         body), title)
+        
+        root = self._root(self._facet_page_url())
+        page_count = max(1, -(-len(entries) // KEYWORDS_PER_FACET_PAGE))
+        for page in range(1, page_count + 1):
+            start = (page - 1) * KEYWORDS_PER_FACET_PAGE
+            tags = []
+            for entry in entries[start:start + KEYWORDS_PER_FACET_PAGE]:
+                tags.append(f"""
+                <a href="{root}{self._tag_page_url(entry.slug)}" class="keyword-tag">{html.escape(entry.label)} <span class="keyword-count">{len(entry.techniques)}</span></a>""")
+            body = f"""
+        <section class="section">
+            <div class="keywords">{''.join(tags)}
+            </div>
+        </section>{self._pagination_html(page, page_count, lambda n: root + self._facet_page_url(n))}"""
+            write(self._facet_page_url(page),
+                  self._listing_page("Keywords", root, "Keywords",
+                                     f"{len(entries)} keywords across {len(self.techniques)} techniques", body),
+                  "Keywords")
+        
+        # Remove pages of keywords that are gone or have fewer pages now
+        current = {self.output_dir / Path(*url.split("/")) for url in written}
+        for path in sorted(tag_dir.rglob("*.html")):
+            if path not in current:
+                path.unlink()
+        for path in sorted(tag_dir.rglob("*"), reverse=True):
+            if path.is_dir() and not any(path.iterdir()):
+                path.rmdir()
+        return written
+    
+    @staticmethod
+    def _pagination_pages(page: int, page_count: int) -> List[int]:
+        """Return the page numbers pagination shows: the first, the last and those around the current page."""
+        if page_count <= 1:
+            return []
+        return sorted({1, page_count, *range(max(1, page - 2), min(page_count, page + 2) + 1)})
+    
+    @staticmethod
+    def _pagination_html(page: int, page_count: int, url_for: Callable[[int], str]) -> str:
+        """Render page links around the current page; empty when there is only one page."""
+        shown = SiteGenerator._pagination_pages(page, page_count)
+        if not shown:
+            return ""
+        links = []
+        if page > 1:
+            links.append(f'<a href="{url_for(page - 1)}" rel="prev">&laquo; Previous</a>')
+        previous = 0
+        for number in shown:
+            if number > previous + 1:
+                links.append('<span class="gap">&hellip;</span>')
+            if number == page:
+                links.append(f'<span class="current">{number}</span>')
+            else:
+                links.append(f'<a href="{url_for(number)}">{number}</a>')
+            previous = number
+        if page < page_count:
+            links.append(f'<a href="{url_for(page + 1)}" rel="next">Next &raquo;</a>')
+        return """
+        <nav class="pagination" aria-label="Pages">
+            """ + """
+            """.join(links) + """
+        </nav>"""
+    
+    @staticmethod
+    def _listing_page(title: str, root: str, heading: str, summary: str, body: str) -> str:
+        """Wrap a listing (tag, facet or index page) in the site layout."""
+        return "".join(SiteGenerator._iter_listing_page(title, root, heading, summary, [body]))
+    
+    @staticmethod
+    def _iter_listing_page(title: str, root: str, heading: str, summary: str,
+                           body: Iterable[Union[str, Iterable[str]]]) -> Iterator[str]:
+        """Yield a listing page in chunks; body items are strings or iterables of strings."""
+        yield f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{html.escape(title)} - HyperImage</title>
+    <link rel="stylesheet" href="{root}{STYLE_URL}">
+</head>
+<body>
+    <nav class="navbar">
+        <div class="nav-container">
+            <a href="{root}index.html" class="nav-logo">HyperImage</a>
+            <ul class="nav-menu">
+                <li><a href="{root}index.html">Home</a></li>
+                <li><a href="{root}index.html#techniques">Techniques</a></li>
+                <li><a href="{root}{TAG_DIRNAME}/index.html">Keywords</a></li>
+            </ul>
+        </div>
+    </nav>
+    
+    <main class="container">
+        <header class="page-header">
+            <h1>{html.escape(heading)}</h1>
+            <p class="summary">{html.escape(summary)}</p>
+        </header>"""
+        for part in body:
+            if isinstance(part, str):
+                yield part
+            else:
+                yield from part
+        yield """
+    </main>
+    
+    <footer class="footer">
+        <p>&copy; 2024 HyperImage Framework. Scientific analysis techniques for conservation science.</p>
+    </footer>
+</body>
+</html>"""
+
+    def write_book(self, output_path: Path, title: str = BOOK_TITLE) -> Path:
+        """
+        Export the whole catalog as one self-contained document for offline use.
+        
+        The format follows the file suffix: ".md" writes markdown, anything
+        else HTML with the stylesheet inlined. A table of contents links each
+        technique, and cross-links point at anchors within the document
+        instead of at other pages. The document is streamed technique by
+        technique, loading lazily added techniques one at a time, so memory
+        does not grow with the catalog; an unchanged file is not rewritten.
+        
+        Returns:
+            output_path
+        """
+        output_path = Path(output_path)
+        chunks = self.iter_book_markdown(title) if output_path.suffix == ".md" else self.iter_book_html(title)
+        with open_if_changed(output_path) as f:
+            for chunk in chunks:
+                f.write(chunk)
+        return output_path
+    
+    def _book_anchors(self) -> Dict[str, str]:
+        """Return a unique element id for every technique, in book order."""
+        anchors: Dict[str, str] = {}
+        taken = {"contents"}
+        for technique_name in sorted(self.techniques):
+            anchor = re.sub(r"[^a-z0-9]+", "-", technique_name.lower()).strip("-") or "technique"
+            candidate, number = anchor, 1
+            while candidate in taken:
+                number += 1
+                candidate = f"{anchor}-{number}"
+            taken.add(candidate)
+            anchors[technique_name] = candidate
+        return anchors
+    
+    def iter_book_html(self, title: str = BOOK_TITLE) -> Iterator[str]:
+        """Yield the HTML book export (see write_book) in chunks of at most one section."""
+        anchors = self._book_anchors()
+        linker = CrossLinker({name: f"#{anchor}" for name, anchor in anchors.items()})
+        anchor_urls = {self.technique_urls[name]: anchor for name, anchor in anchors.items()}
+        highlight = self.render_cache.highlight_cache.highlight
+        
+        def book_href(match: re.Match) -> str:
+            anchor = anchor_urls.get(match.group(1))
+            if anchor is None:
+                return match.group(0)
+            return f'href="#{anchor}--{match.group(2)}"' if match.group(2) else f'href="#{anchor}"'
+        
+        yield f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{html.escape(title)}</title>
+    <style>{STYLE_CSS}@media print{{.technique-page{{break-before:page}}}}</style>
+</head>
+<body>
+    <nav class="navbar">
+        <div class="nav-container">
+            <a href="#contents" class="nav-logo">HyperImage</a>
+            <ul class="nav-menu">
+                <li><a href="#contents">Contents</a></li>
+            </ul>
+        </div>
+    </nav>
+    
+    <main class="container">
+        <header class="page-header">
+            <h1>{html.escape(title)}</h1>
+            <p class="summary">{len(anchors)} techniques</p>
+        </header>
+        
+        <section id="contents" class="section">
+            <h2>Contents</h2>
+            <ol>"""
+        for technique_name, anchor in anchors.items():
+            yield f"""
+                <li><a href="#{anchor}" class="technique-link">{html.escape(technique_name)}</a> &mdash; {html.escape(self.techniques[technique_name].one_line_summary)}</li>"""
+        yield """
+            </ol>
+        </section>"""
+        
+        for technique_name, anchor in anchors.items():
+            document = self.techniques[technique_name].load().document()
+            
+            def render_text(fragment: MarkdownText) -> str:
+                if not fragment.source:
+                    return ""
+                linked = linker.link(fragment.to_html(highlight), technique_name)
+                return BOOK_HREF_PATTERN.sub(book_href, linked)
+            
+            yield f"""
+        
+        <article id="{anchor}" class="technique-page">
+            <header class="page-header">
+                <h1>{html.escape(document.title)}</h1>
+                <p class="summary">{html.escape(document.summary)}</p>
+            </header>"""
+            for section in document.sections:
+                yield from _iter_section_html(section._replace(id=f"{anchor}--{section.id}"), render_text)
+            yield """
+            <p><a href="#contents">Back to contents</a></p>
+        </article>"""
+        
+        yield """
     </main>
     
     <footer class="footer">
@@ -529,13 +2381,70 @@ class SiteGenerator:
     </footer>
 </body>
 </html>"""
+    
+    def iter_book_markdown(self, title: str = BOOK_TITLE) -> Iterator[str]:
+        """
+        Yield the markdown book export (see write_book), one technique at a time.
         
-        index_path = self.output_dir / "index.html"
-        index_path.write_text(html_content, encoding='utf-8')
+        Techniques are chapters one heading level below the book title, and
+        technique names and links to technique pages point at anchors within
+        the book, as in the HTML book.
+        """
+        anchors = self._book_anchors()
+        link = self._book_markdown_linker(anchors)
+        yield f"# {title}\n\n<a id=\"contents\"></a>\n\n## Contents\n\n"
+        for number, (technique_name, anchor) in enumerate(anchors.items(), 1):
+            yield f"{number}. [{technique_name}](#{anchor}) - {self.techniques[technique_name].one_line_summary}\n"
+        for technique_name, anchor in anchors.items():
+            document = self.techniques[technique_name].load().document()
+            yield f"\n<a id=\"{anchor}\"></a>\n\n"
+            yield render_document_markdown(document, level=2, anchor=anchor,
+                                           render_text=lambda source: link(source, technique_name))
+            yield "\n[Back to contents](#contents)\n"
     
-    def generate_css(self):
-        """Generate the CSS stylesheet."""
-        css_content = """/* HyperImage Framework Styles */
+    def _book_markdown_linker(self, anchors: Dict[str, str]) -> Callable[[str, str], str]:
+        """
+        Return link(source, current), which adds in-book links to a technique's markdown source.
+        
+        Technique names other than current become [name](#anchor) links and
+        links to technique pages are pointed at the matching book anchors;
+        code, URLs, raw HTML and the text of existing links are left alone.
+        """
+        if not anchors:
+            return lambda source, current: source
+        targets = {name.lower(): name for name in anchors}
+        anchor_urls = {self.technique_urls[name]: anchor for name, anchor in anchors.items()}
+        pattern = re.compile(r'(```.*?```|`[^`]*`|<[^>]*>|https?://[^\s)]*)|(\[[^\]]*\]\()([^)\s]*)\)|(?<!\w)('
+                             + _trie_pattern(list(targets)) + r')(?!\w)', re.IGNORECASE | re.DOTALL)
+        
+        def link(source: str, current: str) -> str:
+            def replace(match: re.Match) -> str:
+                if match.group(1):
+                    return match.group(1)
+                if match.group(2):
+                    path, _, fragment = match.group(3).partition("#")
+                    anchor = anchor_urls.get(path)
+                    if anchor is None:
+                        return match.group(0)
+                    return f"{match.group(2)}#{anchor}{'--' + fragment if fragment else ''})"
+                name = targets[match.group(4).lower()]
+                if name == current:
+                    return match.group(4)
+                return f"[{match.group(4)}](#{anchors[name]})"
+            
+            return pattern.sub(replace, source)
+        
+        return link
+    
+    def generate_css(self) -> Path:
+        """Write the minified stylesheet under its fingerprinted name (STYLE_URL), removing older versions."""
+        write_asset(self.output_dir, "assets/style.css", STYLE_CSS)
+        return self.output_dir / STYLE_URL
+
+
+# ---------------- Static assets ----------------
+
+STYLESHEET = """/* HyperImage Framework Styles */
 
 :root {
     --primary-color: #2c3e50;
@@ -632,6 +2541,20 @@ body {
     color: #666;
 }
 
+/* Search */
+.search-input {
+    width: 100%;
+    padding: 0.75rem 1rem;
+    font-size: 1.1rem;
+    border: 1px solid var(--border-color);
+    border-radius: 8px;
+}
+
+.search-input:focus {
+    outline: none;
+    border-color: var(--secondary-color);
+}
+
 /* Sections */
 .section {
     margin-bottom: 3rem;
@@ -711,6 +2634,15 @@ pre code {
     white-space: pre;
 }
 
+/* Syntax highlighting, rendered at build time (see highlight.py) */
+pre code .k { color: #8e44ad; font-weight: 600; }
+pre code .nb { color: #2471a3; }
+pre code .nf { color: #1e8449; font-weight: 600; }
+pre code .nd { color: #b9770e; }
+pre code .s { color: #b03a2e; }
+pre code .m { color: #117a65; }
+pre code .c { color: #7f8c8d; font-style: italic; }
+
 /* Links */
 a {
     color: var(--link-color);
@@ -749,6 +2681,15 @@ a:hover {
     left: 0;
 }
 
+/* Related techniques */
+.related-techniques {
+    list-style: none;
+    margin-left: 0;
+    display: flex;
+    flex-wrap: wrap;
+    gap: 0.5rem 1.5rem;
+}
+
 /* Checklist */
 .checklist {
     display: flex;
@@ -798,6 +2739,43 @@ a:hover {
     font-weight: 500;
 }
 
+a.keyword-tag {
+    text-decoration: none;
+}
+
+a.keyword-tag:hover {
+    background-color: var(--primary-color);
+}
+
+.keyword-count {
+    margin-left: 0.25rem;
+    opacity: 0.8;
+}
+
+/* Pagination (Keyword Pages) */
+.pagination {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 0.5rem;
+    justify-content: center;
+    margin: 2rem 0;
+}
+
+.pagination a, .pagination span {
+    padding: 0.25rem 0.75rem;
+    border: 1px solid var(--border-color);
+    border-radius: 4px;
+}
+
+.pagination .current {
+    background-color: var(--secondary-color);
+    color: white;
+}
+
+.pagination .gap {
+    border: none;
+}
+
 /* Technique Grid (Index Page) */
 .technique-grid {
     display: grid;
@@ -896,9 +2874,11 @@ a:hover {
     }
 }
 """
-        
-        css_path = self.output_dir / "assets" / "style.css"
-        css_path.write_text(css_content, encoding='utf-8')
+
+# Pages link assets by content-hashed URL, so they can be cached indefinitely
+STYLE_CSS = minify_css(STYLESHEET)
+STYLE_URL = fingerprint("assets/style.css", STYLE_CSS)
+SEARCH_SCRIPT_URL = fingerprint("assets/search.js", SEARCH_SCRIPT)
 
 
 if __name__ == "__main__":
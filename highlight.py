@@ -0,0 +1,189 @@
+"""
+Build-time syntax highlighting of fenced code blocks.
+
+Code blocks are tokenized with Pygments into static <span> markup styled by
+the site stylesheet, so pages need no client-side highlighter. Only the
+token kinds the stylesheet colours get a span (keywords, builtins, function
+and class names, decorators, strings, numbers and comments), and adjacent
+tokens of the same kind share one, which keeps pages small; everything else
+stays plain escaped text.
+
+Tokenizing is the expensive part of rendering a code block, so
+HighlightCache stores the markup of each block by a hash of its language and
+code. With a path the cache persists across builds and an unchanged block is
+never tokenized again, even when the text around it changes.
+
+Pygments is optional: without it, and for languages it does not know, code
+blocks are left as plain escaped code.
+"""
+
+import hashlib
+import html
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from site_output import write_if_changed
+
+try:
+    import pygments
+    from pygments import token
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+except ImportError:
+    pygments = None
+
+# Part of every cache key: highlighting output changes with this module and with Pygments
+HIGHLIGHT_VERSION = "1-" + (pygments.__version__ if pygments is not None else "none")
+
+# Token kinds that get a span, most specific first, with their CSS class
+if pygments is not None:
+    TOKEN_CLASSES = [
+        (token.Keyword, "k"),
+        (token.Operator.Word, "k"),
+        (token.Name.Builtin, "nb"),
+        (token.Name.Function, "nf"),
+        (token.Name.Class, "nf"),
+        (token.Name.Decorator, "nd"),
+        (token.Literal.String, "s"),
+        (token.Literal.Number, "m"),
+        (token.Comment, "c"),
+    ]
+
+
+def available() -> bool:
+    """Return whether Pygments is installed."""
+    return pygments is not None
+
+
+@lru_cache(maxsize=None)
+def _lexer(language: str):
+    """Return a lexer that keeps the code exactly as given, or None for an unknown language."""
+    try:
+        return get_lexer_by_name(language, stripnl=False, ensurenl=False)
+    except ClassNotFound:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _token_class(ttype) -> str:
+    for kind, css_class in TOKEN_CLASSES:
+        if ttype in kind:
+            return css_class
+    return ""
+
+
+def highlight_code(language: str, code: str) -> Optional[str]:
+    """
+    Return the highlighted HTML of a code block's contents.
+    
+    Returns:
+        Escaped code with <span class="..."> around highlighted tokens, or None
+        when the block stays plain (no language, unknown language or no Pygments)
+    """
+    if pygments is None or not language:
+        return None
+    lexer = _lexer(language.lower())
+    if lexer is None:
+        return None
+    parts: List[str] = []
+    run: List[str] = []
+    run_class = ""
+    
+    def flush():
+        text = html.escape("".join(run))
+        parts.append(f'<span class="{run_class}">{text}</span>' if run_class and text.strip() else text)
+        run.clear()
+    
+    for ttype, value in lexer.get_tokens(code):
+        css_class = _token_class(ttype)
+        if css_class != run_class and run:
+            flush()
+        run_class = css_class
+        run.append(value)
+    if run:
+        flush()
+    return "".join(parts)
+
+
+class HighlightCache:
+    """
+    Cache of highlighted code blocks keyed by language and code, with LRU eviction.
+    
+    When `path` is given, load() and save() persist the cache as JSON.
+    Blocks left plain are cached too, so they are not looked up again.
+    """
+    
+    def __init__(self, max_entries: int = 10000, path: Optional[Path] = None):
+        self.max_entries = max_entries
+        self.path = Path(path) if path is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        # Entries stored since the last take_added(); None until it is first called
+        self._added: Optional[Dict[str, Optional[str]]] = None
+        if self.path is not None:
+            self.load()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @staticmethod
+    def key(language: str, code: str) -> str:
+        """Return the cache key of a code block."""
+        payload = "\0".join((HIGHLIGHT_VERSION, language, code))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def highlight(self, language: str, code: str) -> Optional[str]:
+        """Like highlight_code(), reusing the cached markup of an identical block."""
+        key = self.key(language, code)
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        self.misses += 1
+        highlighted = highlight_code(language, code)
+        self.put(key, highlighted)
+        return highlighted
+    
+    def put(self, key: str, highlighted: Optional[str]):
+        """Store a block's markup, evicting the least recently used entry."""
+        self._entries[key] = highlighted
+        self._entries.move_to_end(key)
+        if self._added is not None:
+            self._added[key] = highlighted
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def update(self, entries: Dict[str, Optional[str]]):
+        """Merge entries highlighted elsewhere, e.g. by worker processes."""
+        for key, highlighted in entries.items():
+            self.put(key, highlighted)
+    
+    def take_added(self) -> Dict[str, Optional[str]]:
+        """Return and forget the entries stored since the last call (see RenderCache.take_added)."""
+        added, self._added = self._added or {}, {}
+        return added
+    
+    def load(self, path: Optional[Path] = None):
+        """Merge persisted entries from path (default `path`), ignoring a missing or unreadable file."""
+        path = path or self.path
+        if path is None or not Path(path).exists():
+            return
+        try:
+            stored = json.loads(Path(path).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        for key, highlighted in stored.items():
+            self._entries.setdefault(key, highlighted)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def save(self, path: Optional[Path] = None):
+        """Persist the cache to path (default `path`), most recently used entries last."""
+        path = path or self.path
+        if path is None:
+            return
+        write_if_changed(Path(path), json.dumps(self._entries, ensure_ascii=False))
@@ -0,0 +1,105 @@
+"""
+Keyword facet index for the generated site.
+
+KeywordIndex maps normalized keywords to the techniques tagged with them in
+a single pass over the catalog. Normalization (case, punctuation, plurals)
+runs once per distinct keyword string during indexing; renderers only look
+up the result.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+# Words the suffix rules below get wrong
+_IRREGULAR_PLURALS = {
+    "analyses": "analysis",
+    "media": "medium",
+    "spectra": "spectrum",
+    "criteria": "criterion",
+    "phenomena": "phenomenon",
+    "lens": "lens",
+}
+_KEEP_ENDINGS = ("ss", "us", "is", "ics")
+
+
+def singularize(word: str) -> str:
+    """Return the singular of a lowercase English word, by simple suffix rules."""
+    if word in _IRREGULAR_PLURALS:
+        return _IRREGULAR_PLURALS[word]
+    if len(word) <= 3 or not word.endswith("s") or word.endswith(_KEEP_ENDINGS):
+        return word
+    if word.endswith("ies") and len(word) > 4:
+        return word[:-3] + "y"
+    if word.endswith(("sses", "xes", "ches", "shes")):
+        return word[:-2]
+    return word[:-1]
+
+
+def normalize_keyword(keyword: str) -> str:
+    """
+    Return the facet key for a keyword.
+    
+    Case and punctuation are folded ("X-ray" and "x ray" share a key) and
+    the last word is singularized unless it is an acronym ("CARS" stays).
+    """
+    words = _NON_WORD.sub(" ", keyword).split()
+    if not words:
+        return ""
+    last = words[-1]
+    words = [word.casefold() for word in words]
+    if not last.isupper():
+        words[-1] = singularize(words[-1])
+    return " ".join(words)
+
+
+class KeywordEntry(NamedTuple):
+    """A keyword facet: its key, display label, URL slug and tagged techniques in sorted order."""
+    key: str
+    label: str
+    slug: str
+    techniques: List[str]
+
+
+class KeywordIndex:
+    """Inverted index from normalized keywords to technique names."""
+    
+    def __init__(self):
+        self._keys: Dict[str, str] = {}
+        self._techniques: Dict[str, List[str]] = {}
+        self._spellings: Dict[str, Counter] = {}
+    
+    def __len__(self) -> int:
+        return len(self._techniques)
+    
+    def add(self, technique_name: str, keywords: Iterable[str]):
+        """Index a technique under each of its keywords."""
+        for keyword in keywords:
+            key = self._keys.get(keyword)
+            if key is None:
+                key = self._keys[keyword] = normalize_keyword(keyword)
+            if not key:
+                continue
+            names = self._techniques.setdefault(key, [])
+            if not names or names[-1] != technique_name:
+                names.append(technique_name)
+            self._spellings.setdefault(key, Counter())[keyword] += 1
+    
+    def key(self, keyword: str) -> Optional[str]:
+        """Return the facet key an indexed keyword was normalized to, or None if it was not indexed."""
+        return self._keys.get(keyword) or None
+    
+    @staticmethod
+    def slug(key: str) -> str:
+        """Return the URL path segment for a facet key."""
+        return key.replace(" ", "-")
+    
+    def entries(self) -> List[KeywordEntry]:
+        """Return every facet sorted by key; the label is the most common spelling."""
+        entries = []
+        for key in sorted(self._techniques):
+            label = self._spellings[key].most_common(1)[0][0]
+            entries.append(KeywordEntry(key, label, self.slug(key), sorted(self._techniques[key])))
+        return entries
@@ -0,0 +1,361 @@
+"""
+Single-pass parser for the markdown subset used by technique data.
+
+Technique sections are written in a small markdown dialect: paragraphs,
+"- "/"* " and "1. " lists (nested by indentation), fenced code blocks, and
+inline `code`, **bold**, *italic* and [text](url) links. This module parses
+that dialect once into a tree of blocks and inline nodes, which is then
+rendered to HTML.
+
+Parsing is a line-by-line state machine for blocks and a left-to-right scan
+for inline markup, so markup never leaks between constructs (e.g. no
+emphasis inside code). An emphasis opener scans ahead for its closer; each
+of those scans is done once and memoized, from the last opener of a line to
+the first, so unmatched "*" and "**" cost at worst time quadratic in the
+length of their line and recursion stays shallow however many there are.
+"""
+
+import html
+import re
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+
+# ---------------- Inline nodes ----------------
+
+class Text(NamedTuple):
+    text: str
+
+
+class Code(NamedTuple):
+    text: str
+
+
+class Strong(NamedTuple):
+    children: List["Inline"]
+
+
+class Emphasis(NamedTuple):
+    children: List["Inline"]
+
+
+class Link(NamedTuple):
+    children: List["Inline"]
+    url: str
+
+
+Inline = Union[Text, Code, Strong, Emphasis, Link]
+
+
+# ---------------- Block nodes ----------------
+
+class Paragraph(NamedTuple):
+    children: List[Inline]
+
+
+class CodeBlock(NamedTuple):
+    language: str
+    code: str
+
+
+class ListItem(NamedTuple):
+    children: List[Inline]
+    sublists: List["MarkdownList"]
+
+
+class MarkdownList(NamedTuple):
+    ordered: bool
+    items: List[ListItem]
+    start: int = 1
+
+
+Block = Union[Paragraph, CodeBlock, MarkdownList]
+
+
+# ---------------- Inline parsing ----------------
+
+_INLINE_SPECIAL = re.compile(r'[`*\[]')
+
+
+def parse_inline(text: str) -> List[Inline]:
+    """Parse inline markup in text into a list of inline nodes."""
+    if not _INLINE_SPECIAL.search(text):
+        return [Text(text)] if text else []
+    memo: _Memo = {}
+    _scan_openers(text, 0, len(text), memo)
+    nodes, _, _ = _parse_inline(text, 0, len(text), None, memo)
+    return nodes
+
+
+# Results of _parse_inline by (pos, end, closer) for one text
+_Memo = Dict[Tuple[int, int, Optional[str]], Tuple[List[Inline], int, bool]]
+
+
+# Texts with more "*" than this have their openers scanned up front (see _scan_openers)
+_DEEP_EMPHASIS = 32
+
+
+def _scan_openers(text: str, pos: int, end: int, memo: _Memo):
+    """
+    Memoize the closer scan of every emphasis opener in text[pos:end], last opener first.
+
+    Each scan then finds the scans of the openers after it already done, so
+    _parse_inline never recurses more than a few levels deep. Text with few
+    openers cannot recurse deeply anyway and is left to be scanned on demand.
+    """
+    if text.count('*', pos, end) <= _DEEP_EMPHASIS:
+        return
+    star = text.rfind('*', pos, end)
+    while star != -1:
+        line_end = text.find('\n', star, end)
+        if line_end == -1:
+            line_end = end
+        if text.startswith('**', star):
+            _parse_inline(text, star + 2, line_end, '**', memo)
+        _parse_inline(text, star + 1, line_end, '*', memo)
+        star = text.rfind('*', pos, star)
+
+
+def _parse_inline(text: str, pos: int, end: int, closer: Optional[str],
+                  memo: _Memo) -> Tuple[List[Inline], int, bool]:
+    """
+    Scan text[pos:end] for inline markup, reusing memoized scans.
+
+    Returns:
+        (nodes, position after the closer, whether closer was found)
+    """
+    key = (pos, end, closer)
+    if key in memo:
+        return memo[key]
+    result = memo[key] = _scan_inline(text, pos, end, closer, memo)
+    return result
+
+
+def _scan_inline(text: str, pos: int, end: int, closer: Optional[str],
+                 memo: _Memo) -> Tuple[List[Inline], int, bool]:
+    """Scan text[pos:end] for inline markup; see _parse_inline()."""
+    nodes: List[Inline] = []
+    buffer: List[str] = []
+
+    def flush():
+        if buffer:
+            nodes.append(Text("".join(buffer)))
+            buffer.clear()
+
+    while pos < end:
+        match = _INLINE_SPECIAL.search(text, pos, end)
+        if match is None:
+            buffer.append(text[pos:end])
+            break
+        start = match.start()
+        if start > pos:
+            buffer.append(text[pos:start])
+        char = text[start]
+
+        if char == '`':
+            close = text.find('`', start + 1, end)
+            if close > start + 1:
+                flush()
+                nodes.append(Code(text[start + 1:close]))
+                pos = close + 1
+            else:
+                buffer.append(char)
+                pos = start + 1
+            continue
+
+        if char == '[':
+            close = text.find(']', start + 1, end)
+            url_end = text.find(')', close + 2, end) if close > start + 1 else -1
+            if close > start + 1 and text.startswith('(', close + 1) and url_end > close + 2:
+                flush()
+                _scan_openers(text, start + 1, close, memo)
+                children, _, _ = _parse_inline(text, start + 1, close, None, memo)
+                nodes.append(Link(children, text[close + 2:url_end]))
+                pos = url_end + 1
+            else:
+                buffer.append(char)
+                pos = start + 1
+            continue
+
+        # Emphasis never spans lines
+        line_end = text.find('\n', start, end)
+        if line_end == -1:
+            line_end = end
+        if text.startswith('**', start):
+            if closer == '**':
+                flush()
+                return nodes, start + 2, True
+            children, after, closed = _parse_inline(text, start + 2, line_end, '**', memo)
+            if closed and children:
+                flush()
+                nodes.append(Strong(children))
+                pos = after
+                continue
+        if closer == '*':
+            flush()
+            return nodes, start + 1, True
+        children, after, closed = _parse_inline(text, start + 1, line_end, '*', memo)
+        if closed and children:
+            flush()
+            nodes.append(Emphasis(children))
+            pos = after
+        else:
+            buffer.append(char)
+            pos = start + 1
+
+    flush()
+    return nodes, end, False
+
+
+# ---------------- Block parsing ----------------
+
+_LIST_ITEM = re.compile(r'^(\s*)(?:([-*])|(\d+)\.)\s+(.*)$')
+_FENCE = re.compile(r'^\s*```\s*(\w*)')
+_LIST_MARKERS = frozenset('-*0123456789')
+
+
+class _OpenList:
+    """A list being built, with the indentation of its items."""
+
+    def __init__(self, indent: int, ordered: bool, start: int):
+        self.indent = indent
+        self.ordered = ordered
+        self.start = start
+        self.items: List[Tuple[List[str], List[MarkdownList]]] = []
+
+    def close(self) -> MarkdownList:
+        items = [ListItem(parse_inline("\n".join(lines)), sublists) for lines, sublists in self.items]
+        return MarkdownList(self.ordered, items, self.start)
+
+
+def parse_markdown(text: str) -> List[Block]:
+    """Parse markdown text into a list of blocks."""
+    # Most sections are a single line of prose (checklist items, protocol steps)
+    stripped = text.strip()
+    if '\n' not in stripped and not (stripped and stripped[0] in _LIST_MARKERS) and '```' not in stripped:
+        return [Paragraph(parse_inline(stripped))] if stripped else []
+    
+    blocks: List[Block] = []
+    paragraph: List[str] = []
+    lists: List[_OpenList] = []
+    code_lines: Optional[List[str]] = None
+    code_language = ""
+
+    def end_paragraph():
+        if paragraph:
+            blocks.append(Paragraph(parse_inline("\n".join(paragraph).strip())))
+            paragraph.clear()
+
+    def close_lists(indent: int = -1):
+        # Close lists nested deeper than indent, attaching each to its parent item
+        while lists and lists[-1].indent > indent:
+            finished = lists.pop().close()
+            if lists:
+                lists[-1].items[-1][1].append(finished)
+            else:
+                blocks.append(finished)
+
+    for line in text.split('\n'):
+        if code_lines is not None:
+            if line.strip().startswith('```'):
+                blocks.append(CodeBlock(code_language, "".join(code_lines)))
+                code_lines = None
+            else:
+                code_lines.append(line + '\n')
+            continue
+
+        fence = _FENCE.match(line) if '```' in line else None
+        if fence:
+            end_paragraph()
+            close_lists()
+            code_language = fence.group(1)
+            code_lines = []
+            continue
+
+        stripped = line.strip()
+        if not stripped:
+            end_paragraph()
+            close_lists()
+            continue
+
+        item = _LIST_ITEM.match(line) if stripped[0] in _LIST_MARKERS else None
+        if item:
+            end_paragraph()
+            indent = len(item.group(1).expandtabs(4))
+            ordered = item.group(3) is not None
+            if lists and indent < lists[-1].indent:
+                close_lists(indent)
+            if lists and indent == lists[-1].indent and ordered != lists[-1].ordered:
+                close_lists(indent - 1)
+            if not lists or indent > lists[-1].indent:
+                lists.append(_OpenList(indent, ordered, int(item.group(3)) if ordered else 1))
+            lists[-1].items.append(([item.group(4).strip()], []))
+            continue
+
+        if lists:
+            # Continuation of the innermost list item
+            lists[-1].items[-1][0].append(stripped)
+        else:
+            paragraph.append(line)
+
+    if code_lines is not None:
+        blocks.append(CodeBlock(code_language, "".join(code_lines)))
+    end_paragraph()
+    close_lists()
+    return blocks
+
+
+# ---------------- Rendering ----------------
+
+def render_inline_html(nodes: List[Inline]) -> str:
+    """Render inline nodes to HTML."""
+    parts = []
+    for node in nodes:
+        if isinstance(node, Text):
+            parts.append(html.escape(node.text))
+        elif isinstance(node, Code):
+            parts.append(f'<code>{html.escape(node.text)}</code>')
+        elif isinstance(node, Strong):
+            parts.append(f'<strong>{render_inline_html(node.children)}</strong>')
+        elif isinstance(node, Emphasis):
+            parts.append(f'<em>{render_inline_html(node.children)}</em>')
+        else:
+            parts.append(f'<a href="{html.escape(node.url)}">{render_inline_html(node.children)}</a>')
+    return "".join(parts)
+
+
+def _render_list_html(block: MarkdownList) -> str:
+    tag = 'ol' if block.ordered else 'ul'
+    start = f' start="{block.start}"' if block.ordered and block.start != 1 else ''
+    items = []
+    for item in block.items:
+        nested = "".join('\n' + _render_list_html(sublist) for sublist in item.sublists)
+        items.append(f'  <li>{render_inline_html(item.children)}{nested}</li>\n')
+    return f'<{tag}{start}>\n' + "".join(items) + f'</{tag}>'
+
+
+def render_html(blocks: List[Block], highlight: Optional[Callable[[str, str], Optional[str]]] = None) -> str:
+    """
+    Render blocks to HTML, one block per line.
+
+    highlight(language, code) may return the HTML of a code block's contents
+    (e.g. highlight.highlight_code); code it returns None for is escaped as is.
+    """
+    parts = []
+    for block in blocks:
+        if isinstance(block, Paragraph):
+            parts.append(f'<p>{render_inline_html(block.children)}</p>')
+        elif isinstance(block, CodeBlock):
+            code = highlight(block.language, block.code) if highlight is not None else None
+            if code is None:
+                code = html.escape(block.code)
+            parts.append(f'<pre><code class="language-{block.language}">{code}</code></pre>')
+        else:
+            parts.append(_render_list_html(block))
+    return '\n'.join(parts)
+
+
+def markdown_to_html(text: str) -> str:
+    """Parse markdown text and render it to HTML."""
+    if not text:
+        return ""
+    return render_html(parse_markdown(text))
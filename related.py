@@ -0,0 +1,131 @@
+"""
+"Related techniques" from TF-IDF similarity of technique texts.
+
+Each technique contributes its boosted term weights (search_index.field_weights,
+so the build tokenizes every technique once for both search and related
+techniques). Rows become sparse TF-IDF vectors with sublinear term frequency;
+terms found in only one technique or in more than MAX_DF of them are dropped,
+since they cannot separate neighbours, and each row keeps only its
+MAX_TERMS_PER_ROW strongest terms. Cosine similarity is the sparse product
+X @ X.T, computed BLOCK_ROWS rows at a time and reduced to each row's top k
+with a partial sort, so the n x n matrix never exists in memory.
+
+numpy and scipy are optional: without them RelatedTechniques.compute()
+returns no suggestions and the site builds without "Related techniques"
+sections.
+"""
+
+from array import array
+from typing import Dict, List, Tuple
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:
+    np = None
+    sparse = None
+
+RELATED_VERSION = "2"
+DEFAULT_TOP_K = 5
+# Pairs less similar than this are not suggested
+MIN_SIMILARITY = 0.02
+# Terms in more than this fraction of techniques are ignored
+MAX_DF = 0.5
+MAX_TERMS_PER_ROW = 64
+BLOCK_ROWS = 512
+
+
+def available() -> bool:
+    """Return whether numpy and scipy are installed."""
+    return sparse is not None
+
+
+class RelatedTechniques:
+    """Collect term weights per technique and compute each technique's most similar others."""
+    
+    def __init__(self):
+        self.names: List[str] = []
+        self._vocabulary: Dict[str, int] = {}
+        self._indptr = array('q', [0])
+        self._indices = array('q')
+        self._counts = array('f')
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def add(self, technique_name: str, weights: Dict[str, int]):
+        """Add a technique's term weights (see search_index.field_weights)."""
+        vocabulary = self._vocabulary
+        self.names.append(technique_name)
+        self._indices.extend(vocabulary.setdefault(term, len(vocabulary)) for term in weights)
+        self._counts.extend(weights.values())
+        self._indptr.append(len(self._indices))
+    
+    def matrix(self):
+        """Return the L2-normalized TF-IDF matrix as a scipy CSR matrix, one row per technique."""
+        n = len(self.names)
+        columns = np.frombuffer(self._indices, dtype=np.int64)
+        indptr = np.frombuffer(self._indptr, dtype=np.int64)
+        df = np.bincount(columns, minlength=len(self._vocabulary))
+        idf = (np.log((1.0 + n) / (1.0 + df)) + 1.0).astype(np.float32)
+        idf[(df < 2) | (df > MAX_DF * n)] = 0.0
+        weights = (1.0 + np.log(np.frombuffer(self._counts, dtype=np.float32))) * idf[columns]
+        
+        # Keep each row's strongest terms: rank entries by (row, -weight) and cut at the row limit
+        rows = np.repeat(np.arange(n), np.diff(indptr))
+        order = np.lexsort((-weights, rows))
+        rank = np.arange(len(order)) - indptr[rows[order]]
+        keep = order[(rank < MAX_TERMS_PER_ROW) & (weights[order] > 0)]
+        
+        matrix = sparse.csr_matrix((weights[keep], (rows[keep], columns[keep])),
+                                   shape=(n, len(self._vocabulary)), dtype=np.float32)
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1), dtype=np.float32).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.diags(1.0 / norms).dot(matrix).tocsr()
+    
+    def compute(self, k: int = DEFAULT_TOP_K) -> Dict[str, List[str]]:
+        """
+        Return up to k related technique names per technique, most similar first.
+        
+        Empty when numpy or scipy is missing.
+        """
+        if not available() or len(self.names) < 2 or k <= 0:
+            return {}
+        neighbours = top_k_similar(self.matrix(), k)
+        return {name: [self.names[index] for index, _ in neighbours[row]] for row, name in enumerate(self.names)}
+
+
+def top_k_similar(matrix, k: int) -> List[List[Tuple[int, float]]]:
+    """
+    Return, for every row, up to k (row, cosine similarity) pairs of its most similar other rows.
+    
+    Ties are broken by row index, so results are deterministic.
+    """
+    n = matrix.shape[0]
+    k = min(k, n - 1)
+    if k <= 0:
+        return [[] for _ in range(n)]
+    result: List[List[Tuple[int, float]]] = []
+    transposed = matrix.T.tocsr()
+    for start in range(0, n, BLOCK_ROWS):
+        stop = min(start + BLOCK_ROWS, n)
+        block = matrix[start:stop].dot(transposed).toarray()
+        rows = np.arange(stop - start)
+        block[rows, rows + start] = -1.0
+        if k < n - 1:
+            # Keep scores above each row's k-th best; rows tied with it are taken lowest index first
+            kth = -np.partition(-block, k - 1, axis=1)[:, k - 1:k]
+            above = block > kth
+            tied = block == kth
+            chosen = above | (tied & (np.cumsum(tied, axis=1) <= k - above.sum(axis=1, keepdims=True)))
+            candidates = np.nonzero(chosen)[1].reshape(-1, k)
+        else:
+            candidates = np.tile(np.arange(n), (stop - start, 1))
+        scores = np.take_along_axis(block, candidates, axis=1)
+        order = np.lexsort((candidates, -scores), axis=1)[:, :k]
+        candidates = np.take_along_axis(candidates, order, axis=1)
+        scores = np.take_along_axis(scores, order, axis=1)
+        for row_candidates, row_scores in zip(candidates.tolist(), scores.tolist()):
+            result.append([(index, score) for index, score in zip(row_candidates, row_scores)
+                           if score >= MIN_SIMILARITY])
+    return result
@@ -0,0 +1,260 @@
+"""
+Schema validation of technique data dictionaries.
+
+A Schema is compiled once from a dataclass's field types into a tree of
+small checker functions, so validating a dictionary is one walk over its
+values with no type introspection. Every problem is reported, each with the
+path of the offending value (e.g. "measurement_protocol.preparation[2]"),
+instead of stopping at the first one.
+
+validate_catalog() checks a whole catalog: results are cached by a hash of
+each technique's data and of the schema, so unchanged techniques are not
+revalidated, and the remaining ones can be spread over worker processes.
+
+Supported field types are str, Optional[X], Tuple[X, ...] (lists are
+accepted too, as the dataclass converts them), Dict[str, X] and any nesting
+of those; fields of other types are only checked for presence.
+"""
+
+import dataclasses
+import hashlib
+import json
+import marshal
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union, get_type_hints
+
+from site_output import write_if_changed
+
+# (path, message) pairs collected while checking one value
+Problems = List[Tuple[str, str]]
+Checker = Callable[[object, str, Problems], None]
+
+
+class SchemaError(NamedTuple):
+    """One problem in a technique's data."""
+    technique: str
+    # Location of the value, e.g. "strengths_limitations.strengths[0]"; "" for the data itself
+    path: str
+    message: str
+    
+    def __str__(self) -> str:
+        return ": ".join(part for part in (self.technique, self.path, self.message) if part)
+
+
+class TechniqueValidationError(ValueError, TypeError):
+    """Raised for invalid technique data, a ValueError and TypeError; `errors` lists every problem found."""
+    
+    def __init__(self, errors: Iterable[SchemaError]):
+        self.errors = list(errors)
+        count = len(self.errors)
+        super().__init__(f"{count} problem{'s' if count != 1 else ''} in technique data:\n"
+                         + "\n".join(f"  {error}" for error in self.errors))
+
+
+def _type_name(value: object) -> str:
+    return {str: "a string", list: "a list", tuple: "a list", dict: "a dict"}.get(type(value), type(value).__name__)
+
+
+def _compile(annotation) -> Optional[Checker]:
+    """Build the checker for a field type, or None when values of that type are not checked."""
+    origin = getattr(annotation, "__origin__", None)
+    args = getattr(annotation, "__args__", ())
+    if annotation is str:
+        def check_str(value, path, problems):
+            if not isinstance(value, str):
+                problems.append((path, f"expected a string, got {_type_name(value)}"))
+        return check_str
+    if origin is Union and type(None) in args:
+        inner = [arg for arg in args if arg is not type(None)]
+        item = _compile(Union[tuple(inner)]) if len(inner) == 1 else None
+        if item is None:
+            return None
+        
+        def check_optional(value, path, problems):
+            if value is not None:
+                item(value, path, problems)
+        return check_optional
+    if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+        item = _compile(args[0])
+        
+        def check_sequence(value, path, problems):
+            if not isinstance(value, (list, tuple)):
+                problems.append((path, f"expected a list, got {_type_name(value)}"))
+            elif item is not None:
+                for number, element in enumerate(value):
+                    item(element, f"{path}[{number}]", problems)
+        return check_sequence
+    if origin is dict and len(args) == 2:
+        key, item = _compile(args[0]), _compile(args[1])
+        
+        def check_mapping(value, path, problems):
+            if not isinstance(value, dict):
+                problems.append((path, f"expected a dict, got {_type_name(value)}"))
+                return
+            for name, element in value.items():
+                if key is not None:
+                    key(name, f"{path} key {name!r}", problems)
+                if item is not None:
+                    item(element, f"{path}.{name}", problems)
+        return check_mapping
+    return None
+
+
+class Schema:
+    """Validator compiled from a dataclass's field types (see the module docstring)."""
+    
+    def __init__(self, cls: type, exclude: Iterable[str] = ()):
+        """
+        Args:
+            cls: Dataclass whose constructor the validated dictionaries are passed to
+            exclude: Fields supplied separately, which the dictionaries must not contain
+        """
+        self.cls = cls
+        self.exclude = tuple(exclude)
+        hints = get_type_hints(cls)
+        fields = [field for field in dataclasses.fields(cls) if field.name not in self.exclude]
+        self.checkers: Dict[str, Optional[Checker]] = {field.name: _compile(hints[field.name]) for field in fields}
+        self.required = [field.name for field in fields if field.default is dataclasses.MISSING
+                         and field.default_factory is dataclasses.MISSING]
+        # Identifies the schema in cache keys, so cached results are dropped when the fields change
+        layout = repr([(field.name, hints[field.name], field.name in self.required) for field in fields])
+        self.version = hashlib.sha256(layout.encode('utf-8')).hexdigest()[:16]
+    
+    def problems(self, data: object) -> Problems:
+        """Return (path, message) for every problem in data; empty when it is valid."""
+        if not isinstance(data, dict):
+            return [("", f"expected a dict of fields, got {_type_name(data)}")]
+        problems: Problems = [(name, "missing") for name in self.required if name not in data]
+        for name, value in data.items():
+            if name not in self.checkers:
+                problems.append((str(name), "unexpected field"))
+            elif self.checkers[name] is not None:
+                self.checkers[name](value, name, problems)
+        return problems
+    
+    def errors(self, technique: str, data: object) -> List[SchemaError]:
+        """Return every problem in a technique's data as SchemaErrors."""
+        return [SchemaError(technique, path, message) for path, message in self.problems(data)]
+    
+    def key(self, data: object) -> str:
+        """
+        Return the cache key of data: a hash of its content and of the schema.
+        
+        Data is serialized with marshal, several times faster than JSON, in
+        format 0, which writes every string in full whether or not it is
+        interned, so equal data gives equal bytes. Data marshal cannot
+        serialize falls back to JSON.
+        """
+        try:
+            payload = marshal.dumps([self.version, data], 0)
+        except ValueError:
+            payload = json.dumps([self.version, data], sort_keys=True, ensure_ascii=False, default=repr).encode('utf-8')
+        return hashlib.sha256(payload).hexdigest()
+
+
+class ValidationCache:
+    """
+    Validation results by Schema.key(), so unchanged data is not revalidated.
+    
+    When `path` is given, load() and save() persist the cache as JSON.
+    """
+    
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Problems] = {}
+        if self.path is not None:
+            self.load()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: str) -> Optional[Problems]:
+        """Return the problems stored for key, or None, updating hit/miss counts."""
+        problems = self._entries.get(key)
+        if problems is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return problems
+    
+    def put(self, key: str, problems: Problems):
+        self._entries[key] = problems
+    
+    def load(self, path: Optional[Path] = None):
+        """Merge persisted results from path (default `path`), ignoring a missing or unreadable file."""
+        path = path or self.path
+        if path is None or not Path(path).exists():
+            return
+        try:
+            stored = json.loads(Path(path).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        for key, problems in stored.items():
+            self._entries.setdefault(key, [tuple(problem) for problem in problems])
+    
+    def save(self, path: Optional[Path] = None, keep: Optional[Iterable[str]] = None):
+        """
+        Persist the cache to path (default `path`).
+        
+        Args:
+            keep: Keys to persist, e.g. those of the current catalog; all when omitted
+        """
+        path = path or self.path
+        if path is None:
+            return
+        entries = self._entries if keep is None else {key: self._entries[key] for key in keep
+                                                      if key in self._entries}
+        write_if_changed(Path(path), json.dumps(entries, sort_keys=True, ensure_ascii=False))
+
+
+# Per-process schema for parallel validation, set once by _init_validation_worker
+_worker_schema: List[Schema] = []
+
+
+def _init_validation_worker(cls: type, exclude: Tuple[str, ...]):
+    _worker_schema[:] = [Schema(cls, exclude)]
+
+
+def _validate_chunk(chunk: List[object]) -> List[Problems]:
+    schema = _worker_schema[0]
+    return [schema.problems(data) for data in chunk]
+
+
+def validate_catalog(catalog: Dict[str, object], schema: Schema, workers: int = 1,
+                     cache: Optional[ValidationCache] = None) -> Tuple[List[SchemaError], Dict[str, str]]:
+    """
+    Validate every technique of a catalog, reporting all problems at once.
+    
+    Args:
+        catalog: Technique name -> data dictionary
+        schema: Schema the data must match
+        workers: Number of processes validating techniques whose results are not
+            cached; 1 validates in this process
+        cache: Results of earlier validations, updated with the new ones
+    
+    Returns:
+        (every problem found in catalog order, cache key of each technique)
+    """
+    cache = cache if cache is not None else ValidationCache()
+    keys = {name: schema.key(data) for name, data in catalog.items()}
+    results = {name: cache.get(key) for name, key in keys.items()}
+    pending = [name for name, problems in results.items() if problems is None]
+    
+    if workers > 1 and len(pending) > 1:
+        chunksize = max(1, len(pending) // (workers * 4))
+        chunks = [[catalog[name] for name in pending[start:start + chunksize]]
+                  for start in range(0, len(pending), chunksize)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_validation_worker,
+                                 initargs=(schema.cls, schema.exclude)) as executor:
+            validated = [problems for chunk in executor.map(_validate_chunk, chunks) for problems in chunk]
+    else:
+        validated = [schema.problems(catalog[name]) for name in pending]
+    for name, problems in zip(pending, validated):
+        cache.put(keys[name], problems)
+        results[name] = problems
+    
+    errors = [SchemaError(name, path, message) for name, problems in results.items() for path, message in problems]
+    return errors, keys
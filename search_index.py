@@ -0,0 +1,352 @@
+"""
+Client-side full-text search index for the generated site.
+
+SiteGenerator feeds every technique to a SearchIndexBuilder before it renders
+pages, straight from the technique data, so the HTML is never re-read. Each
+technique's text is tokenized once into per-term weights, boosted by field
+(name, keywords, summary, body). Doc ids are assigned in insertion order, so
+every posting list is already sorted when it is built. Building is linear
+in the corpus size, plus one sort of the vocabulary when the shards are
+written.
+
+The index is written to search/ as small JSON files that search.js fetches
+on demand:
+
+- meta.json: shard boundaries, stopwords and document count
+- terms-N.json: a range of the sorted vocabulary. Terms are front-coded as
+  [shared prefix length, suffix]. Postings are flat [doc delta, weight, ...]
+  lists
+- docs-N.json: [title, url, summary] for a block of doc ids
+"""
+
+import json
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from site_output import write_if_changed
+
+SEARCH_INDEX_VERSION = "1"
+
+# Weight of one occurrence of a term in each field
+FIELD_BOOSTS = {"name": 10, "keywords": 5, "summary": 3, "body": 1}
+
+STOPWORDS = frozenset("""
+a an and are as at be by can for from has have in is it its of on or that the this to was were which with
+""".split())
+
+# Approximate serialized size at which a terms shard is closed
+SHARD_TARGET_BYTES = 16 * 1024
+DOCS_PER_SHARD = 250
+SUMMARY_LENGTH = 160
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> Iterator[str]:
+    """Yield the lowercase search terms in text, skipping stopwords and single characters."""
+    for token in _TOKEN.findall(text.lower()):
+        if len(token) > 1 and token not in STOPWORDS:
+            yield token
+
+
+def term_counts(text: str) -> Counter:
+    """Count the search terms in text, as tokenize() would yield them."""
+    # Count raw tokens in C and filter each distinct token once
+    counts = Counter(_TOKEN.findall(text.lower()))
+    for token in [token for token in counts if len(token) < 2 or token in STOPWORDS]:
+        del counts[token]
+    return counts
+
+
+def field_weights(fields: Dict[str, Iterable[str]]) -> Dict[str, int]:
+    """Return each term's occurrence count across fields, weighted by FIELD_BOOSTS."""
+    weights: Dict[str, int] = {}
+    for field_name, texts in fields.items():
+        boost = FIELD_BOOSTS[field_name]
+        for token, count in term_counts("\n".join(texts)).items():
+            weights[token] = weights.get(token, 0) + boost * count
+    return weights
+
+
+class SearchIndexBuilder:
+    """Accumulate weighted postings for documents and write them as sharded JSON."""
+    
+    def __init__(self):
+        self.docs: List[Tuple[str, str, str]] = []
+        # term -> flat [doc id, weight, doc id, weight, ...] in increasing doc id order
+        self._postings: Dict[str, List[int]] = {}
+    
+    def __len__(self) -> int:
+        return len(self.docs)
+    
+    def add(self, title: str, url: str, summary: str, fields: Dict[str, Iterable[str]]) -> int:
+        """
+        Index one document.
+        
+        Args:
+            title: Title shown in results
+            url: Page URL relative to the site root
+            summary: Summary shown in results; truncated to SUMMARY_LENGTH
+            fields: Texts per FIELD_BOOSTS field
+        
+        Returns:
+            The document's id
+        """
+        return self.add_weights(title, url, summary, field_weights(fields))
+    
+    def add_weights(self, title: str, url: str, summary: str, weights: Dict[str, int]) -> int:
+        """Index one document from term weights already computed by field_weights()."""
+        doc_id = len(self.docs)
+        if len(summary) > SUMMARY_LENGTH:
+            summary = summary[:SUMMARY_LENGTH - 1].rstrip() + "…"
+        self.docs.append((title, url, summary))
+        
+        postings = self._postings
+        for term, weight in weights.items():
+            entry = postings.get(term)
+            if entry is None:
+                postings[term] = [doc_id, weight]
+            else:
+                entry.append(doc_id)
+                entry.append(weight)
+        return doc_id
+    
+    def shards(self) -> List[Dict]:
+        """Split the sorted vocabulary into front-coded shards of about SHARD_TARGET_BYTES."""
+        shards: List[Dict] = []
+        terms: List[list] = []
+        postings: List[List[int]] = []
+        size = 0
+        previous = ""
+        for term in sorted(self._postings):
+            if size >= SHARD_TARGET_BYTES:
+                shards.append({"terms": terms, "postings": postings})
+                terms, postings, size, previous = [], [], 0, ""
+            shared = 0
+            limit = min(len(term), len(previous))
+            while shared < limit and term[shared] == previous[shared]:
+                shared += 1
+            encoded = list(self._postings[term])
+            last_doc = 0
+            for i in range(0, len(encoded), 2):
+                encoded[i], last_doc = encoded[i] - last_doc, encoded[i]
+            terms.append([shared, term[shared:]])
+            postings.append(encoded)
+            size += len(term) - shared + 4 * len(encoded) + 8
+            previous = term
+        if terms:
+            shards.append({"terms": terms, "postings": postings})
+        return shards
+    
+    def write(self, directory: Path) -> Dict[str, List[str]]:
+        """
+        Write the index to directory, removing index files left over from larger builds.
+        
+        Files whose bytes do not change are left untouched.
+        
+        Returns:
+            Names of the index files "written" (changed), "skipped" (unchanged) and "removed"
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        files: Dict[str, object] = {}
+        
+        shard_starts = []
+        for number, shard in enumerate(self.shards()):
+            name = f"terms-{number}.json"
+            # A shard's first term is stored whole
+            shard_starts.append([shard["terms"][0][1], name])
+            files[name] = shard
+        for number, start in enumerate(range(0, len(self.docs), DOCS_PER_SHARD)):
+            files[f"docs-{number}.json"] = self.docs[start:start + DOCS_PER_SHARD]
+        files["meta.json"] = {
+            "version": SEARCH_INDEX_VERSION,
+            "documents": len(self.docs),
+            "docs_per_shard": DOCS_PER_SHARD,
+            "shards": shard_starts,
+            "stopwords": sorted(STOPWORDS),
+        }
+        
+        result: Dict[str, List[str]] = {"written": [], "skipped": [], "removed": []}
+        for name, data in files.items():
+            changed = write_if_changed(directory / name, json.dumps(data, ensure_ascii=False, separators=(',', ':')))
+            result["written" if changed else "skipped"].append(name)
+        for path in sorted(directory.glob("*.json")):
+            if path.name not in files:
+                path.unlink()
+                result["removed"].append(path.name)
+        return result
+
+
+SEARCH_SCRIPT = r"""/* HyperImage client-side search: fetches index shards from search/ as needed */
+(function () {
+    "use strict";
+    var script = document.currentScript;
+    var base = (script && script.getAttribute("data-base")) || "";
+    var input = document.getElementById("search-input");
+    var results = document.getElementById("search-results");
+    if (!input || !results || !window.fetch) {
+        return;
+    }
+    var metaPromise = null;
+    var shardCache = {};
+    var docCache = {};
+    var stopwords = {};
+    var generation = 0;
+    var MAX_RESULTS = 20;
+
+    function getJSON(name) {
+        return fetch(base + "search/" + name).then(function (response) {
+            if (!response.ok) {
+                throw new Error("search/" + name + ": " + response.status);
+            }
+            return response.json();
+        });
+    }
+
+    function loadMeta() {
+        if (!metaPromise) {
+            metaPromise = getJSON("meta.json").then(function (meta) {
+                meta.stopwords.forEach(function (word) { stopwords[word] = true; });
+                meta.starts = meta.shards.map(function (shard) { return shard[0]; });
+                return meta;
+            });
+        }
+        return metaPromise;
+    }
+
+    function tokenize(text) {
+        return (text.toLowerCase().match(/[\p{L}\p{N}]+/gu) || []).filter(function (token) {
+            return token.length > 1 && !stopwords[token];
+        });
+    }
+
+    // Index of the last shard whose first term is <= term, or -1
+    function shardFor(starts, term) {
+        var low = 0, high = starts.length;
+        while (low < high) {
+            var mid = (low + high) >> 1;
+            if (starts[mid] <= term) {
+                low = mid + 1;
+            } else {
+                high = mid;
+            }
+        }
+        return low - 1;
+    }
+
+    function loadShard(meta, index) {
+        if (!shardCache[index]) {
+            shardCache[index] = getJSON(meta.shards[index][1]).then(function (shard) {
+                var previous = "";
+                shard.terms = shard.terms.map(function (entry) {
+                    previous = previous.slice(0, entry[0]) + entry[1];
+                    return previous;
+                });
+                return shard;
+            });
+        }
+        return shardCache[index];
+    }
+
+    // Resolve to {doc id: weight} for a term, or for every term it prefixes
+    function lookup(meta, term, prefix) {
+        var first = Math.max(0, shardFor(meta.starts, term));
+        var last = prefix ? Math.max(0, shardFor(meta.starts, term + "\uffff")) : first;
+        var loads = [];
+        for (var index = first; index <= last && index < meta.shards.length; index++) {
+            loads.push(loadShard(meta, index));
+        }
+        return Promise.all(loads).then(function (shards) {
+            var scores = {};
+            shards.forEach(function (shard) {
+                shard.terms.forEach(function (candidate, position) {
+                    if (prefix ? candidate.lastIndexOf(term, 0) !== 0 : candidate !== term) {
+                        return;
+                    }
+                    var postings = shard.postings[position];
+                    var doc = 0;
+                    for (var i = 0; i < postings.length; i += 2) {
+                        doc += postings[i];
+                        scores[doc] = Math.max(scores[doc] || 0, postings[i + 1]);
+                    }
+                });
+            });
+            return scores;
+        });
+    }
+
+    function loadDoc(meta, id) {
+        var block = Math.floor(id / meta.docs_per_shard);
+        if (!docCache[block]) {
+            docCache[block] = getJSON("docs-" + block + ".json");
+        }
+        return docCache[block].then(function (docs) { return docs[id % meta.docs_per_shard]; });
+    }
+
+    function render(docs) {
+        results.textContent = "";
+        docs.forEach(function (doc) {
+            var card = document.createElement("div");
+            card.className = "technique-card";
+            var heading = document.createElement("h3");
+            var link = document.createElement("a");
+            link.href = base + doc[1];
+            link.textContent = doc[0];
+            heading.appendChild(link);
+            var summary = document.createElement("p");
+            summary.className = "technique-summary";
+            summary.textContent = doc[2];
+            card.appendChild(heading);
+            card.appendChild(summary);
+            results.appendChild(card);
+        });
+    }
+
+    function search(query) {
+        var current = ++generation;
+        loadMeta().then(function (meta) {
+            var terms = tokenize(query);
+            if (!terms.length) {
+                return [];
+            }
+            // Every term must match; the last one may still be being typed
+            return Promise.all(terms.map(function (term, i) {
+                return lookup(meta, term, i === terms.length - 1);
+            })).then(function (matches) {
+                var totals = {};
+                Object.keys(matches[0]).forEach(function (doc) {
+                    var total = 0;
+                    for (var i = 0; i < matches.length; i++) {
+                        if (!(doc in matches[i])) {
+                            return;
+                        }
+                        total += matches[i][doc];
+                    }
+                    totals[doc] = total;
+                });
+                var ranked = Object.keys(totals).map(Number).sort(function (a, b) {
+                    return totals[b] - totals[a] || a - b;
+                }).slice(0, MAX_RESULTS);
+                return Promise.all(ranked.map(function (id) { return loadDoc(meta, id); }));
+            });
+        }).then(function (docs) {
+            if (current === generation) {
+                render(docs);
+            }
+        }).catch(function (error) {
+            if (window.console) {
+                console.error(error);
+            }
+        });
+    }
+
+    var timer = null;
+    input.addEventListener("input", function () {
+        clearTimeout(timer);
+        timer = setTimeout(function () { search(input.value); }, 120);
+    });
+})();
+"""
@@ -0,0 +1,204 @@
+"""
+Structured site manifest, sitemap.xml and link checker for the generated site.
+
+SiteGenerator records every HTML page as it renders it, as a PageRecord: its
+URL, title, the element ids links can point at, and every href and src
+target the page's HTML contains, resolved to URLs relative to the site root.
+They are collected by a PageTargets fed each chunk of the page before it is
+written, so no page is read back. Stylesheets and scripts are recorded as
+assets.
+The records are written to site-manifest.json, and sitemap.xml lists the
+pages for search engines.
+
+check_links() validates a site from its manifest alone, without reading any
+HTML: every internal link must point at a page of the site and, when it has
+a fragment, at one of that page's anchors; page URLs must be unique (also
+ignoring case, since case-insensitive file systems would merge them) and so
+must the anchors within a page. It is a single pass over pages and links.
+
+Usage (checks a built site; exits with status 1 when problems are found):
+    python site_map.py [site]
+"""
+
+import html
+import json
+import posixpath
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import quote, unquote
+from xml.sax.saxutils import escape
+
+from site_output import write_if_changed
+
+SITE_MANIFEST_FILENAME = "site-manifest.json"
+SITEMAP_FILENAME = "sitemap.xml"
+
+_SCHEME = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*:")
+# Attributes naming an element or a link target; values never contain '"' since they are HTML-escaped
+_TARGET_ATTRIBUTE = re.compile(r'\s(href|src|id)="([^"]*)"')
+
+
+class PageRecord(NamedTuple):
+    """A generated page: URL relative to the site root, title, element ids and internal links."""
+    url: str
+    title: str
+    # Which part of the build wrote the page: "technique", "index" or "tags"; "asset"
+    # for stylesheets and scripts, which only serve as link targets
+    kind: str
+    anchors: List[str]
+    # Link targets relative to the site root, optionally with a "#fragment"
+    links: List[str]
+
+
+class LinkProblem(NamedTuple):
+    """A problem found by check_links()."""
+    # "missing-page", "missing-anchor", "duplicate-url" or "duplicate-anchor"
+    kind: str
+    page: str
+    target: str
+    
+    def __str__(self) -> str:
+        return f"{self.page}: {self.kind} {self.target}"
+
+
+def resolve_link(page_url: str, href: str, base_url: str = "") -> Optional[str]:
+    """
+    Resolve an href found on page_url to a URL relative to the site root.
+    
+    Returns:
+        The target with its fragment, if any, or None for links leaving the site
+    """
+    if href.startswith("#"):
+        return page_url + href
+    if base_url and href.startswith(base_url):
+        return href[len(base_url):]
+    if href.startswith("//") or _SCHEME.match(href):
+        return None
+    path, _, fragment = href.partition("#")
+    if path.startswith("/"):
+        path = path.lstrip("/")
+    else:
+        path = posixpath.normpath(posixpath.join(posixpath.dirname(page_url), path))
+    return path + ("#" + fragment if fragment else "")
+
+
+class PageTargets:
+    """
+    The element ids of a page and the targets of its href and src attributes, collected while it renders.
+    
+    feed() takes the page's HTML in the chunks it is written in; a chunk
+    never splits a tag. Targets are resolved with resolve_link(), so they are
+    what a browser on page_url would request; links leaving the site are
+    dropped.
+    """
+    
+    def __init__(self, page_url: str, base_url: str = ""):
+        self.page_url = page_url
+        self.base_url = base_url
+        self.anchors: List[str] = []
+        self.links: List[str] = []
+    
+    def feed(self, chunk: str) -> str:
+        """Collect the ids and targets in chunk; returns chunk, so it can wrap a write."""
+        for attribute, value in _TARGET_ATTRIBUTE.findall(chunk):
+            value = html.unescape(value)
+            if attribute == "id":
+                self.anchors.append(value)
+            else:
+                target = resolve_link(self.page_url, value, self.base_url)
+                if target is not None:
+                    self.links.append(target)
+        return chunk
+
+
+def page_targets(page_url: str, page_html: str, base_url: str = "") -> Tuple[List[str], List[str]]:
+    """Return the element ids and resolved link targets of a piece of a page's HTML (see PageTargets)."""
+    targets = PageTargets(page_url, base_url)
+    targets.feed(page_html)
+    return targets.anchors, targets.links
+
+
+def write_site_manifest(output_dir: Path, pages: Iterable[PageRecord]) -> bool:
+    """Write the page records to SITE_MANIFEST_FILENAME, sorted by URL; returns whether the file changed."""
+    entries = [record._asdict() for record in sorted(pages)]
+    return write_if_changed(Path(output_dir) / SITE_MANIFEST_FILENAME,
+                            json.dumps({"pages": entries}, ensure_ascii=False, separators=(',', ':')))
+
+
+def load_site_manifest(output_dir: Path) -> List[PageRecord]:
+    """Return the page records of a built site, or an empty list if it has no readable manifest."""
+    try:
+        manifest = json.loads((Path(output_dir) / SITE_MANIFEST_FILENAME).read_text(encoding='utf-8'))
+        return [PageRecord(**entry) for entry in manifest["pages"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return []
+
+
+def sitemap_xml(pages: Iterable[PageRecord], site_url: str) -> str:
+    """
+    Return sitemap.xml listing every page under site_url.
+    
+    Search engines require absolute URLs, so site_url should be the
+    published site root, e.g. "https://example.org/hyperimage/".
+    """
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    for url in sorted({record.url for record in pages if record.kind != "asset"}):
+        lines.append(f"  <url><loc>{escape(site_url + quote(url, safe='/%'))}</loc></url>")
+    lines.append("</urlset>\n")
+    return "\n".join(lines)
+
+
+def write_sitemap(output_dir: Path, pages: Iterable[PageRecord], site_url: str) -> bool:
+    """Write sitemap.xml (see sitemap_xml) to output_dir; returns whether the file changed."""
+    return write_if_changed(Path(output_dir) / SITEMAP_FILENAME, sitemap_xml(pages, site_url))
+
+
+def check_links(pages: Iterable[PageRecord]) -> List[LinkProblem]:
+    """Check internal links, anchors and URL uniqueness of a site's pages (see the module docstring)."""
+    pages = list(pages)
+    problems: List[LinkProblem] = []
+    anchors: Dict[str, set] = {}
+    folded: Dict[str, str] = {}
+    for record in pages:
+        url = unquote(record.url)
+        if folded.setdefault(url.casefold(), url) != url or url in anchors:
+            problems.append(LinkProblem("duplicate-url", record.url, folded[url.casefold()]))
+        page_anchors = anchors.setdefault(url, set())
+        for anchor in record.anchors:
+            if anchor in page_anchors:
+                problems.append(LinkProblem("duplicate-anchor", record.url, "#" + anchor))
+            page_anchors.add(anchor)
+    
+    for record in pages:
+        for link in record.links:
+            path, _, fragment = link.partition("#")
+            target = anchors.get(unquote(path))
+            if target is None:
+                problems.append(LinkProblem("missing-page", record.url, link))
+            elif fragment and unquote(fragment) not in target:
+                problems.append(LinkProblem("missing-anchor", record.url, link))
+    return problems
+
+
+def main() -> None:
+    output_dir = Path(sys.argv[1] if len(sys.argv) > 1 else "site")
+    pages = load_site_manifest(output_dir)
+    if not pages:
+        print(f"Error: {output_dir / SITE_MANIFEST_FILENAME} not found; build the site first")
+        sys.exit(1)
+    problems = check_links(pages)
+    links = sum(len(record.links) for record in pages)
+    print(f"{len(pages)} pages, {links} internal links checked")
+    for problem in problems:
+        print(f"  {problem}")
+    if problems:
+        print(f"{len(problems)} problem(s) found")
+        sys.exit(1)
+    print("No problems found")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+Output layer for site builds: write avoidance, staging and deploy deltas.
+
+Every file is written to a temporary sibling and renamed over its target
+only when the bytes differ, so an unchanged file keeps its inode and mtime
+and rsync or CDN sync jobs skip it. Renaming never modifies the old file in
+place, which is what makes staging cheap:
+
+- stage_directory() creates a staging copy of the output directory made of
+  hard links, so no file data is copied.
+- The build writes into the staging copy; rewritten files get new inodes,
+  and the published site never sees a half-written build.
+- publish_directory() diffs the staging copy against the published site,
+  records the added, changed and removed files, and swaps the directories
+  atomically: the output directory is a symbolic link to the current
+  release, replaced in a single rename.
+
+rebase_directory() emits a site rendered once with a placeholder base URL
+as a copy under another base URL, through the same write avoidance. An
+empty base URL means links relative to each file, through relative_root(),
+as a build rendered with that base URL writes them.
+
+Names starting with "." (build manifests and caches) are internal: they are
+staged and published like any file but left out of the deploy delta.
+"""
+
+import filecmp
+import json
+import os
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, TextIO, Union
+
+STAGING_SUFFIX = ".staging"
+# Published builds live in "<output_dir>.release-<n>", with output_dir a symbolic link to the current one
+RELEASE_SUFFIX = ".release-"
+DELTA_FILENAME = ".deploy-delta.json"
+# Precompressed siblings, kept up to date by static_assets.precompress_directory()
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+
+def _temp_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+
+def replace_if_changed(temp_path: Path, path: Path) -> bool:
+    """
+    Move temp_path over path unless path already holds the same bytes.
+    
+    Returns:
+        Whether path was replaced; temp_path is removed either way
+    """
+    try:
+        unchanged = (path.stat().st_size == temp_path.stat().st_size
+                     and filecmp.cmp(temp_path, path, shallow=False))
+    except OSError:
+        unchanged = False
+    if unchanged:
+        temp_path.unlink()
+        return False
+    os.replace(temp_path, path)
+    return True
+
+
+def write_if_changed(path: Path, data: Union[str, bytes]) -> bool:
+    """Write text (UTF-8) or bytes to path unless it already holds them; returns whether it was written."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = _temp_path(path)
+    if isinstance(data, str):
+        temp_path.write_text(data, encoding='utf-8')
+    else:
+        temp_path.write_bytes(data)
+    return replace_if_changed(temp_path, path)
+
+
+@contextmanager
+def open_if_changed(path: Path) -> Iterator[TextIO]:
+    """
+    Open a text file for streaming writes that replace path only if its bytes change.
+    
+    Nothing is written to path if the block raises.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = _temp_path(path)
+    try:
+        with temp_path.open('w', encoding='utf-8') as f:
+            yield f
+    except BaseException:
+        temp_path.unlink()
+        raise
+    replace_if_changed(temp_path, path)
+
+
+def _walk_files(root: Path) -> Iterator[str]:
+    """Yield the paths of every file under root, relative to it, in "/" form."""
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        relative = Path(directory).relative_to(root).as_posix()
+        for name in sorted(filenames):
+            yield name if relative == "." else f"{relative}/{name}"
+
+
+def _is_internal(relative: str) -> bool:
+    return any(part.startswith(".") for part in relative.split("/"))
+
+
+def stage_directory(output_dir: Path) -> Path:
+    """
+    Create a fresh staging copy of output_dir next to it, hard-linking every file.
+    
+    Files are copied (with their mtimes) where the file system does not support
+    hard links.
+    
+    Returns:
+        The staging directory
+    """
+    output_dir = Path(output_dir)
+    staging_dir = output_dir.with_name(output_dir.name + STAGING_SUFFIX)
+    if staging_dir.exists():
+        shutil.rmtree(staging_dir)
+    staging_dir.mkdir(parents=True)
+    if output_dir.is_dir():
+        for relative in _walk_files(output_dir):
+            source = output_dir / relative
+            target = staging_dir / relative
+            target.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(source, target)
+            except OSError:
+                shutil.copy2(source, target)
+    return staging_dir
+
+
+def diff_directories(new_dir: Path, old_dir: Path) -> Dict[str, List[str]]:
+    """
+    List the files added, changed and removed in new_dir relative to old_dir.
+    
+    Files still sharing an inode with old_dir were not rewritten. A rewritten
+    file whose bytes are unchanged is hard-linked back to the old file, so it
+    keeps its mtime and is not reported. Internal ("."-prefixed) names are
+    left out.
+    """
+    new_dir, old_dir = Path(new_dir), Path(old_dir)
+    delta: Dict[str, List[str]] = {"added": [], "changed": [], "removed": []}
+    new_files = set()
+    for relative in _walk_files(new_dir):
+        if _is_internal(relative):
+            continue
+        new_files.add(relative)
+        new_path, old_path = new_dir / relative, old_dir / relative
+        try:
+            old_stat = old_path.stat()
+        except OSError:
+            delta["added"].append(relative)
+            continue
+        new_stat = new_path.stat()
+        if (new_stat.st_ino, new_stat.st_dev) == (old_stat.st_ino, old_stat.st_dev):
+            continue
+        if new_stat.st_size == old_stat.st_size and filecmp.cmp(new_path, old_path, shallow=False):
+            temp_path = _temp_path(new_path)
+            try:
+                os.link(old_path, temp_path)
+            except OSError:
+                continue
+            os.replace(temp_path, new_path)
+            continue
+        delta["changed"].append(relative)
+    if old_dir.is_dir():
+        delta["removed"] = [relative for relative in _walk_files(old_dir)
+                            if not _is_internal(relative) and relative not in new_files]
+    return delta
+
+
+def rebase_directory(source_dir: Path, target_dir: Path, placeholder: str, base_url: str,
+                     overrides: Optional[Dict[str, Union[str, bytes]]] = None) -> Dict[str, List[str]]:
+    """
+    Copy a site rendered with a placeholder base URL to target_dir, substituting base_url.
+    
+    With an empty base_url the placeholder becomes each file's
+    relative_root(), the rule SiteGenerator applies to the pages it renders
+    with an empty base URL; overrides maps relative
+    paths to the content written instead. Only files whose bytes change are
+    written. Files in target_dir that the source does not have
+    are removed, except internal ("."-prefixed) names, which belong to each
+    directory, and precompressed siblings of current files.
+    
+    Returns:
+        The files "written", "skipped" and "removed", relative to target_dir
+    """
+    source_dir, target_dir = Path(source_dir), Path(target_dir)
+    marker = placeholder.encode('utf-8')
+    result: Dict[str, List[str]] = {"written": [], "skipped": [], "removed": []}
+    source_files = set()
+    for relative in _walk_files(source_dir):
+        if _is_internal(relative):
+            continue
+        source_files.add(relative)
+        if overrides and relative in overrides:
+            data = overrides[relative]
+        else:
+            data = (source_dir / relative).read_bytes()
+        if isinstance(data, bytes) and marker in data:
+            data = data.replace(marker, (base_url or relative_root(relative)).encode('utf-8'))
+        result["written" if write_if_changed(target_dir / relative, data) else "skipped"].append(relative)
+    
+    if target_dir.is_dir():
+        for relative in list(_walk_files(target_dir)):
+            if _is_internal(relative) or relative in source_files:
+                continue
+            if relative.endswith(COMPRESSED_SUFFIXES) and relative[:-3] in source_files:
+                continue
+            (target_dir / relative).unlink()
+            result["removed"].append(relative)
+        for directory, _, _ in sorted(os.walk(target_dir), reverse=True):
+            if directory != str(target_dir) and not os.listdir(directory):
+                os.rmdir(directory)
+    return result
+
+
+def relative_root(relative: str) -> str:
+    """Return the path from a file, given relative to the site root in "/" form, back to the root ("", "../", ...)."""
+    return "../" * relative.count("/")
+
+
+def _release_number(release_dir: Optional[Path]) -> int:
+    try:
+        return int(release_dir.name.rpartition(RELEASE_SUFFIX)[2]) if release_dir is not None else 0
+    except ValueError:
+        return 0
+
+
+def publish_directory(staging_dir: Path, output_dir: Path) -> Dict[str, List[str]]:
+    """
+    Replace output_dir with staging_dir, writing the deploy delta into it first.
+    
+    staging_dir is renamed to the next release directory, "<output_dir>.release-<n>",
+    and output_dir, a symbolic link to the current release, is replaced by a
+    link to the new one with os.replace(). That is a single rename, so
+    output_dir holds either the old or the new build in full at every
+    instant. The previous release is removed afterwards.
+    
+    A plain output_dir (from builds before releases were linked, or where
+    the file system has no symbolic links) is swapped by two renames
+    instead, leaving it missing for the instant between them.
+    
+    Returns:
+        The delta written to DELTA_FILENAME: files "added", "changed" and "removed"
+    """
+    staging_dir, output_dir = Path(staging_dir), Path(output_dir)
+    delta = diff_directories(staging_dir, output_dir)
+    write_if_changed(staging_dir / DELTA_FILENAME, json.dumps(delta, indent=2, ensure_ascii=False))
+    
+    previous = output_dir.parent / os.readlink(output_dir) if output_dir.is_symlink() else None
+    number = _release_number(previous) + 1
+    release_dir = output_dir.with_name(f"{output_dir.name}{RELEASE_SUFFIX}{number}")
+    while release_dir.exists():
+        number += 1
+        release_dir = output_dir.with_name(f"{output_dir.name}{RELEASE_SUFFIX}{number}")
+    os.rename(staging_dir, release_dir)
+    
+    link = output_dir.with_name(f".{output_dir.name}.{os.getpid()}.link")
+    try:
+        if link.is_symlink():
+            link.unlink()
+        os.symlink(release_dir.name, link, target_is_directory=True)
+    except OSError:
+        link = None
+    
+    if link is not None and (previous is not None or not output_dir.exists()):
+        os.replace(link, output_dir)
+        if previous is not None and previous.is_dir():
+            shutil.rmtree(previous)
+        return delta
+    
+    # Plain output directory: move it aside, then put the link (or the release itself) in its place
+    retired_dir = output_dir.with_name(output_dir.name + ".old")
+    if retired_dir.exists():
+        shutil.rmtree(retired_dir)
+    if output_dir.exists():
+        os.rename(output_dir, retired_dir)
+    if link is not None:
+        os.replace(link, output_dir)
+    else:
+        os.rename(release_dir, output_dir)
+    if retired_dir.exists():
+        shutil.rmtree(retired_dir)
+    return delta
+
+
+def discard_staging(staging_dir: Path):
+    """Remove a staging directory whose build failed, leaving the published site as it was."""
+    shutil.rmtree(staging_dir, ignore_errors=True)
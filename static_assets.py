@@ -0,0 +1,173 @@
+"""
+Static asset pipeline for the generated site.
+
+Assets (the stylesheet and search script) are written under content-hashed
+file names such as assets/style.3f9a1c0b2d.css, so a CDN can cache them
+indefinitely: a changed asset gets a new URL. Fingerprints are computed from
+the asset text itself, so pages can reference the final URL while they are
+rendered and never need rewriting afterwards.
+
+precompress_directory() writes .gz and .br siblings next to every HTML, CSS,
+JS and JSON output, so static hosts (nginx gzip_static/brotli_static, most
+CDNs) serve compressed bytes without compressing on the fly. Siblings carry
+their source's modification time, which is how later builds tell which
+files changed. Brotli is optional: without the brotli package only .gz
+files are written.
+"""
+
+import gzip
+import hashlib
+import os
+import posixpath
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from site_output import write_if_changed
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+FINGERPRINT_LENGTH = 10
+COMPRESSIBLE_SUFFIXES = (".html", ".css", ".js", ".json")
+# Brotli's top quality (11) is several times slower for a few percent smaller pages
+BROTLI_QUALITY = 9
+GZIP_LEVEL = 9
+
+_CSS_STRING_OR_COMMENT = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.DOTALL)
+_CSS_STRING = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')')
+
+
+def minify_css(css: str) -> str:
+    """
+    Remove comments and insignificant whitespace from a stylesheet.
+    
+    Quoted strings are kept as they are. Spaces before a colon are kept, since
+    they are significant in selectors ("a :hover").
+    """
+    css = _CSS_STRING_OR_COMMENT.sub(lambda match: match.group(1) or " ", css)
+    parts = _CSS_STRING.split(css)
+    for i in range(0, len(parts), 2):
+        text = re.sub(r"\s+", " ", parts[i])
+        text = re.sub(r" ?([{};,>]) ?", r"\1", text)
+        parts[i] = text.replace(": ", ":").replace(";}", "}")
+    return "".join(parts).strip()
+
+
+def fingerprint(url: str, content: str) -> str:
+    """Return url with a hash of content inserted before its extension ("a/b.css" -> "a/b.<hash>.css")."""
+    stem, extension = posixpath.splitext(url)
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:FINGERPRINT_LENGTH]
+    return f"{stem}.{digest}{extension}"
+
+
+def write_asset(output_dir: Path, url: str, content: str) -> str:
+    """
+    Write content under its fingerprinted URL and remove other versions of the asset.
+    
+    Args:
+        output_dir: Site root
+        url: Unversioned asset URL relative to the site root, e.g. "assets/style.css"
+        content: Asset text
+    
+    Returns:
+        The fingerprinted URL written
+    """
+    fingerprinted = fingerprint(url, content)
+    path = Path(output_dir) / Path(*fingerprinted.split("/"))
+    write_if_changed(path, content)
+    
+    stem, extension = posixpath.splitext(posixpath.basename(url))
+    versions = re.compile(re.escape(stem) + r"(?:\.[0-9a-f]{%d})?" % FINGERPRINT_LENGTH + re.escape(extension)
+                          + r"(?:\.gz|\.br)?")
+    for other in path.parent.iterdir():
+        if versions.fullmatch(other.name) and not other.name.startswith(path.name):
+            other.unlink()
+    return fingerprinted
+
+
+def _is_current(sibling: Path, mtime_ns: int) -> bool:
+    try:
+        return sibling.stat().st_mtime_ns == mtime_ns
+    except OSError:
+        return False
+
+
+def _holds(sibling: Path, data: bytes, decompress: Callable[[bytes], bytes]) -> bool:
+    """Return whether sibling is a compressed copy of data."""
+    try:
+        return decompress(sibling.read_bytes()) == data
+    except Exception:
+        return False
+
+
+def compress_file(path: Path):
+    """
+    Write path.gz (and path.br when brotli is installed) with path's modification time.
+    
+    A sibling that already holds path's bytes (e.g. after the source was
+    rewritten unchanged or copied without its mtime) only gets its
+    modification time updated, since decompressing costs a fraction of
+    compressing. Siblings are replaced by rename, never rewritten in place,
+    so a staged sibling hard-linked to the published site is left intact.
+    """
+    data = path.read_bytes()
+    stat = path.stat()
+    codecs = [(".gz", lambda: gzip.compress(data, GZIP_LEVEL, mtime=0), gzip.decompress)]
+    if brotli is not None:
+        codecs.append((".br", lambda: brotli.compress(data, quality=BROTLI_QUALITY), brotli.decompress))
+    for suffix, compress, decompress in codecs:
+        sibling = path.with_name(path.name + suffix)
+        if _is_current(sibling, stat.st_mtime_ns):
+            continue
+        if _holds(sibling, data, decompress):
+            os.utime(sibling, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            continue
+        compressed = compress()
+        temp_path = sibling.with_name(f".{sibling.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(compressed)
+        os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(temp_path, sibling)
+
+
+def precompress_directory(directory: Path, workers: Optional[int] = None) -> List[Path]:
+    """
+    Bring the .gz/.br siblings of every compressible file in directory up to date.
+    
+    Files and directories whose names start with "." are skipped. Siblings
+    whose source is gone are removed. Files are compressed on a thread pool;
+    zlib and brotli release the GIL while compressing.
+    
+    Args:
+        directory: Site root
+        workers: Threads used for compression; defaults to the CPU count
+    
+    Returns:
+        The source files whose siblings were out of date (see compress_file)
+    """
+    directory = Path(directory)
+    suffixes = (".gz", ".br") if brotli is not None else (".gz",)
+    stale: List[Path] = []
+    for root, dirnames, filenames in os.walk(directory):
+        dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+        root_path = Path(root)
+        for name in filenames:
+            path = root_path / name
+            if name.endswith((".gz", ".br")):
+                if not (root_path / name[:-3]).exists():
+                    path.unlink()
+            elif name.endswith(COMPRESSIBLE_SUFFIXES) and not name.startswith("."):
+                mtime_ns = path.stat().st_mtime_ns
+                if not all(_is_current(path.with_name(name + suffix), mtime_ns) for suffix in suffixes):
+                    stale.append(path)
+    
+    if len(stale) > 1 and workers != 1:
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            list(executor.map(compress_file, stale))
+    else:
+        for path in stale:
+            compress_file(path)
+    return stale
@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture(scope="session")
+def real_catalog():
+    """The checked-in techniques, each given the references section their modules leave out."""
+    from techniques import TECHNIQUES
+    catalog = {}
+    for number, (name, data) in enumerate(TECHNIQUES.items()):
+        catalog[name] = dict(data)
+        catalog[name].setdefault("references", [
+            {"citation": f"Reference {number} for {name} & <co-workers>", "doi": f"10.5555/{number}" if number % 2 else ""}])
+    return catalog
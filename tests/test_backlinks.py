@@ -0,0 +1,61 @@
+"""Tests for "Referenced by" backlinks and the site link graph."""
+
+import json
+import re
+
+from benchmarks.synthetic import make_catalog
+from framework import LINK_GRAPH_FILENAME, SiteGenerator
+
+
+def build(catalog, output_dir):
+    site = SiteGenerator(output_dir)
+    for name, data in catalog.items():
+        site.add_technique(name, data)
+    report = site.generate_all_pages(incremental=True)
+    return site, report
+
+
+def page_links(site, output_dir):
+    """Return technique name -> (technique names linked from the body, names listed under "Referenced by")."""
+    names = {url: name for name, url in site.technique_urls.items()}
+    links = {}
+    for name, url in site.technique_urls.items():
+        page = (output_dir / url).read_text(encoding="utf-8")
+        backlinks = re.search(r'<section id="referenced-by".*?</section>', page, re.DOTALL)
+        body = re.sub(r'<section id="(related|referenced-by)".*?</section>', "", page, flags=re.DOTALL)
+        linked = {names[href] for href in re.findall(r'href="([^"#]+)', body) if href in names} - {name}
+        referenced_by = [names[href] for href in re.findall(r'href="([^"]+)"', backlinks.group())] if backlinks else []
+        links[name] = (linked, referenced_by)
+    return links
+
+
+def test_backlinks_and_link_graph_invert_the_links_pages_emit(tmp_path):
+    catalog = make_catalog(10)
+    output_dir = tmp_path / "site"
+    site, _ = build(catalog, output_dir)
+    links = page_links(site, output_dir)
+    assert any(linked for linked, _ in links.values())
+    for name, (_, referenced_by) in links.items():
+        assert referenced_by == sorted(other for other, (linked, _) in links.items() if name in linked)
+
+    graph = json.loads((output_dir / LINK_GRAPH_FILENAME).read_text(encoding="utf-8"))
+    assert graph["techniques"] == [[name, site.technique_urls[name]] for name in sorted(catalog)]
+    assert [{graph["techniques"][target][0] for target in targets} for targets in graph["links"]] == [
+        links[name][0] for name in sorted(catalog)]
+
+
+def test_a_new_link_updates_the_target_page_without_changing_its_data(tmp_path):
+    catalog = make_catalog(10)
+    output_dir = tmp_path / "site"
+    site, _ = build(catalog, output_dir)
+    links = page_links(site, output_dir)
+    source, target = next((source, target) for source in catalog for target in catalog
+                          if source != target and source not in links[target][1])
+
+    catalog = dict(catalog, **{source: dict(catalog[source], abstract=catalog[source]["abstract"] + f" See {target}.")})
+    site, report = build(catalog, output_dir)
+    assert site.technique_urls[target] in report.written
+    assert source in page_links(site, output_dir)[target][1]
+    graph = json.loads((output_dir / LINK_GRAPH_FILENAME).read_text(encoding="utf-8"))
+    names = [name for name, _ in graph["techniques"]]
+    assert names.index(target) in graph["links"][names.index(source)]
@@ -0,0 +1,45 @@
+"""Tests for the single-file book export."""
+
+import re
+
+import pytest
+
+from benchmarks.synthetic import make_catalog
+from framework import SiteGenerator, technique_filename
+
+
+@pytest.fixture(scope="module")
+def site(tmp_path_factory):
+    catalog = make_catalog(12)
+    name, other = list(catalog)[:2]
+    catalog[name] = dict(catalog[name], abstract=catalog[name]["abstract"]
+                         + f" See [its references]({technique_filename(other)}.html#references)"
+                         + f" and `{other}` in code.")
+    site = SiteGenerator(tmp_path_factory.mktemp("site"))
+    for technique_name, data in catalog.items():
+        site.add_technique(technique_name, data)
+    return site
+
+
+def test_html_book_has_no_broken_anchors(site, tmp_path):
+    book = site.write_book(tmp_path / "book.html").read_text(encoding="utf-8")
+    ids = set(re.findall(r'\sid="([^"]+)"', book))
+    targets = re.findall(r'\shref="#([^"]*)"', book)
+    assert len(targets) > 3 * len(site.techniques)
+    assert [target for target in targets if target not in ids] == []
+    assert not re.findall(r'\shref="(?!#|https?:)', book)
+
+
+def test_markdown_book_nests_techniques_and_links_within_the_book(site, tmp_path):
+    book = site.write_book(tmp_path / "book.md").read_text(encoding="utf-8")
+    assert re.findall(r"^# .*", book, re.MULTILINE) == ["# HyperImage Technique Reference"]
+    assert len(re.findall(r"^## ", book, re.MULTILINE)) == 1 + len(site.techniques)
+    ids = set(re.findall(r'<a id="([^"]+)"></a>', book))
+    targets = re.findall(r"\]\(#([^)]*)\)", book)
+    assert len(targets) > 2 * len(site.techniques)
+    assert [target for target in targets if target not in ids] == []
+
+    name, other = list(site.techniques)[:2]
+    anchors = site._book_anchors()
+    assert f"[its references](#{anchors[other]}--references)" in book
+    assert f"`{other}`" in book
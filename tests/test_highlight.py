@@ -0,0 +1,44 @@
+"""Tests for build-time code highlighting and its caches."""
+
+import pytest
+
+import framework
+from benchmarks.synthetic import make_catalog
+from framework import SiteGenerator
+from highlight import HighlightCache, highlight_code
+
+pytest.importorskip("pygments")
+
+
+def test_highlighted_tokens_get_spans_and_text_is_escaped():
+    markup = highlight_code("python", "def f(x):\n    return x < 1  # small\n")
+    assert '<span class="k">def</span>' in markup and '<span class="nf">f</span>' in markup
+    assert '<span class="c"># small</span>' in markup and "&lt;" in markup
+    assert highlight_code("no-such-language", "x") is None
+    assert highlight_code("", "x") is None
+
+
+def test_cache_reuses_blocks_and_persists(tmp_path):
+    cache = HighlightCache(path=tmp_path / "cache.json")
+    first = cache.highlight("python", "import os\n")
+    assert cache.highlight("python", "import os\n") == first
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.save()
+    reloaded = HighlightCache(path=tmp_path / "cache.json")
+    assert reloaded.highlight("python", "import os\n") == first and reloaded.hits == 1
+
+
+def test_new_highlight_version_rerenders_unchanged_pages(tmp_path, monkeypatch):
+    catalog = make_catalog(3)
+
+    def build():
+        site = SiteGenerator(tmp_path / "site")
+        for name, data in catalog.items():
+            site.add_technique(name, data)
+        return site.generate_all_pages(incremental=True)
+
+    build()
+    assert not [name for name in build().written if name.endswith(".html")]
+    monkeypatch.setattr(framework, "HIGHLIGHT_VERSION", "changed")
+    written = build().written
+    assert all(f"{framework.technique_filename(name)}.html" in written for name in catalog)
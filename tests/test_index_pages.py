@@ -0,0 +1,63 @@
+"""Tests for the paginated and sharded index listing."""
+
+import json
+import re
+
+from benchmarks.synthetic import make_catalog
+from framework import SiteGenerator
+
+
+def build(catalog, output_dir, **options):
+    site = SiteGenerator(output_dir, staging=False, **options)
+    for name, data in catalog.items():
+        site.add_technique(name, data)
+    site.generate_all_pages()
+
+
+def listed(output_dir, url):
+    page = (output_dir / url).read_text(encoding="utf-8")
+    return re.findall(r'<div class="technique-card">\s*<h3><a [^>]*>([^<]*)</a></h3>', page)
+
+
+def read_manifest(output_dir):
+    return json.loads((output_dir / "index" / "manifest.json").read_text(encoding="utf-8"))
+
+
+def test_index_pages_list_every_technique_once_in_name_order(tmp_path):
+    catalog = make_catalog(11)
+    output_dir = tmp_path / "site"
+    build(catalog, output_dir, index_page_size=4)
+
+    manifest = read_manifest(output_dir)
+    assert (manifest["page_size"], manifest["techniques"], manifest["sharded"]) == (4, 11, False)
+    [shard] = manifest["shards"]
+    assert [page["url"] for page in shard["pages"]] == ["index.html", "index/page-2.html", "index/page-3.html"]
+    pages = [listed(output_dir, page["url"]) for page in shard["pages"]]
+    assert [len(names) for names in pages] == [4, 4, 3]
+    assert sum(pages, []) == sorted(catalog)
+    assert [(page["first"], page["last"]) for page in shard["pages"]] == [(names[0], names[-1]) for names in pages]
+
+    build(catalog, output_dir, index_page_size=6)
+    assert sorted(path.name for path in (output_dir / "index").iterdir()) == ["manifest.json", "page-2.html"]
+
+
+def test_sharded_index_groups_techniques_under_folded_labels(tmp_path):
+    catalog = make_catalog(12)
+    output_dir = tmp_path / "site"
+    build(catalog, output_dir, index_page_size=2,
+          index_shard=lambda ref: ref.technique_name[0] if len(ref.technique_name) % 2 else ref.technique_name[0].lower())
+
+    manifest = read_manifest(output_dir)
+    assert manifest["sharded"] and manifest["techniques"] == 12
+    initials = sorted({name[0].upper() for name in catalog})
+    assert [shard["slug"] for shard in manifest["shards"]] == [initial.lower() for initial in initials]
+    for shard in manifest["shards"]:
+        members = sorted(name for name in catalog if name[0].lower() == shard["slug"])
+        assert shard["count"] == len(members)
+        assert [page["url"] for page in shard["pages"]][0] == f"index/{shard['slug']}/index.html"
+        assert sum((listed(output_dir, page["url"]) for page in shard["pages"]), []) == members
+
+    index = (output_dir / "index.html").read_text(encoding="utf-8")
+    assert listed(output_dir, "index.html") == []
+    assert [f"index/{shard['slug']}/index.html" for shard in manifest["shards"]] == re.findall(
+        r'href="(index/[^"]+)" class="keyword-tag"', index)
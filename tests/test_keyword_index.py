@@ -0,0 +1,71 @@
+"""Tests for keyword normalization and the tag pages built from it."""
+
+import re
+
+import pytest
+
+import framework
+from benchmarks.synthetic import make_catalog
+from framework import SiteGenerator
+from keyword_index import KeywordIndex, normalize_keyword
+
+
+@pytest.mark.parametrize("keyword, key", [
+    ("Pigments", "pigment"),
+    ("pigment", "pigment"),
+    ("X-ray", "x ray"),
+    ("x ray", "x ray"),
+    ("Binding media", "binding medium"),
+    ("Raman spectra", "raman spectrum"),
+    ("Glasses", "glass"),
+    ("Varnish layers", "varnish layer"),
+    ("Impurities", "impurity"),
+    ("Optics", "optics"),
+    ("Mass analysis", "mass analysis"),
+    ("CARS", "cars"),
+    ("Cars", "car"),
+    ("--", ""),
+])
+def test_keywords_fold_case_punctuation_and_plurals(keyword, key):
+    assert normalize_keyword(keyword) == key
+
+
+def test_spellings_share_one_facet_labelled_by_the_most_common():
+    index = KeywordIndex()
+    index.add("B", ["Pigments", "pigment", "X-ray"])
+    index.add("A", ["pigment", "--"])
+    index.add("C", ["Pigment", "x ray", "pigment"])
+    assert [(entry.key, entry.label, entry.slug, entry.techniques) for entry in index.entries()] == [
+        ("pigment", "pigment", "pigment", ["A", "B", "C"]),
+        ("x ray", "X-ray", "x-ray", ["B", "C"]),
+    ]
+    assert index.key("Pigments") == "pigment" and index.key("--") is None and index.key("unseen") is None
+
+
+def test_tag_pages_are_paginated_and_leftover_pages_removed(tmp_path, monkeypatch):
+    monkeypatch.setattr(framework, "TECHNIQUES_PER_TAG_PAGE", 2)
+    catalog = make_catalog(5)
+    spellings = ["Pigments", "pigment", "PIGMENT", "pigments", "Pigment"]
+    for name, spelling in zip(catalog, spellings):
+        catalog[name] = dict(catalog[name], keywords=[spelling, f"Only {name}"])
+
+    def build(catalog):
+        site = SiteGenerator(tmp_path / "site", staging=False)
+        for name, data in catalog.items():
+            site.add_technique(name, data)
+        site.generate_all_pages()
+
+    build(catalog)
+    tag_dir = tmp_path / "site" / "tags" / "pigment"
+    assert sorted(path.name for path in tag_dir.iterdir()) == ["index.html", "page-2.html", "page-3.html"]
+    listed = []
+    for page in ("index.html", "page-2.html", "page-3.html"):
+        listed += re.findall(r"<h3><a [^>]*>([^<]*)</a></h3>", (tag_dir / page).read_text(encoding="utf-8"))
+    assert listed == sorted(catalog)
+    facet = (tmp_path / "site" / "tags" / "index.html").read_text(encoding="utf-8")
+    assert facet.count('href="../tags/pigment/index.html"') == 1
+    assert '<span class="keyword-count">5</span>' in facet
+
+    build(dict(list(catalog.items())[:2]))
+    assert sorted(path.name for path in tag_dir.iterdir()) == ["index.html"]
+    assert not (tmp_path / "site" / "tags" / normalize_keyword(f"Only {list(catalog)[4]}").replace(" ", "-")).exists()
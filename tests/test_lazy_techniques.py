@@ -0,0 +1,46 @@
+"""Tests for techniques registered by loader instead of by data."""
+
+import json
+import os
+
+from benchmarks.synthetic import make_catalog
+from framework import LazyTechniqueReference, SiteGenerator, technique_filename, technique_loader
+
+
+def write_sources(catalog, directory):
+    directory.mkdir()
+    paths = {}
+    for number, (name, data) in enumerate(catalog.items()):
+        paths[name] = directory / f"technique_{number}.json"
+        paths[name].write_text(json.dumps(data), encoding="utf-8")
+    return paths
+
+
+def test_edits_to_a_source_file_are_rebuilt_by_a_long_lived_generator(tmp_path):
+    catalog = make_catalog(4)
+    paths = write_sources(catalog, tmp_path / "data")
+    site = SiteGenerator(tmp_path / "site")
+    for name, path in paths.items():
+        site.add_technique(name, path)
+    site.generate_all_pages(incremental=True)
+
+    name = next(iter(catalog))
+    path = paths[name]
+    edited = dict(catalog[name], one_line_summary="An edited summary.")
+    path.write_text(json.dumps(edited), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    page = f"{technique_filename(name)}.html"
+    assert page in site.generate_all_pages(incremental=True).written
+    assert "An edited summary." in (tmp_path / "site" / page).read_text(encoding="utf-8")
+    assert site.techniques[name].one_line_summary == "An edited summary."
+    assert "An edited summary." in (tmp_path / "site" / "index.html").read_text(encoding="utf-8")
+
+
+def test_callable_loaders_are_hashed_on_every_call():
+    data = dict(next(iter(make_catalog(1).values())))
+    ref = LazyTechniqueReference("Technique", technique_loader(lambda: data))
+    before = ref.content_hash()
+    data["abstract"] = "Changed."
+    assert ref.content_hash() != before
@@ -0,0 +1,25 @@
+"""Tests for the inline markdown parser."""
+
+import time
+
+import pytest
+
+from markdown_parser import Code, Emphasis, Link, Strong, Text, parse_inline, parse_markdown
+
+
+def test_inline_markup():
+    assert parse_inline("a **b** *c* `d` [e](f)") == [
+        Text("a "), Strong([Text("b")]), Text(" "), Emphasis([Text("c")]), Text(" "), Code("d"), Text(" "),
+        Link([Text("e")], "f")]
+
+
+def test_unmatched_delimiters_stay_text():
+    assert parse_inline("**a *b* c") == [Text("*"), Emphasis([Text("a ")]), Text("b* c")]
+
+
+@pytest.mark.parametrize("text", ["***x" * 40, "**x *" * 25, "**x *" * 1000, "[" + "**x *" * 1000 + "](u)"])
+def test_unmatched_emphasis_is_not_exponential(text):
+    start = time.perf_counter()
+    paragraph, = parse_markdown(text)
+    assert time.perf_counter() - start < 5
+    assert paragraph.children
@@ -0,0 +1,68 @@
+"""Tests for TF-IDF related techniques."""
+
+import re
+
+import pytest
+
+import related
+from benchmarks.synthetic import make_catalog
+from framework import SiteGenerator
+from related import RelatedTechniques, top_k_similar
+from search_index import field_weights
+
+np = pytest.importorskip("numpy")
+sparse = pytest.importorskip("scipy.sparse")
+
+
+def brute_force_top_k(matrix, k):
+    """Rank every other row by similarity, ties by row index, as top_k_similar documents."""
+    dense = matrix.dot(matrix.T).toarray()
+    result = []
+    for row, scores in enumerate(dense.tolist()):
+        ranked = sorted((index for index in range(len(scores)) if index != row),
+                        key=lambda index: (-scores[index], index))
+        result.append([(index, scores[index]) for index in ranked[:k] if scores[index] >= related.MIN_SIMILARITY])
+    return result
+
+
+@pytest.mark.parametrize("k", [1, 3, 11, 20])
+def test_blocked_top_k_matches_brute_force_ranking(k, monkeypatch):
+    monkeypatch.setattr(related, "BLOCK_ROWS", 5)
+    rng = np.random.default_rng(0)
+    # Small integer weights make similarities exact, so many of them tie
+    matrix = sparse.csr_matrix(rng.integers(0, 3, (12, 8)) * (rng.random((12, 8)) < 0.4), dtype=np.float32)
+    assert top_k_similar(matrix, k) == brute_force_top_k(matrix, k)
+
+
+def test_techniques_sharing_terms_are_related():
+    techniques = RelatedTechniques()
+    techniques.add("Raman", {"raman": 10, "spectroscopy": 3, "pigment": 2, "laser": 1})
+    techniques.add("SERS", {"raman": 6, "spectroscopy": 3, "silver": 2, "laser": 1})
+    techniques.add("XRF", {"fluorescence": 10, "elemental": 3, "pigment": 2})
+    techniques.add("PIXE", {"elemental": 8, "fluorescence": 2, "proton": 4})
+    techniques.add("Radiography", {"radiography": 5, "film": 3})
+    result = techniques.compute(k=2)
+    assert result["Raman"][0] == "SERS" and result["SERS"][0] == "Raman"
+    assert result["XRF"][0] == "PIXE" and result["PIXE"] == ["XRF"]
+    assert result["Radiography"] == []
+    assert all(name not in names and len(names) <= 2 for name, names in result.items())
+    assert techniques.compute(k=0) == {}
+
+
+def test_pages_list_their_top_k_related_techniques(tmp_path):
+    catalog = make_catalog(8)
+    site = SiteGenerator(tmp_path / "site", related_count=3)
+    for name, data in catalog.items():
+        site.add_technique(name, data)
+    site.generate_all_pages()
+
+    names = {url: name for name, url in site.technique_urls.items()}
+    techniques = RelatedTechniques()
+    for name, ref in site.techniques.items():
+        techniques.add(name, field_weights(ref.search_fields()))
+    expected = techniques.compute(k=3)
+    for name in catalog:
+        page = (tmp_path / "site" / site.technique_urls[name]).read_text(encoding="utf-8")
+        section = re.search(r'<section id="related".*?</section>', page, re.DOTALL)
+        listed = [names[url] for url in re.findall(r'href="([^"]+)"', section.group())] if section else []
+        assert listed == expected[name] and 0 < len(listed) <= 3
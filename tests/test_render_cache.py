@@ -0,0 +1,66 @@
+"""Tests for the content-addressed cache of rendered sections."""
+
+import pytest
+
+import framework
+from benchmarks.synthetic import make_catalog
+from framework import CrossLinker, MarkdownText, RenderCache, create_reference_page, technique_filename
+
+URLS = {"Raman Imaging": "raman_imaging.html", "X-ray Holography": "x_ray_holography.html"}
+TEXT = "Pair **Raman Imaging** with X-ray Holography."
+
+
+def test_cached_sections_match_uncached_rendering():
+    catalog = make_catalog(4)
+    urls = {name: f"{technique_filename(name)}.html" for name in catalog}
+    cache = RenderCache()
+    for name, data in catalog.items():
+        ref = create_reference_page(name, data)
+        assert ref.to_html(urls, cache=cache) == ref.to_html(urls)
+    misses = cache.misses
+    for name, data in catalog.items():
+        ref = create_reference_page(name, data)
+        assert ref.to_html(urls, cache=cache) == ref.to_html(urls)
+    assert cache.misses == misses and cache.hits >= misses
+
+
+def test_shared_text_is_rendered_once_per_link_set():
+    cache = RenderCache()
+    linker = CrossLinker(URLS)
+    first = cache.render(MarkdownText(TEXT), linker, "Stereo Photogrammetry")
+    assert cache.render(MarkdownText(TEXT), linker, "Raking Light Photography") == first
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    assert 'href="x_ray_holography.html"' in first
+
+
+@pytest.mark.parametrize("change", ["links", "base_url", "owner", "template"])
+def test_entries_are_invalidated_by_what_changes_the_output(change, monkeypatch):
+    cache = RenderCache()
+    first = cache.render(MarkdownText(TEXT), CrossLinker(URLS), "Stereo Photogrammetry")
+    linker, current = CrossLinker(URLS), "Stereo Photogrammetry"
+    if change == "links":
+        linker = CrossLinker(dict(URLS, **{"X-ray Holography": "holography.html"}))
+    elif change == "base_url":
+        linker = CrossLinker(URLS, "/docs")
+    elif change == "owner":
+        current = "X-ray Holography"
+    else:
+        monkeypatch.setattr(framework, "TEMPLATE_VERSION", "changed")
+    rendered = cache.render(MarkdownText(TEXT), linker, current)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert rendered != first or change == "template"
+    assert rendered == linker.link(MarkdownText(TEXT).to_html(), current)
+
+
+def test_least_recently_used_entries_are_evicted_and_the_rest_persist(tmp_path):
+    cache = RenderCache(max_entries=2, path=tmp_path / "cache.json")
+    linker = CrossLinker(URLS)
+    for text in ("first", "second", "first", "third"):
+        cache.render(MarkdownText(text), linker)
+    assert len(cache) == 2
+    cache.save()
+    reloaded = RenderCache(path=tmp_path / "cache.json")
+    reloaded.render(MarkdownText("first"), linker)
+    reloaded.render(MarkdownText("third"), linker)
+    reloaded.render(MarkdownText("second"), linker)
+    assert (reloaded.hits, reloaded.misses) == (2, 1)
@@ -0,0 +1,39 @@
+"""Tests for technique data validation."""
+
+import pytest
+
+from benchmarks.synthetic import make_catalog
+from framework import SiteGenerator, create_reference_page
+from schema import TechniqueValidationError
+
+
+@pytest.fixture
+def technique():
+    return next(iter(make_catalog(1).items()))
+
+
+def test_references_without_doi_are_accepted(technique):
+    name, data = technique
+    data = dict(data, references=[{"citation": "Unpublished notes", "doi": None}])
+    page = create_reference_page(name, data).to_html()
+    assert "Unpublished notes" in page and "doi.org" not in page
+
+
+def test_missing_and_misshaped_fields_are_reported_together(technique):
+    name, data = technique
+    data = dict(data, keywords="raman")
+    del data["abstract"]
+    with pytest.raises(TypeError) as error:
+        create_reference_page(name, data)
+    assert isinstance(error.value, TechniqueValidationError)
+    assert [(problem.path, problem.message) for problem in error.value.errors] == [
+        ("abstract", "missing"), ("keywords", "expected a list, got a string")]
+
+
+def test_batch_and_single_adds_hash_techniques_alike(technique, tmp_path):
+    name, data = technique
+    single = SiteGenerator(tmp_path / "single")
+    single.add_technique(name, data)
+    batch = SiteGenerator(tmp_path / "batch")
+    batch.add_techniques({name: data})
+    assert batch.techniques[name].content_hash() == single.techniques[name].content_hash()
@@ -0,0 +1,84 @@
+"""Tests for the sharded client-side search index."""
+
+import json
+
+import search_index
+from benchmarks.synthetic import make_catalog
+from framework import SiteGenerator, technique_filename
+from search_index import SearchIndexBuilder, field_weights
+
+
+def read_index(directory):
+    """Decode the index files in directory into ({term: {doc id: weight}}, docs, meta)."""
+    meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+    postings = {}
+    for start, name in meta["shards"]:
+        shard = json.loads((directory / name).read_text(encoding="utf-8"))
+        term = ""
+        for (shared, suffix), encoded in zip(shard["terms"], shard["postings"]):
+            term = term[:shared] + suffix
+            postings[term] = {}
+            doc_id = 0
+            for delta, weight in zip(encoded[::2], encoded[1::2]):
+                doc_id += delta
+                postings[term][doc_id] = weight
+        assert shard["terms"][0] == [0, start]
+    docs = []
+    for number in range(-(-meta["documents"] // meta["docs_per_shard"])):
+        docs.extend(json.loads((directory / f"docs-{number}.json").read_text(encoding="utf-8")))
+    return postings, docs, meta
+
+
+def test_shards_decode_to_the_weights_that_were_added(tmp_path, monkeypatch):
+    monkeypatch.setattr(search_index, "SHARD_TARGET_BYTES", 64)
+    monkeypatch.setattr(search_index, "DOCS_PER_SHARD", 2)
+    catalog = make_catalog(5)
+    builder = SearchIndexBuilder()
+    expected = {}
+    for doc_id, (name, data) in enumerate(catalog.items()):
+        fields = {"name": [name], "keywords": data["keywords"], "summary": [data["one_line_summary"]],
+                  "body": [data["abstract"]]}
+        assert builder.add(name, f"{technique_filename(name)}.html", data["one_line_summary"], fields) == doc_id
+        for term, weight in field_weights(fields).items():
+            expected.setdefault(term, {})[doc_id] = weight
+    builder.write(tmp_path)
+
+    postings, docs, meta = read_index(tmp_path)
+    assert postings == expected
+    assert len(meta["shards"]) > 1 and meta["documents"] == 5
+    assert [doc[1] for doc in docs] == [f"{technique_filename(name)}.html" for name in catalog]
+    assert all(len(summary) <= search_index.SUMMARY_LENGTH for _, _, summary in docs)
+    assert not set(meta["stopwords"]) & set(postings)
+
+
+def test_rewriting_a_smaller_index_removes_leftover_shards(tmp_path, monkeypatch):
+    monkeypatch.setattr(search_index, "SHARD_TARGET_BYTES", 64)
+    builder = SearchIndexBuilder()
+    for number in range(3):
+        builder.add(f"Doc {number}", f"doc{number}.html", "", {"body": [f"alpha beta gamma delta{number}"]})
+    first = builder.write(tmp_path)
+    assert builder.write(tmp_path) == {"written": [], "skipped": first["written"], "removed": []}
+
+    smaller = SearchIndexBuilder()
+    smaller.add("Doc", "doc.html", "", {"body": ["alpha"]})
+    result = smaller.write(tmp_path)
+    assert result["removed"] and sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        result["written"] + result["skipped"])
+    assert read_index(tmp_path)[0] == {"alpha": {0: 1}}
+
+
+def test_site_search_index_ranks_each_technique_by_its_name(tmp_path):
+    catalog = make_catalog(6)
+    site = SiteGenerator(tmp_path / "site")
+    for name, data in catalog.items():
+        site.add_technique(name, data)
+    site.generate_all_pages()
+
+    postings, docs, meta = read_index(tmp_path / "site" / "search")
+    assert meta["documents"] == len(catalog)
+    urls = [url for _, url, _ in docs]
+    for name in catalog:
+        doc_id = urls.index(site.technique_urls[name])
+        assert docs[doc_id][0] == name
+        for term in search_index.tokenize(name):
+            assert postings[term][doc_id] >= search_index.FIELD_BOOSTS["name"]
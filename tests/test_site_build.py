@@ -0,0 +1,136 @@
+"""Tests comparing site builds that must produce the same files."""
+
+import filecmp
+import json
+from functools import partial
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from benchmarks.synthetic import make_catalog
+from framework import BuildTarget, LazyTechniqueReference, SiteGenerator, technique_filename
+from site_map import check_links, load_site_manifest
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return make_catalog(12)
+
+
+def build_site(catalog, output_dir: Path, **options) -> SiteGenerator:
+    site = SiteGenerator(output_dir, **options)
+    for name, data in catalog.items():
+        site.add_technique(name, data)
+    return site
+
+
+def public_files(root: Path) -> List[str]:
+    """Return the site's files relative to root, leaving out build caches and manifests."""
+    return sorted(path.relative_to(root).as_posix() for path in root.rglob("*")
+                  if path.is_file() and not any(part.startswith(".") for part in path.relative_to(root).parts))
+
+
+def assert_same_files(first: Path, second: Path):
+    files = public_files(first)
+    assert files == public_files(second)
+    _, mismatch, errors = filecmp.cmpfiles(first, second, files, shallow=False)
+    assert mismatch == [] and errors == []
+
+
+def test_parallel_build_matches_serial_build(catalog, tmp_path):
+    build_site(catalog, tmp_path / "serial").generate_all_pages(workers=1)
+    build_site(catalog, tmp_path / "parallel").generate_all_pages(workers=2)
+    assert_same_files(tmp_path / "serial", tmp_path / "parallel")
+
+
+def test_rebased_target_matches_direct_build(catalog, tmp_path):
+    options = {"index_page_size": 4, "index_shard": lambda ref: ref.technique_name[0]}
+    build_site(catalog, tmp_path / "direct", **options).generate_all_pages()
+    build_site(catalog, tmp_path / "render", **options).generate_targets([BuildTarget(tmp_path / "rebased", "")])
+    nested = [name for name in public_files(tmp_path / "direct") if name.count("/") > 1 and name.endswith(".html")]
+    assert any(name.startswith("index/") for name in nested) and any(name.startswith("tags/") for name in nested)
+    assert_same_files(tmp_path / "direct", tmp_path / "rebased")
+
+
+def test_publish_swaps_a_link_and_failed_builds_leave_no_staging(catalog, tmp_path, monkeypatch):
+    output_dir = tmp_path / "site"
+    site = build_site(catalog, output_dir)
+    site.generate_all_pages()
+    first_release = output_dir.resolve()
+    site.generate_all_pages()
+    assert output_dir.is_symlink() and output_dir.resolve() != first_release
+    assert not first_release.exists()
+    assert (output_dir / "index.html").is_file()
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("build failed")
+
+    monkeypatch.setattr(site, "generate_index", fail)
+    with pytest.raises(RuntimeError):
+        site.generate_all_pages()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["site", output_dir.resolve().name]
+    assert (output_dir / "index.html").is_file()
+
+
+def test_site_manifest_records_the_links_pages_emit(catalog, tmp_path):
+    catalog = dict(catalog)
+    name = next(iter(catalog))
+    catalog[name] = dict(catalog[name], abstract=catalog[name]["abstract"] + " See [the notes](notes.html#setup).")
+    catalog["Photoacoustic Tomography / Optoacoustic Tomography"] = catalog.pop(list(catalog)[1])
+    output_dir = tmp_path / "site"
+    site = build_site(catalog, output_dir)
+    report = site.generate_all_pages()
+    assert "/" not in site.technique_urls["Photoacoustic Tomography / Optoacoustic Tomography"]
+    assert [(problem.kind, problem.target) for problem in report.link_problems] == [("missing-page", "notes.html#setup")]
+    assert check_links(load_site_manifest(output_dir)) == report.link_problems
+
+
+def test_incremental_builds_match_full_builds(catalog, tmp_path):
+    def build(catalog, step):
+        report = build_site(catalog, tmp_path / "site").generate_all_pages(incremental=True)
+        build_site(catalog, tmp_path / step).generate_all_pages()
+        assert_same_files(tmp_path / "site", tmp_path / step)
+        return report
+
+    names = list(catalog)
+    pages = {name: f"{technique_filename(name)}.html" for name in names}
+    build(catalog, "first")
+    report = build(catalog, "unchanged")
+    assert report.written == [] and report.removed == []
+    assert report.delta == {"added": [], "changed": [], "removed": []}
+
+    edited = dict(catalog, **{names[0]: dict(catalog[names[0]], one_line_summary="An edited summary.")})
+    report = build(edited, "edited")
+    assert pages[names[0]] in report.written
+    assert len([name for name in names if pages[name] in report.written]) < len(names) / 2
+
+    del edited[names[1]]
+    report = build(edited, "removed")
+    assert pages[names[1]] in report.removed and pages[names[1]] in report.delta["removed"]
+    report = build(catalog, "added")
+    assert pages[names[1]] in report.written and pages[names[1]] in report.delta["added"]
+
+
+def test_techniques_added_by_loader_build_the_same_site_as_data(catalog, tmp_path):
+    sources = tmp_path / "sources"
+    sources.mkdir()
+    loaders = {}
+    for number, (name, data) in enumerate(catalog.items()):
+        if number % 3 == 0:
+            loaders[name] = sources / f"technique_{number}.json"
+            loaders[name].write_text(json.dumps(data), encoding="utf-8")
+        elif number % 3 == 1:
+            path = sources / f"technique_{number}.py"
+            path.write_text(f"technique_{number}_data = {data!r}\n", encoding="utf-8")
+            loaders[name] = str(path)
+        else:
+            loaders[name] = partial(dict, data)
+
+    build_site(catalog, tmp_path / "eager").generate_all_pages()
+    lazy = build_site(loaders, tmp_path / "lazy")
+    assert all(isinstance(ref, LazyTechniqueReference) for ref in lazy.techniques.values())
+    lazy.generate_all_pages(workers=2)
+    assert_same_files(tmp_path / "eager", tmp_path / "lazy")
+    assert lazy.write_book(tmp_path / "lazy.html").read_bytes() == build_site(
+        catalog, tmp_path / "unused").write_book(tmp_path / "eager.html").read_bytes()
@@ -0,0 +1,22 @@
+"""Tests that pages streamed in chunks match the pages rendered in one piece."""
+
+from build_profile import PageProfile
+from framework import RenderCache, create_reference_page, technique_filename
+
+
+def test_streamed_pages_match_buffered_pages(real_catalog, tmp_path):
+    urls = {name: f"{technique_filename(name)}.html" for name in real_catalog}
+    cache = RenderCache()
+    for name, data in real_catalog.items():
+        ref = create_reference_page(name, data)
+        related = [(other, urls[other]) for other in list(urls)[:3] if other != name]
+        page = ref.to_html(urls, base_url="/docs", related=related, referenced_by=related[:1])
+        assert "".join(ref.iter_html(urls, "/docs", related=related, referenced_by=related[:1])) == page
+
+        path = tmp_path / urls[name]
+        ref.save_html(path, urls, "/docs", related=related, referenced_by=related[:1])
+        assert path.read_bytes() == page.encode("utf-8")
+        path.unlink()
+        ref.save_html(path, urls, "/docs", cache=cache, profile=PageProfile(name), related=related,
+                      referenced_by=related[:1])
+        assert path.read_bytes() == page.encode("utf-8")
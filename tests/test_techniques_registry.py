@@ -0,0 +1,45 @@
+"""Tests for the lazy technique registry in techniques/__init__.py."""
+
+import importlib
+import subprocess
+import sys
+
+from convert_json_to_python import INIT_FILE, init_file_content
+from framework import load_technique_module
+import techniques
+
+
+def test_generated_init_file_matches_the_checked_in_module():
+    converted = list(techniques.TECHNIQUE_MODULES.items())
+    assert init_file_content(converted) == INIT_FILE.read_text(encoding="utf-8")
+
+
+def test_generated_init_file_indexes_the_converted_modules():
+    content = init_file_content([('Name "quoted"', "name_quoted"), ("Other", "other")])
+    namespace = {"__name__": "techniques"}
+    exec(compile(content, "__init__.py", "exec"), namespace)
+    assert namespace["TECHNIQUE_MODULES"] == {'Name "quoted"': "name_quoted", "Other": "other"}
+    assert namespace["list_techniques"]() == ['Name "quoted"', "Other"]
+
+
+def test_importing_the_package_imports_no_technique_module():
+    name = list(techniques.TECHNIQUE_MODULES)[3]
+    script = f"""
+import sys
+import techniques
+loaded = lambda: sorted(module for module in sys.modules if module.startswith("techniques."))
+assert loaded() == [], loaded()
+assert len(techniques.TECHNIQUES) == len(techniques.list_techniques()) == {len(techniques.TECHNIQUE_MODULES)}
+techniques.TECHNIQUES[{name!r}]
+assert loaded() == ["techniques.{techniques.TECHNIQUE_MODULES[name]}"], loaded()
+"""
+    subprocess.run([sys.executable, "-c", script], cwd=INIT_FILE.parent.parent, check=True)
+
+
+def test_lazy_registry_returns_the_data_the_modules_define():
+    for name, module_name in techniques.TECHNIQUE_MODULES.items():
+        data = getattr(importlib.import_module(f"techniques.{module_name}"), f"{module_name}_data")
+        assert techniques.TECHNIQUES[name] is data
+        assert getattr(techniques, f"{module_name}_data") is data
+        assert load_technique_module(*techniques.technique_source(name).split(":")) is data
+    assert techniques.get_technique_data("No such technique") is None
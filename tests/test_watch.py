@@ -0,0 +1,106 @@
+"""Tests for watch mode: incremental rebuilds of changed technique modules and the preview server."""
+
+import json
+import os
+import sys
+import urllib.request
+
+import pytest
+
+import techniques
+import watch
+from benchmarks.synthetic import make_catalog
+from framework import technique_filename
+
+
+def write_module(path, data):
+    path.write_text(f"{path.stem}_data = {data!r}\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def modules(tmp_path, monkeypatch):
+    """Technique modules written to a temporary directory and registered in the techniques package."""
+    directory = tmp_path / "techniques"
+    directory.mkdir()
+    catalog = make_catalog(4)
+    registry = {}
+    for number, (name, data) in enumerate(catalog.items()):
+        module_name = f"watch_test_{number}"
+        write_module(directory / f"{module_name}.py", data)
+        registry[name] = module_name
+    broken = "watch_test_broken"
+    (directory / f"{broken}.py").write_text(f"{broken}_data = {{'abstract': 'No other fields.'}}\n", encoding="utf-8")
+    registry["Broken Technique"] = broken
+
+    monkeypatch.setattr(watch, "TECHNIQUES_DIR", directory)
+    monkeypatch.setattr(techniques, "TECHNIQUE_MODULES", registry)
+    monkeypatch.setattr(techniques, "__path__", [str(directory)] + list(techniques.__path__))
+    yield directory, catalog
+    for module_name in registry.values():
+        sys.modules.pop(f"techniques.{module_name}", None)
+
+
+def test_changed_module_rebuilds_only_its_pages(modules, tmp_path, capsys):
+    directory, catalog = modules
+    watcher = watch.Watcher(tmp_path / "site")
+    assert "Broken Technique" in capsys.readouterr().out
+    assert sorted(watcher.site.techniques) == sorted(catalog)
+    assert watcher.build() is not None
+    assert watcher.build() is not None
+    assert "0 page(s) written" in capsys.readouterr().out
+
+    name = list(catalog)[1]
+    path = directory / "watch_test_1.py"
+    write_module(path, dict(catalog[name], abstract="A freshly edited abstract."))
+    assert watcher.reload_module(path.resolve())
+    assert watcher.build() is not None
+    page = tmp_path / "site" / f"{technique_filename(name)}.html"
+    assert "A freshly edited abstract." in page.read_text(encoding="utf-8")
+    written = capsys.readouterr().out
+    assert f"{technique_filename(name)}.html" in written
+    assert not any(f"{technique_filename(other)}.html" in written for other in catalog if other != name)
+
+
+def test_broken_edits_are_reported_and_fixed_modules_come_back(modules, tmp_path, capsys):
+    directory, catalog = modules
+    watcher = watch.Watcher(tmp_path / "site")
+    name = list(catalog)[0]
+    path = directory / "watch_test_0.py"
+    path.write_text("watch_test_0_data = {\n", encoding="utf-8")
+    assert not watcher.reload_module(path.resolve())
+    assert "SyntaxError" in capsys.readouterr().err
+    assert name in watcher.site.techniques
+
+    write_module(path, dict(catalog[name], keywords="not a list"))
+    assert watcher.reload_module(path.resolve())
+    assert name not in watcher.site.techniques and name not in watcher.site.technique_urls
+    write_module(path, catalog[name])
+    assert watcher.reload_module(path.resolve())
+    assert name in watcher.site.techniques
+    assert not watcher.reload_module((directory / "unregistered.py").resolve())
+
+
+def test_preview_server_injects_live_reload_into_html_only(tmp_path):
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "index.html").write_text("<html><body><p>Page</p></body></html>", encoding="utf-8")
+    (tmp_path / "data.json").write_text("{}", encoding="utf-8")
+    state = {"build": 1.5}
+    server = watch.serve(tmp_path, 0, state)
+    root = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(root + "/docs/") as response:
+            page = response.read().decode("utf-8")
+            assert response.headers["Cache-Control"] == "no-store"
+        assert page.startswith("<html><body><p>Page</p><script>") and page.endswith("</script>\n</body></html>")
+        assert watch.RELOAD_PATH in page
+        with urllib.request.urlopen(root + "/data.json") as response:
+            assert response.read() == b"{}"
+        state["build"] = 2.5
+        with urllib.request.urlopen(root + watch.RELOAD_PATH) as response:
+            assert json.loads(response.read()) == {"build": 2.5}
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert (tmp_path / "docs" / "index.html").read_text(encoding="utf-8") == "<html><body><p>Page</p></body></html>"
@@ -0,0 +1,235 @@
+"""
+Watch mode: rebuild the site as technique modules change and preview it with live reload.
+
+Techniques are loaded once and kept in memory, together with their parsed
+documents and the render cache. When a module in techniques/ changes, only
+that module is re-imported and its techniques replaced, and an incremental
+build re-renders just the affected pages, the index and the listings that
+depend on them. Changes to framework.py (or the other site modules) change
+the templates, so the watcher restarts itself and rebuilds with the new
+code.
+
+Files are polled for changes, so watching works the same on every platform
+without extra dependencies. The preview server serves the output directory
+and injects a small script into HTML responses that reloads the page after
+each rebuild; the files on disk are left as built.
+
+Usage:
+    python watch.py [--output site] [--port 8000] [--interval 0.3] [--no-serve]
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT))
+
+from framework import RenderCache, SiteGenerator  # noqa: E402
+
+TECHNIQUES_DIR = ROOT / "techniques"
+# Site code: a change here means every page may render differently
+CODE_FILES = ["framework.py", "markdown_parser.py", "keyword_index.py", "search_index.py", "related.py",
+              "static_assets.py", "site_output.py", "site_map.py", "highlight.py", "schema.py",
+              "build_profile.py", "techniques/__init__.py"]
+RELOAD_PATH = "/__livereload"
+RELOAD_SCRIPT = """<script>
+(function () {
+    var build = null;
+    function poll() {
+        fetch("%s").then(function (response) { return response.json(); }).then(function (state) {
+            if (build !== null && state.build !== build) {
+                location.reload();
+                return;
+            }
+            build = state.build;
+            setTimeout(poll, 500);
+        }).catch(function () { setTimeout(poll, 1000); });
+    }
+    poll();
+})();
+</script>
+""" % RELOAD_PATH
+
+
+def technique_modules() -> Dict[Path, List[Tuple[str, str]]]:
+    """Map each technique module file to the (technique name, data attribute) pairs it registers in TECHNIQUES."""
+    import techniques
+    modules: Dict[Path, List[Tuple[str, str]]] = {}
+    for technique_name, module_name in techniques.TECHNIQUE_MODULES.items():
+        path = (TECHNIQUES_DIR / f"{module_name}.py").resolve()
+        modules.setdefault(path, []).append((technique_name, f"{module_name}_data"))
+    return modules
+
+
+def snapshot(paths: List[Path]) -> Dict[Path, int]:
+    """Return the modification time of each existing path."""
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = path.stat().st_mtime_ns
+        except OSError:
+            pass
+    return mtimes
+
+
+class PreviewHandler(SimpleHTTPRequestHandler):
+    """Serve the site directory, adding the live reload script to HTML pages."""
+    
+    def __init__(self, *args, state: Dict, **kwargs):
+        self.state = state
+        super().__init__(*args, **kwargs)
+    
+    def do_GET(self):
+        if self.path == RELOAD_PATH:
+            self._send(json.dumps({"build": self.state["build"]}).encode("utf-8"), "application/json")
+            return
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            path = path / "index.html"
+        if path.suffix == ".html" and path.is_file():
+            page = path.read_bytes()
+            end = page.rfind(b"</body>")
+            if end != -1:
+                page = page[:end] + RELOAD_SCRIPT.encode("utf-8") + page[end:]
+            self._send(page, "text/html; charset=utf-8")
+            return
+        super().do_GET()
+    
+    def _send(self, body: bytes, content_type: str):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(output_dir: Path, port: int, state: Dict) -> ThreadingHTTPServer:
+    """Start the preview server on a background thread."""
+    handler = partial(PreviewHandler, directory=str(output_dir), state=state)
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class Watcher:
+    """Keep a site loaded in memory and rebuild it incrementally as technique modules change."""
+    
+    def __init__(self, output_dir: Path):
+        import techniques
+        # Preview builds write in place and skip precompression to keep rebuilds fast
+        self.site = SiteGenerator(output_dir=output_dir, render_cache=RenderCache(), staging=False,
+                                  precompress=False)
+        # Technique modules are imported one by one, so a broken module only leaves out its techniques
+        for technique_name in techniques.TECHNIQUES:
+            try:
+                data = techniques.TECHNIQUES[technique_name]
+            except Exception:
+                traceback.print_exc()
+                continue
+            self.add(technique_name, data)
+        self.modules = technique_modules()
+    
+    def add(self, technique_name: str, data: Dict) -> bool:
+        """Add or replace a technique; invalid data is reported and the technique left out of the build."""
+        try:
+            self.site.add_technique(technique_name, data)
+        except (TypeError, ValueError) as error:
+            print(f"{technique_name}: {error}")
+            self.site.techniques.pop(technique_name, None)
+            self.site.technique_urls.pop(technique_name, None)
+            return False
+        return True
+    
+    def build(self) -> Optional[float]:
+        """Run an incremental build; returns its duration, or None if it failed."""
+        start = time.perf_counter()
+        try:
+            report = self.site.generate_all_pages(incremental=True)
+        except Exception:
+            traceback.print_exc()
+            return None
+        seconds = time.perf_counter() - start
+        pages = [name for name in report.written if name.endswith(".html")]
+        print(f"built in {seconds:.2f}s: {len(pages)} page(s) written" + (f" ({', '.join(pages[:5])}"
+              + (", ..." if len(pages) > 5 else "") + ")" if pages else ""))
+        return seconds
+    
+    def reload_module(self, path: Path) -> bool:
+        """Re-import one technique module and replace its techniques; returns whether it loaded."""
+        registered = self.modules.get(path)
+        if registered is None:
+            print(f"{path.name} is not registered in techniques/__init__.py; skipped")
+            return False
+        module_name = f"techniques.{path.stem}"
+        try:
+            # A module that failed to import at startup is not in sys.modules yet
+            module = (importlib.reload(sys.modules[module_name]) if module_name in sys.modules
+                      else importlib.import_module(module_name))
+        except Exception:
+            traceback.print_exc()
+            return False
+        for technique_name, attribute in registered:
+            self.add(technique_name, getattr(module, attribute))
+        return True
+
+
+def restart():
+    """Re-execute this script so changed site code is imported from scratch."""
+    print("site code changed; restarting")
+    sys.stdout.flush()
+    os.execv(sys.executable, [sys.executable] + sys.argv)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", type=Path, default=Path("site"), help="site output directory")
+    parser.add_argument("--port", type=int, default=8000, help="preview server port")
+    parser.add_argument("--interval", type=float, default=0.3, help="seconds between checks for changes")
+    parser.add_argument("--no-serve", action="store_true", help="rebuild on changes without serving the site")
+    args = parser.parse_args()
+
+    watcher = Watcher(args.output)
+    state = {"build": time.time()}
+    watcher.build()
+    if not args.no_serve:
+        serve(args.output, args.port, state)
+        print(f"serving {args.output} at http://127.0.0.1:{args.port}/ (Ctrl+C to stop)")
+
+    code_files = [ROOT / name for name in CODE_FILES]
+    code_mtimes = snapshot(code_files)
+    technique_files = sorted(TECHNIQUES_DIR.glob("*.py"))
+    technique_mtimes = snapshot(technique_files)
+    try:
+        while True:
+            time.sleep(args.interval)
+            if snapshot(code_files) != code_mtimes:
+                restart()
+            current = snapshot(sorted(TECHNIQUES_DIR.glob("*.py")))
+            changed = [path for path, mtime in current.items() if technique_mtimes.get(path) != mtime]
+            technique_mtimes = current
+            if not changed:
+                continue
+            print("changed: " + ", ".join(path.name for path in changed))
+            reloaded = [path for path in changed if path.name != "__init__.py" and watcher.reload_module(path.resolve())]
+            if reloaded and watcher.build() is not None:
+                state["build"] = time.time()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()